@@ -16,6 +16,20 @@ class CertificateGeneratorService
     private string $certificateDir;
     private string $outputDir;
 
+    /**
+     * Pre-encoded data URIs keyed by asset file name (certificate_new/assets.bundle.php),
+     * shared by every certificate generated in this process until the bundle file changes
+     */
+    private static ?array $assetBundle = null;
+    private static ?int $assetBundleMtime = null;
+
+    /**
+     * Resolved certificate template path, shared by every certificate generated in this process
+     * until the precompiled-template manifest changes or the template is removed
+     */
+    private static ?string $templatePath = null;
+    private static ?int $templateManifestMtime = null;
+
     public function __construct()
     {
         $this->basePath = base_path();
@@ -100,8 +114,8 @@ private function createCertificateHtml(
         // Generate certificate number
         $certNumber = sprintf("AZ-%d-%06d", Carbon::now()->year, $userData['id']);
         
-        // Read template
-        $templatePath = $this->certificateDir . DIRECTORY_SEPARATOR . 'cer.html';
+        // Read template (precompiled, minified version when available)
+        $templatePath = $this->resolveTemplatePath();
         if (!file_exists($templatePath)) {
             throw new \Exception("Certificate template not found at: {$templatePath}");
         }
@@ -287,10 +301,13 @@ private function createCertificateHtml(
         // Save back to HTML
         $htmlContent = $dom->saveHTML();
         
-        // Convert all relative image paths to absolute file:// URLs
+        // Convert all relative image paths to pre-encoded data URIs from the asset bundle,
+        // falling back to absolute file:// URLs for assets that are not bundled
         // Find all img src attributes with relative paths
         preg_match_all('/src="([^"]+)"/', $htmlContent, $matches);
         $uniquePaths = array_unique($matches[1]);
+        $assetBundle = $this->loadAssetBundle();
+        $replacements = [];
         
         foreach ($uniquePaths as $imagePath) {
             // Skip if already absolute, data URI, or external URL
@@ -300,16 +317,26 @@ private function createCertificateHtml(
             
             // Remove leading slash if present
             $cleanImagePath = ltrim($imagePath, '/');
+            
+            if (isset($assetBundle[$cleanImagePath])) {
+                $replacements['src="' . $imagePath . '"'] = 'src="' . $assetBundle[$cleanImagePath] . '"';
+                continue;
+            }
+            
             $absoluteImagePath = $this->certificateDir . DIRECTORY_SEPARATOR . $cleanImagePath;
             
             if (file_exists($absoluteImagePath)) {
                 $imageFileUrl = $this->convertToFileUrl($absoluteImagePath);
-                // Replace all occurrences of this path
-                $htmlContent = str_replace('src="' . $imagePath . '"', 'src="' . $imageFileUrl . '"', $htmlContent);
+                $replacements['src="' . $imagePath . '"'] = 'src="' . $imageFileUrl . '"';
                 Log::debug("Converted image path: {$imagePath} to file URL");
             }
         }
         
+        // Replace all occurrences of all paths in a single pass
+        if (!empty($replacements)) {
+            $htmlContent = strtr($htmlContent, $replacements);
+        }
+        
         // Convert external image URLs to base64 for better reliability in headless Chrome
         // Find all external image URLs in HTML and convert them
         preg_match_all('/src="(https?:\/\/[^"]+)"/', $htmlContent, $externalUrls);
@@ -322,6 +349,97 @@ private function createCertificateHtml(
         return $htmlContent;
     }
 
+    /**
+     * Resolve the certificate template path
+     * Prefers the precompiled template from certificate_new/precompile_template.py
+     * (pruned, minified CSS/HTML), then the flattened-background template from
+     * certificate_new/flatten_background.py, and falls back to cer.html.
+     * Cached per process; a redeploy (new manifest, old template removed) is picked up
+     * by long-running workers without a restart
+     */
+    private function resolveTemplatePath(): string
+    {
+        $manifestMtime = self::fileMtime($this->certificateDir . DIRECTORY_SEPARATOR . 'cer.precompiled.json');
+        
+        if (self::$templatePath !== null
+            && self::$templateManifestMtime === $manifestMtime
+            && self::fileMtime(self::$templatePath) !== null) {
+            return self::$templatePath;
+        }
+        
+        self::$templatePath = $this->findTemplatePath();
+        self::$templateManifestMtime = $manifestMtime;
+        
+        return self::$templatePath;
+    }
+
+    /**
+     * Look up the template on disk (reads the precompiled-template manifest)
+     */
+    private function findTemplatePath(): string
+    {
+        $manifestPath = $this->certificateDir . DIRECTORY_SEPARATOR . 'cer.precompiled.json';
+        
+        if (file_exists($manifestPath)) {
+            $manifest = json_decode(file_get_contents($manifestPath), true);
+            $precompiledPath = $this->certificateDir . DIRECTORY_SEPARATOR . ($manifest['template'] ?? '');
+            
+            if (!empty($manifest['template']) && file_exists($precompiledPath)) {
+                return $precompiledPath;
+            }
+            
+            Log::warning('Precompiled certificate template listed in manifest not found', ['manifest' => $manifestPath]);
+        }
+        
+        $flatPath = $this->certificateDir . DIRECTORY_SEPARATOR . 'cer.flat.html';
+        if (file_exists($flatPath)) {
+            return $flatPath;
+        }
+        
+        return $this->certificateDir . DIRECTORY_SEPARATOR . 'cer.html';
+    }
+
+    /**
+     * Load the pre-encoded asset bundle built by certificate_new/build_asset_bundle.py
+     * Returns an empty array when the bundle has not been built; reloaded when the file changes
+     */
+    private function loadAssetBundle(): array
+    {
+        $bundlePath = $this->certificateDir . DIRECTORY_SEPARATOR . 'assets.bundle.php';
+        $mtime = self::fileMtime($bundlePath);
+        
+        if (self::$assetBundle === null || self::$assetBundleMtime !== $mtime) {
+            self::$assetBundle = [];
+            self::$assetBundleMtime = $mtime;
+            
+            if ($mtime !== null) {
+                // OPcache may hold the previous bundle when timestamp validation is off
+                if (function_exists('opcache_invalidate')) {
+                    opcache_invalidate($bundlePath, true);
+                }
+                $bundle = require $bundlePath;
+                self::$assetBundle = $bundle['assets'] ?? [];
+                Log::debug('Loaded certificate asset bundle', [
+                    'version' => $bundle['version'] ?? null,
+                    'assets' => count(self::$assetBundle),
+                ]);
+            }
+        }
+        
+        return self::$assetBundle;
+    }
+
+    /**
+     * Modification time of a file, bypassing PHP's stat cache; null when it does not exist
+     */
+    private static function fileMtime(string $path): ?int
+    {
+        clearstatcache(true, $path);
+        $mtime = @filemtime($path);
+        
+        return $mtime === false ? null : $mtime;
+    }
+
     /**
      * Convert file path to file:// URL for Chrome
      */
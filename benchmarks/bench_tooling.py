@@ -0,0 +1,230 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for the Python tooling:
+  * certificate_new/remove_white_background.py - keying time per megapixel
+    on synthetic images of several sizes and white-coverage ratios
+  * update_postman_collection.py - load/dump time and full generator runs
+    (with a cold and a warm .collection_cache) on synthetic collections of
+    200 to 20,000 requests
+
+Results are written as JSON and compared against a stored baseline; the
+run fails (exit code 1) when any benchmark is slower than the baseline by
+more than --max-slowdown.
+
+Usage:
+    python benchmarks/bench_tooling.py                   # run + compare with baseline.json
+    python benchmarks/bench_tooling.py --save-baseline   # run + store as the new baseline
+    python benchmarks/bench_tooling.py --quick           # smaller inputs, for a smoke run
+"""
+
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.dirname(HERE)
+sys.path.insert(0, os.path.join(REPO_ROOT, "certificate_new"))
+sys.path.insert(0, REPO_ROOT)
+
+from PIL import Image  # noqa: E402
+
+import remove_white_background  # noqa: E402
+from postman_tools.builder import DEFAULT_CACHE_DIR  # noqa: E402
+
+DEFAULT_BASELINE = os.path.join(HERE, "baseline.json")
+DEFAULT_RESULTS = os.path.join(HERE, "results.json")
+
+IMAGE_MEGAPIXELS = [0.25, 1, 4, 16]
+WHITE_COVERAGE = [0.1, 0.5, 0.9]
+COLLECTION_SIZES = [200, 2000, 20000]
+
+# Section names the generator copies from the source collection
+SOURCE_SECTIONS = [
+    "Authentication", "Training Management", "Training Lesson Management",
+    "Lesson Progress Tracking", "Exam Management (Admin Dashboard)", "Certificates",
+    "Forum", "User Management", "Profile Management", "Registration Management",
+]
+
+
+def best_of(repeat, func, *args, setup=None):
+    """Run func `repeat` times and return the fastest wall time in seconds (setup runs untimed before each)."""
+    timings = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        started = time.perf_counter()
+        func(*args)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def synthetic_image(megapixels, white_ratio, seed=0):
+    """RGB image (4:3) with `white_ratio` of its area white, the rest noisy artwork."""
+    width = int((megapixels * 1_000_000 * 4 / 3) ** 0.5)
+    height = int(width * 3 / 4)
+    img = Image.new("RGB", (width, height), (255, 255, 255))
+    art_height = round(height * (1 - white_ratio))
+    if art_height:
+        rng = random.Random(seed)
+        bands = [Image.effect_noise((width, art_height), rng.randint(20, 80)) for _ in range(3)]
+        img.paste(Image.merge("RGB", bands), (0, height - art_height))
+    return img
+
+
+def bench_keying(results, repeat, megapixel_sizes):
+    for megapixels in megapixel_sizes:
+        for white_ratio in WHITE_COVERAGE:
+            img = synthetic_image(megapixels, white_ratio)
+            actual_mp = img.width * img.height / 1_000_000
+            name = f"keying/{megapixels}mp/white{int(white_ratio * 100)}"
+            seconds = best_of(repeat, remove_white_background.key_image, img, 240)
+            results[name] = seconds / actual_mp
+            tiled = best_of(repeat, remove_white_background.key_image_tiled, img, 240)
+            results[name + "/tiled"] = tiled / actual_mp
+            print(f"  {name:<28} {results[name] * 1000:8.2f} ms/MP   tiled {results[name + '/tiled'] * 1000:8.2f} ms/MP")
+
+
+def synthetic_collection(request_count, seed=0):
+    """Postman v2.1 collection with `request_count` requests spread over SOURCE_SECTIONS."""
+    rng = random.Random(seed)
+    sections = [{"name": name, "item": []} for name in SOURCE_SECTIONS]
+    methods = ["GET", "POST", "PUT", "DELETE"]
+    for index in range(request_count):
+        method = rng.choice(methods)
+        path = ["api", "v1", f"resource{index % 97}", str(index)]
+        request = {
+            "name": f"Request {index}",
+            "request": {
+                "method": method,
+                "header": [{"key": "Authorization", "value": "Bearer {{auth_token}}"}],
+                "url": {
+                    "raw": "{{base_url}}/" + "/".join(path),
+                    "host": ["{{base_url}}"],
+                    "path": path,
+                },
+            },
+        }
+        if method in ("POST", "PUT"):
+            request["request"]["body"] = {
+                "mode": "raw",
+                "raw": json.dumps({"title": f"Item {index}", "description": "x" * rng.randint(10, 200)}, indent=2),
+            }
+        sections[index % len(sections)]["item"].append(request)
+    return {
+        "info": {"name": "Synthetic", "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json"},
+        "item": sections,
+        "variable": [{"key": "base_url", "value": "http://localhost:8000"}],
+    }
+
+
+def bench_collections(results, repeat, sizes):
+    script = os.path.join(REPO_ROOT, "update_postman_collection.py")
+    workdir = tempfile.mkdtemp(prefix="bench_collection_")
+    cache_dir = os.path.join(workdir, DEFAULT_CACHE_DIR)
+    try:
+        for size in sizes:
+            collection = synthetic_collection(size)
+            source = os.path.join(workdir, "Agrar_Portal_API.postman_collection.json")
+            with open(source, "w", encoding="utf-8") as f:
+                json.dump(collection, f, indent=2, ensure_ascii=False)
+            with open(source, encoding="utf-8") as f:
+                text = f.read()
+
+            results[f"collection/{size}/load"] = best_of(repeat, json.loads, text)
+            results[f"collection/{size}/dump"] = best_of(
+                repeat, lambda: json.dumps(collection, indent=2, ensure_ascii=False)
+            )
+
+            def generate():
+                subprocess.run([sys.executable, script], cwd=workdir, check=True, stdout=subprocess.DEVNULL)
+
+            # Cold: every run starts without .collection_cache; warm: the last cold run left it filled
+            results[f"collection/{size}/generator"] = best_of(
+                repeat, generate, setup=lambda: shutil.rmtree(cache_dir, ignore_errors=True)
+            )
+            results[f"collection/{size}/generator_warm"] = best_of(repeat, generate)
+            print(f"  collection/{size:<6} load {results[f'collection/{size}/load'] * 1000:8.1f} ms"
+                  f"   dump {results[f'collection/{size}/dump'] * 1000:8.1f} ms"
+                  f"   generator cold {results[f'collection/{size}/generator'] * 1000:8.1f} ms"
+                  f"   warm {results[f'collection/{size}/generator_warm'] * 1000:8.1f} ms")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
+
+
+def compare(results, baseline, max_slowdown):
+    """Return [(name, baseline, current, ratio)] for benchmarks slower than allowed."""
+    regressions = []
+    for name, current in sorted(results.items()):
+        previous = baseline.get(name)
+        if not previous:
+            continue
+        ratio = current / previous
+        if ratio > 1 + max_slowdown:
+            regressions.append((name, previous, current, ratio))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Python tooling and check for regressions.")
+    parser.add_argument("--output", default=DEFAULT_RESULTS, help="where to write results JSON")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE, help="baseline JSON to compare against")
+    parser.add_argument("--save-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--max-slowdown", type=float, default=0.25,
+                        help="allowed slowdown vs baseline before failing (default: 0.25 = 25%%)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per benchmark, best is kept (default: 3)")
+    parser.add_argument("--quick", action="store_true", help="only the smallest inputs")
+    parser.add_argument("--only", choices=("keying", "collection"), help="run one group only")
+    args = parser.parse_args(argv)
+
+    results = {}
+    if args.only in (None, "keying"):
+        print("Keying (remove_white_background):")
+        bench_keying(results, args.repeat, IMAGE_MEGAPIXELS[:2] if args.quick else IMAGE_MEGAPIXELS)
+    if args.only in (None, "collection"):
+        print("Postman collection (update_postman_collection.py):")
+        bench_collections(results, args.repeat, COLLECTION_SIZES[:1] if args.quick else COLLECTION_SIZES)
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --save-baseline to create one")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["results"]
+    regressions = compare(results, baseline, args.max_slowdown)
+    if not regressions:
+        print(f"✓ No regressions beyond {args.max_slowdown:.0%} of baseline")
+        return 0
+    print(f"✗ {len(regressions)} benchmark(s) slower than baseline by more than {args.max_slowdown:.0%}:")
+    for name, previous, current, ratio in regressions:
+        print(f"  {name:<36} {previous * 1000:10.2f} -> {current * 1000:10.2f} ms  ({ratio:.2f}x)")
+    return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,162 @@
+"""
+Sertifikat şəkillərini bir dəfə optimallaşdırıb data URI paketinə yığır.
+
+CertificateGeneratorService hər sertifikat üçün şəkilləri yenidən oxuyub
+base64-ə çevirmək əvəzinə bu paketi (assets.bundle.php) birbaşa yükləyir.
+Pakete yalnız şablonun istinad etdiyi şəkillər (src="..." və CSS url(...))
+düşür: flatten_background.py-dən sonra cer.flat.html yalnız fonu və QR
+yerini göstərir, qovluqdakı digər qatları paketə qoymağa ehtiyac yoxdur.
+
+İstifadə:
+    python build_asset_bundle.py                 # assets.bundle.php
+    python build_asset_bundle.py --format json   # assets.bundle.json
+    python build_asset_bundle.py --template cer.html
+"""
+
+import argparse
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+import time
+
+from PIL import Image
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+MIME_TYPES = {"PNG": "image/png", "JPEG": "image/jpeg"}
+REFERENCE_PATTERN = re.compile(r'''src="([^"]+)"|url\(\s*['"]?([^'")]+?)['"]?\s*\)''')
+
+
+def default_template(source_dir=HERE):
+    """CertificateGeneratorService kimi: cer.flat.html varsa o, yoxdursa cer.html."""
+    flat = os.path.join(source_dir, "cer.flat.html")
+    return flat if os.path.exists(flat) else os.path.join(source_dir, "cer.html")
+
+
+def referenced_images(template_path):
+    """Şablonun src="..." və url(...) ilə istinad etdiyi yerli şəkil adları (sıra ilə, təkrarsız)."""
+    with open(template_path, encoding="utf-8") as f:
+        text = f.read()
+    names = {}
+    for match in REFERENCE_PATTERN.finditer(text):
+        reference = match.group(1) or match.group(2)
+        if reference.startswith(("http", "data:", "file://")):
+            continue
+        name = reference.lstrip("/")
+        if name.lower().endswith(IMAGE_EXTENSIONS):
+            names[name] = None
+    return list(names)
+
+
+def optimize_image(path, max_width=None):
+    """
+    Şəkli yenidən kodlaşdırır (PNG üçün optimize=True) və (format, bayt) qaytarır.
+    max_width verilibsə, ondan enli şəkillər proporsional kiçildilir.
+    Optimallaşdırılmış versiya böyük alınarsa, orijinal bayt saxlanılır.
+    """
+    with open(path, "rb") as f:
+        original = f.read()
+    img = Image.open(io.BytesIO(original))
+    fmt = img.format if img.format in MIME_TYPES else "PNG"
+    resized = False
+    if max_width and img.width > max_width:
+        height = round(img.height * max_width / img.width)
+        img = img.resize((max_width, height), Image.LANCZOS)
+        resized = True
+
+    buffer = io.BytesIO()
+    if fmt == "JPEG":
+        img.save(buffer, "JPEG", quality=90, optimize=True, progressive=True)
+    else:
+        img.save(buffer, "PNG", optimize=True)
+    data = buffer.getvalue()
+    if not resized and len(data) >= len(original):
+        data = original
+    return fmt, data
+
+
+def build_bundle(source_dir=HERE, max_width=None, names=None):
+    """
+    source_dir-dəki şəkillərdən {"version", "assets": {ad: data_uri}} qaytarır.
+    names verilibsə, yalnız həmin şəkillər (məs. referenced_images()) yığılır;
+    tapılmayanlar üçüncü nəticədə qaytarılır.
+    """
+    if names is None:
+        names = [name for name in os.listdir(source_dir) if name.lower().endswith(IMAGE_EXTENSIONS)]
+    assets = {}
+    stats = []
+    missing = []
+    for name in sorted(names):
+        path = os.path.join(source_dir, name)
+        if not os.path.isfile(path):
+            missing.append(name)
+            continue
+        fmt, data = optimize_image(path, max_width)
+        assets[name] = f"data:{MIME_TYPES[fmt]};base64,{base64.b64encode(data).decode('ascii')}"
+        stats.append((name, os.path.getsize(path), len(data)))
+
+    digest = hashlib.sha256()
+    for name, uri in assets.items():
+        digest.update(name.encode())
+        digest.update(uri.encode())
+    return {"version": digest.hexdigest()[:16], "assets": assets}, stats, missing
+
+
+def _php_string(value):
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def render_php(bundle):
+    """Paketi `return [...]` qaytaran PHP faylı kimi yazır (opcache onu yaddaşda saxlayır)."""
+    lines = [
+        "<?php",
+        "",
+        "// Avtomatik yaradılıb: certificate_new/build_asset_bundle.py - əl ilə dəyişməyin.",
+        "return [",
+        f"    'version' => {_php_string(bundle['version'])},",
+        "    'assets' => [",
+    ]
+    for name, uri in bundle["assets"].items():
+        lines.append(f"        {_php_string(name)} => {_php_string(uri)},")
+    lines += ["    ],", "];", ""]
+    return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sertifikat şəkillərindən data URI paketi yaradır.")
+    parser.add_argument("--source-dir", default=HERE, help="şəkillərin qovluğu (default: certificate_new)")
+    parser.add_argument("--template",
+                        help="istinad etdiyi şəkillər paketə düşən şablon "
+                             "(default: <source-dir>/cer.flat.html, yoxdursa cer.html)")
+    parser.add_argument("--format", choices=("php", "json"), default="php")
+    parser.add_argument("-o", "--output", help="çıxış faylı (default: <source-dir>/assets.bundle.<format>)")
+    parser.add_argument("--max-width", type=int, default=None,
+                        help="bu enlikdən böyük şəkilləri kiçilt, piksel (default: kiçiltmə)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    template = args.template or default_template(args.source_dir)
+    bundle, stats, missing = build_bundle(args.source_dir, args.max_width, referenced_images(template))
+    output = args.output or os.path.join(args.source_dir, f"assets.bundle.{args.format}")
+    if args.format == "php":
+        content = render_php(bundle)
+    else:
+        content = json.dumps(bundle, ensure_ascii=False)
+    with open(output, "w", encoding="utf-8") as f:
+        f.write(content)
+
+    for name, before, after in stats:
+        print(f"✅ {name:<24} {before / 1024:8.1f} KB -> {after / 1024:8.1f} KB")
+    for name in missing:
+        print(f"⚠️  {name}: şablonda istinad var, amma fayl tapılmadı")
+    print(f"\n📦 {len(stats)} şəkil ({os.path.basename(template)}), versiya {bundle['version']}: {output}")
+    print(f"   Paketin ölçüsü: {len(content.encode('utf-8')) / 1024:.1f} KB, "
+          f"vaxt: {time.perf_counter() - started:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,199 @@
+"""
+Sertifikatın statik qatlarını bir fon şəklinə yığır.
+
+Hər sertifikatda eyni qatlar var: bg_3.png fonu, üç loqo (AZ_Kend_tes1,
+aqrar_x1, aqrar_t1) və imza (imza1.png). Chrome onları hər dəfə ayrıca
+dekodlayıb üst-üstə qoyur. Bu skript qatları bir dəfə, çap ölçüsündə
+(default A4 albom, 300 DPI) bir şəklə yığır və sadələşdirilmiş şablon
+(cer.flat.html) yaradır: orada yalnız bir fon şəkli qalır, dinamik mətn
+və QR kod isə onun üstündə yerləşir.
+
+Qatların yeri cer.html-in CSS-indən götürülüb (konteyner 1100 CSS px
+enindədir). Şablonda silinən <img>-lərin yerinə eyni ölçülü boş
+inline-block qoyulur ki, mətnin düzülüşü dəyişməsin.
+
+Yığılmış fon mənbə qatlarının cəmindən böyük alınarsa, fayllar yazılmır
+(köhnələri silinir) və servis qatları cer.html ilə göstərməyə davam edir.
+
+İstifadə:
+    python flatten_background.py                    # cer_background.jpg + cer.flat.html
+    python flatten_background.py --dpi 200 --format png
+    python flatten_background.py --jpeg-quality 90 --subsampling 4:4:4 --force
+"""
+
+import argparse
+import io
+import os
+import re
+import time
+
+from PIL import Image
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(HERE, "cer.html")
+
+# Kağız ölçüləri, mm (en, hündürlük) - albom
+PAPER_SIZES = {"a4": (297, 210), "letter": (279.4, 215.9)}
+OUTPUT_EXTENSIONS = {"png": ".png", "jpeg": ".jpg"}
+# Pillow-un subsampling dəyərləri; fon foto deyil, rəng 4:2:0-da itmir
+JPEG_SUBSAMPLING = {"4:4:4": 0, "4:2:2": 1, "4:2:0": 2}
+
+# cer.html-dəki layout, CSS px
+CONTAINER_WIDTH = 1100
+BACKGROUND = "bg_3.png"
+LOGOS = ("AZ_Kend_tes1.png", "aqrar_x1.png", "aqrar_t1.png")
+SIGNATURE = "imza1.png"
+# .logo_section: right 250px, top 100px, sütun (gap 20px), eni ən geniş
+# uşaqla - .qr_section span (200px); 140px-lik loqolar mərkəzdədir
+LOGO_WIDTH = 140
+LOGO_LEFT = CONTAINER_WIDTH - 250 - 200 + (200 - LOGO_WIDTH) / 2
+LOGO_TOP = 100
+LOGO_GAP = 20
+# .signature: left 470px, bottom 70px; qonşu .main_content_bottom axındakı
+# fon şəklindən sonra gəlir (sətrin alt boşluğu ilə). İmzanın altında
+# "İMZA" sətri var (18px Open Sans). Şrift metrikaları təxminidir (~±3px).
+SIGNATURE_WIDTH = 140
+SIGNATURE_LEFT = 470
+SIGNATURE_BOTTOM = 70
+BODY_LINE_DESCENT = 4
+SIGNATURE_LINE_DESCENT = 4.4
+SIGNATURE_CAPTION_HEIGHT = 24.5
+
+IMG_TAG = re.compile(r"<img\b[^>]*>", re.I)
+SRC_ATTR = re.compile(r'src="([^"]+)"')
+PLACEHOLDER_CSS = ".flat_layer{display:inline-block}"
+
+
+def scaled_height(template_dir, name, width):
+    with Image.open(os.path.join(template_dir, name)) as img:
+        return width * img.height / img.width
+
+
+def static_layers(template_dir=HERE):
+    """[(fayl adı, left, top, width)] - CSS px ilə, konteynerə nisbətən."""
+    layers = [(BACKGROUND, 0, 0, CONTAINER_WIDTH)]
+    top = LOGO_TOP
+    for name in LOGOS:
+        layers.append((name, LOGO_LEFT, top, LOGO_WIDTH))
+        top += scaled_height(template_dir, name, LOGO_WIDTH) + LOGO_GAP
+
+    flow_bottom = scaled_height(template_dir, BACKGROUND, CONTAINER_WIDTH) + BODY_LINE_DESCENT
+    signature_height = scaled_height(template_dir, SIGNATURE, SIGNATURE_WIDTH)
+    signature_top = (flow_bottom - SIGNATURE_BOTTOM - SIGNATURE_CAPTION_HEIGHT
+                     - SIGNATURE_LINE_DESCENT - signature_height)
+    layers.append((SIGNATURE, SIGNATURE_LEFT, signature_top, SIGNATURE_WIDTH))
+    return layers
+
+
+def canvas_size(paper="a4", dpi=300):
+    width_mm, height_mm = PAPER_SIZES[paper]
+    return round(width_mm / 25.4 * dpi), round(height_mm / 25.4 * dpi)
+
+
+def flatten(template_dir=HERE, paper="a4", dpi=300, layers=None):
+    """
+    Qatları kağız ölçüsündə bir RGB şəklə yığır.
+    Hər qat hədəf ölçüyə birbaşa (bir dəfə) kiçildilir/böyüdülür.
+    """
+    size = canvas_size(paper, dpi)
+    scale = size[0] / CONTAINER_WIDTH
+    canvas = Image.new("RGBA", size, (255, 255, 255, 255))
+    for name, left, top, width in layers or static_layers(template_dir):
+        with Image.open(os.path.join(template_dir, name)) as layer:
+            layer = layer.convert("RGBA")
+            target = (round(width * scale), round(width * scale * layer.height / layer.width))
+            if name == BACKGROUND:
+                # Fon kağızı tam örtür (object-fit: cover)
+                target = size
+            layer = layer.resize(target, Image.LANCZOS)
+        canvas.alpha_composite(layer, (round(left * scale), round(top * scale)))
+    return canvas.convert("RGB")
+
+
+def reduced_template(template_path, background_name, layers=None):
+    """
+    cer.html-dən sadələşdirilmiş şablon: fon <img>-i yeni fonu göstərir,
+    qalan statik <img>-lər eyni ölçülü boş yer tutuculara çevrilir.
+    """
+    template_dir = os.path.dirname(template_path)
+    boxes = {name: width for name, _left, _top, width in layers or static_layers(template_dir)}
+    with open(template_path, encoding="utf-8") as f:
+        text = f.read()
+
+    def replace(match):
+        tag = match.group(0)
+        src = SRC_ATTR.search(tag)
+        if 'data-generate="Dinamik"' in tag or not src:
+            return tag
+        name = src.group(1).lstrip("/")
+        if name == BACKGROUND:
+            return tag.replace(src.group(0), f'src="/{background_name}"')
+        if name not in boxes:
+            return tag
+        width = boxes[name]
+        height = scaled_height(template_dir, name, width)
+        return f'<i class="flat_layer" style="width:{width:g}px;height:{height:.2f}px"></i>'
+
+    text = IMG_TAG.sub(replace, text)
+    return text.replace("</style>", f"{PLACEHOLDER_CSS}\n</style>", 1)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Statik sertifikat qatlarını bir fon şəklinə yığır.")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE)
+    parser.add_argument("--output-dir", default=HERE)
+    parser.add_argument("--paper", choices=sorted(PAPER_SIZES), default="a4")
+    parser.add_argument("--dpi", type=int, default=300, help="çap DPI-ı (default: 300)")
+    parser.add_argument("--format", choices=sorted(OUTPUT_EXTENSIONS), default="jpeg",
+                        help="jpeg (default; 300 DPI-da PNG ~4 dəfə böyükdür) və ya png")
+    parser.add_argument("--jpeg-quality", type=int, default=85)
+    parser.add_argument("--subsampling", choices=sorted(JPEG_SUBSAMPLING), default="4:2:0",
+                        help="JPEG rəng subsampling-i (default: 4:2:0)")
+    parser.add_argument("--force", action="store_true",
+                        help="fon mənbə qatlarından böyük alınsa da yaz")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    template_dir = os.path.dirname(os.path.abspath(args.template))
+    layers = static_layers(template_dir)
+    background = flatten(template_dir, args.paper, args.dpi, layers)
+
+    background_name = "cer_background" + OUTPUT_EXTENSIONS[args.format]
+    background_path = os.path.join(args.output_dir, background_name)
+    template_out = os.path.join(args.output_dir, "cer.flat.html")
+    buffer = io.BytesIO()
+    if args.format == "jpeg":
+        background.save(buffer, "JPEG", quality=args.jpeg_quality, optimize=True, progressive=True,
+                        subsampling=JPEG_SUBSAMPLING[args.subsampling], dpi=(args.dpi, args.dpi))
+    else:
+        background.save(buffer, "PNG", optimize=True, dpi=(args.dpi, args.dpi))
+    data = buffer.getvalue()
+
+    sources = sum(os.path.getsize(os.path.join(template_dir, name)) for name, *_ in layers)
+    size_line = (f"   Ölçü: {sources / 1024:.1f} KB ({len(layers)} fayl) -> {len(data) / 1024:.1f} KB "
+                 f"({(len(data) - sources) / sources * 100:+.1f}%)")
+    if len(data) >= sources and not args.force:
+        # Köhnə nəticə qalsa, servis onu istifadə edərdi
+        for path in (background_path, template_out):
+            if os.path.exists(path):
+                os.unlink(path)
+        print(f"⚠️  {background_name} mənbə qatlarından böyükdür, yazılmadı (qatlar cer.html ilə qalır)")
+        print(size_line)
+        print("   --jpeg-quality/--dpi-ı azaldın və ya --force ilə yazın")
+        return 0
+
+    with open(background_path, "wb") as f:
+        f.write(data)
+    with open(template_out, "w", encoding="utf-8") as f:
+        f.write(reduced_template(os.path.abspath(args.template), background_name, layers))
+
+    print(f"✅ {background_name}: {background.width}x{background.height} px, {args.dpi} DPI, "
+          f"{len(layers)} qat -> 1")
+    print(size_line)
+    print(f"✅ {os.path.basename(template_out)}")
+    print(f"   Vaxt: {time.perf_counter() - started:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
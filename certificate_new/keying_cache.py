@@ -0,0 +1,146 @@
+"""
+Açarlanmış şəkillər üçün diskdə saxlanılan keş.
+
+Açar = mənbə faylın SHA-256 hash-i + emal parametrləri + keş versiyası.
+Mənbə və parametrlər dəyişməyibsə, nəticə keşdən kopyalanır və şəkil
+yenidən emal olunmur. Köhnə qeydlər yaşa və ümumi ölçüyə görə silinir.
+
+read/write metodları faylsız, yalnız parametrlərdən açarlanan kiçik
+nəticələr (məs. QR SVG fraqmentləri) üçündür.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import time
+
+# Açarlama alqoritmi nəticəni dəyişəcək şəkildə dəyişəndə artırılmalıdır
+CACHE_VERSION = 2
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".keying_cache")
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_MAX_AGE = 30 * 24 * 3600
+
+
+def file_digest(path, chunk_size=1024 * 1024):
+    """Faylın SHA-256 hash-i (böyük fayllar hissə-hissə oxunur)."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class KeyingCache:
+    """Hash ilə ünvanlanan sadə fayl keşi: <dir>/<ab>/<abcdef...>-<n>.bin"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES, max_age=DEFAULT_MAX_AGE):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def key_for(self, input_path, params):
+        """Mənbə faylın məzmunu və parametrlərdən keş açarı düzəldir."""
+        payload = json.dumps({"version": CACHE_VERSION, "params": params}, sort_keys=True)
+        digest = hashlib.sha256(file_digest(input_path).encode())
+        digest.update(payload.encode())
+        return digest.hexdigest()
+
+    def key_for_params(self, params, version=CACHE_VERSION):
+        """
+        Yalnız parametrlərdən (mənbə faylı olmadan) keş açarı. Keşi başqa
+        generator (məs. qr_codes.py) istifadə edirsə, öz version-unu verir.
+        """
+        payload = json.dumps({"version": version, "params": params}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _entry_path(self, key, index=0):
+        return os.path.join(self.directory, key[:2], f"{key}-{index}.bin")
+
+    def get(self, key, output_paths):
+        """
+        Qeyddəki bütün faylları output_paths-ə kopyalayıb True qaytarır.
+        Fayllardan biri belə yoxdursa (məs. silinib), False qaytarır.
+        """
+        entries = [self._entry_path(key, index) for index in range(len(output_paths))]
+        if not all(os.path.exists(entry) for entry in entries):
+            return False
+        for entry, output_path in zip(entries, output_paths):
+            shutil.copyfile(entry, output_path)
+            # Son istifadə vaxtı: ölçüyə görə silmədə ən köhnə istifadə olunan gedir
+            os.utime(entry)
+        return True
+
+    def put(self, key, output_paths):
+        """Hazır nəticə fayllarını keşə yazır (atomik: əvvəl müvəqqəti fayla)."""
+        for index, output_path in enumerate(output_paths):
+            entry = self._entry_path(key, index)
+            os.makedirs(os.path.dirname(entry), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry), suffix=".tmp")
+            os.close(fd)
+            try:
+                shutil.copyfile(output_path, tmp_path)
+                os.replace(tmp_path, entry)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+
+    def read(self, key):
+        """Qeydin məzmunu (bayt) və ya qeyd yoxdursa None."""
+        entry = self._entry_path(key)
+        try:
+            with open(entry, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        os.utime(entry)
+        return data
+
+    def write(self, key, data):
+        """Baytları keşə yazır (atomik: əvvəl müvəqqəti fayla)."""
+        entry = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(entry), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, entry)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def evict(self):
+        """
+        max_age-dən köhnə qeydləri, sonra ümumi ölçü max_bytes-a düşənə qədər
+        ən çoxdan istifadə olunmayanları silir. Silinən qeydlərin sayını qaytarır.
+        """
+        if not os.path.isdir(self.directory):
+            return 0
+        entries = []
+        for root, _dirs, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                stat = os.stat(path)
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        now = time.time()
+        removed = 0
+        kept = []
+        for mtime, size, path in entries:
+            if self.max_age is not None and now - mtime > self.max_age:
+                os.unlink(path)
+                removed += 1
+            else:
+                kept.append((mtime, size, path))
+
+        if self.max_bytes is not None:
+            total = sum(size for _mtime, size, _path in kept)
+            for _mtime, size, path in sorted(kept):
+                if total <= self.max_bytes:
+                    break
+                os.unlink(path)
+                total -= size
+                removed += 1
+        return removed
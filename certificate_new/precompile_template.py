@@ -0,0 +1,380 @@
+"""
+Sertifikat şablonunun əvvəlcədən kompilyasiyası.
+
+cer.html-dəki stillər (inline <style> və lokal <link rel="stylesheet">)
+bir yerə yığılır, şablonda heç bir elementə uyğun gəlməyən selektorlar və
+boş qaydalar atılır, CSS və HTML minimallaşdırılır. Nəticə məzmun hash-i
+olan tək fayla yazılır (cer.<hash>.min.html) və cer.precompiled.json
+manifestində qeyd olunur. CertificateGeneratorService manifest varsa bu
+faylı istifadə edir - Chrome hər PDF üçün daha az CSS təhlil edir.
+
+Selektor uyğunluğu konservativdir: tanınmayan konstruksiyalar (psevdo-
+siniflər, atribut və qonşu selektorları) olan qaydalar həmişə saxlanılır.
+
+İstifadə:
+    python precompile_template.py
+    python precompile_template.py --template cer.html --output-dir .
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+from html.parser import HTMLParser
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(HERE, "cer.html")
+MANIFEST_NAME = "cer.precompiled.json"
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+# Bu elementlərin ətrafındakı boşluq göstərilmir, minimallaşdırmada atıla bilər
+BLOCK_ELEMENTS = {
+    "html", "head", "body", "title", "meta", "link", "style", "script", "div", "p", "h1", "h2", "h3",
+    "h4", "h5", "h6", "ul", "ol", "li", "table", "thead", "tbody", "tr", "td", "th", "section",
+    "header", "footer", "main", "nav", "article", "aside", "form", "br", "hr",
+}
+PRESERVE_WHITESPACE = {"pre", "textarea", "script"}
+
+COMMENT_PATTERN = re.compile(r"/\*.*?\*/", re.S)
+COMPOUND_TOKEN = re.compile(r"\*|[#.]?-?[_a-zA-Z][-_a-zA-Z0-9]*|\[[^\]]*\]|::?[-a-zA-Z]+(\([^)]*\))?")
+
+
+# --- DOM ---
+
+class Node:
+    __slots__ = ("tag", "id", "classes", "parent")
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.id = attrs.get("id")
+        self.classes = set((attrs.get("class") or "").split())
+        self.parent = parent
+
+
+class _TreeBuilder(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.nodes = []
+        self.stack = []
+
+    def handle_starttag(self, tag, attrs):
+        node = Node(tag, dict(attrs), self.stack[-1] if self.stack else None)
+        self.nodes.append(node)
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, -1, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                break
+
+
+def build_nodes(html_text):
+    builder = _TreeBuilder()
+    builder.feed(html_text)
+    builder.close()
+    return builder.nodes
+
+
+# --- Selektorlar ---
+
+class _Unsupported(Exception):
+    """Selektor təhlil edilə bilmir - qayda saxlanmalıdır."""
+
+
+def _parse_compound(text):
+    tag, ids, classes = None, [], []
+    position = 0
+    while position < len(text):
+        match = COMPOUND_TOKEN.match(text, position)
+        if not match:
+            raise _Unsupported(text)
+        token = match.group(0)
+        if token[0] in "[:":
+            # Atribut və psevdo selektorlar: konservativ olaraq qaydanı saxla
+            raise _Unsupported(text)
+        if token == "*":
+            pass
+        elif token[0] == "#":
+            ids.append(token[1:])
+        elif token[0] == ".":
+            classes.append(token[1:])
+        else:
+            tag = token.lower()
+        position = match.end()
+    return tag, ids, set(classes)
+
+
+def parse_selector(selector):
+    """".a > p span" -> [(None, compound), (">", compound), (" ", compound)]"""
+    if "+" in selector or "~" in selector:
+        raise _Unsupported(selector)
+    tokens = re.sub(r"\s*>\s*", " > ", selector.strip()).split()
+    parts, combinator = [], None
+    for token in tokens:
+        if token == ">":
+            combinator = ">"
+            continue
+        parts.append((combinator if parts else None, _parse_compound(token)))
+        combinator = " "
+    return parts
+
+
+def _matches_compound(node, compound):
+    tag, ids, classes = compound
+    if tag and node.tag != tag:
+        return False
+    if ids and node.id not in ids:
+        return False
+    return classes <= node.classes
+
+
+def _matches(node, parts, index):
+    combinator, compound = parts[index]
+    if not _matches_compound(node, compound):
+        return False
+    if index == 0:
+        return True
+    ancestor = node.parent
+    if combinator == ">":
+        return ancestor is not None and _matches(ancestor, parts, index - 1)
+    while ancestor is not None:
+        if _matches(ancestor, parts, index - 1):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def selector_used(selector, nodes):
+    """Selektor ən azı bir elementə uyğun gəlirmi (təhlil olunmursa - True)."""
+    try:
+        parts = parse_selector(selector)
+    except _Unsupported:
+        return True
+    if not parts:
+        return True
+    last = len(parts) - 1
+    return any(_matches(node, parts, last) for node in nodes)
+
+
+# --- CSS ---
+
+def _block_end(text, start):
+    """text[start] == "{" üçün uyğun "}" indeksi."""
+    depth = 0
+    for index in range(start, len(text)):
+        if text[index] == "{":
+            depth += 1
+        elif text[index] == "}":
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(text)
+
+
+def minify_declarations(body):
+    declarations = []
+    for declaration in body.split(";"):
+        if ":" not in declaration:
+            continue
+        name, value = declaration.split(":", 1)
+        value = re.sub(r"\s+", " ", value.strip())
+        value = re.sub(r"\s*,\s*", ",", value)
+        if name.strip() and value:
+            declarations.append(f"{name.strip()}:{value}")
+    return ";".join(declarations)
+
+
+def minify_selector(selector):
+    selector = re.sub(r"\s+", " ", selector.strip())
+    return re.sub(r"\s*([>,+~])\s*", r"\1", selector)
+
+
+def prune_css(css, nodes, removed=None):
+    """
+    İstifadə olunmayan selektorları atıb minimallaşdırılmış CSS qaytarır.
+    removed (siyahı) verilibsə, atılan selektorlar ora yazılır.
+    """
+    css = COMMENT_PATTERN.sub("", css)
+    out = []
+    position = 0
+    while position < len(css):
+        brace = css.find("{", position)
+        semicolon = css.find(";", position)
+        if brace == -1:
+            break
+        prelude = css[position:brace].strip()
+        if prelude.startswith("@") and 0 <= semicolon < brace:
+            # @import, @charset və s.
+            out.append(re.sub(r"\s+", " ", css[position:semicolon].strip()) + ";")
+            position = semicolon + 1
+            continue
+        end = _block_end(css, brace)
+        body = css[brace + 1:end]
+        position = end + 1
+        if prelude.startswith("@"):
+            at_rule = re.sub(r"\s+", " ", prelude)
+            if at_rule.startswith(("@media", "@supports")):
+                inner = prune_css(body, nodes, removed)
+                if inner:
+                    out.append(f"{at_rule}{{{inner}}}")
+            elif "{" in body:
+                # @keyframes və s.: iç bloklar olduğu kimi, yalnız boşluqlar sıxılır
+                inner = re.sub(r"\s+", " ", body.strip())
+                out.append(f"{at_rule}{{{inner}}}")
+            else:
+                out.append(f"{at_rule}{{{minify_declarations(body)}}}")
+            continue
+
+        declarations = minify_declarations(body)
+        selectors = [minify_selector(s) for s in prelude.split(",") if s.strip()]
+        used = [s for s in selectors if selector_used(s, nodes)]
+        if removed is not None:
+            removed.extend(s for s in selectors if s not in used or not declarations)
+        if used and declarations:
+            out.append(f"{','.join(used)}{{{declarations}}}")
+    return "".join(out)
+
+
+# --- HTML ---
+
+class _Minifier(HTMLParser):
+    """Şərhləri atır, boşluqları sıxır; teqləri orijinal mətni ilə saxlayır."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=False)
+        self.out = []
+        self.pending_space = False
+        self.last_tag_block = True
+        self.preserve = 0
+
+    def _flush_space(self, next_is_block):
+        if self.pending_space and not (next_is_block or self.last_tag_block):
+            self.out.append(" ")
+        self.pending_space = False
+
+    def handle_starttag(self, tag, attrs):
+        self._flush_space(tag in BLOCK_ELEMENTS)
+        self.out.append(re.sub(r"\s+", " ", self.get_starttag_text()))
+        self.last_tag_block = tag in BLOCK_ELEMENTS
+        if tag in PRESERVE_WHITESPACE:
+            self.preserve += 1
+
+    handle_startendtag = handle_starttag
+
+    def handle_endtag(self, tag):
+        self._flush_space(tag in BLOCK_ELEMENTS)
+        self.out.append(f"</{tag}>")
+        self.last_tag_block = tag in BLOCK_ELEMENTS
+        if tag in PRESERVE_WHITESPACE:
+            self.preserve -= 1
+
+    def handle_data(self, data):
+        if self.preserve:
+            self.out.append(data)
+            return
+        if not data.strip():
+            self.pending_space = self.pending_space or bool(data)
+            return
+        leading, trailing = data[0].isspace(), data[-1].isspace()
+        if leading:
+            self.pending_space = True
+        self._flush_space(False)
+        self.out.append(re.sub(r"\s+", " ", data.strip()))
+        self.pending_space = trailing
+        self.last_tag_block = False
+
+    def handle_entityref(self, name):
+        self.handle_data(f"&{name};")
+
+    def handle_charref(self, name):
+        self.handle_data(f"&#{name};")
+
+    def handle_decl(self, decl):
+        self.out.append(f"<!{decl}>")
+
+    def handle_comment(self, data):
+        pass
+
+
+def minify_html(html_text):
+    minifier = _Minifier()
+    minifier.feed(html_text)
+    minifier.close()
+    return "".join(minifier.out)
+
+
+# --- Kompilyasiya ---
+
+STYLE_BLOCK = re.compile(r"<style[^>]*>(.*?)</style>", re.S | re.I)
+HTML_COMMENT = re.compile(r"<!--.*?-->", re.S)
+LOCAL_STYLESHEET = re.compile(r"<link[^>]*rel=\"stylesheet\"[^>]*href=\"(?!https?:|//)([^\"]+)\"[^>]*>", re.I)
+
+
+def precompile(template_path=DEFAULT_TEMPLATE):
+    """Şablonu kompilyasiya edib (html, hesabat) qaytarır."""
+    with open(template_path, encoding="utf-8") as f:
+        source = f.read()
+    template_dir = os.path.dirname(template_path)
+
+    # Şərhə alınmış <link>-lər nəzərə alınmasın
+    text = HTML_COMMENT.sub("", source)
+
+    css_parts = [match.group(1) for match in STYLE_BLOCK.finditer(text)]
+    for match in LOCAL_STYLESHEET.finditer(text):
+        with open(os.path.join(template_dir, match.group(1).lstrip("/")), encoding="utf-8") as f:
+            css_parts.append(f.read())
+    text = LOCAL_STYLESHEET.sub("", STYLE_BLOCK.sub("", text))
+
+    nodes = build_nodes(text)
+    removed = []
+    css = prune_css("\n".join(css_parts), nodes, removed)
+    text = text.replace("</head>", f"<style>{css}</style></head>", 1)
+    html_text = minify_html(text)
+
+    report = {
+        "source_bytes": len(source.encode("utf-8")),
+        "output_bytes": len(html_text.encode("utf-8")),
+        "css_source_bytes": sum(len(part.encode("utf-8")) for part in css_parts),
+        "css_output_bytes": len(css.encode("utf-8")),
+        "removed_selectors": removed,
+    }
+    return html_text, report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sertifikat şablonunu əvvəlcədən kompilyasiya edir.")
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE)
+    parser.add_argument("--output-dir", default=HERE)
+    args = parser.parse_args(argv)
+
+    html_text, report = precompile(args.template)
+    content_hash = hashlib.sha256(html_text.encode("utf-8")).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(args.template))[0]
+    name = f"{stem}.{content_hash}.min.html"
+    with open(os.path.join(args.output_dir, name), "w", encoding="utf-8") as f:
+        f.write(html_text)
+
+    manifest_path = os.path.join(args.output_dir, MANIFEST_NAME)
+    previous = None
+    if os.path.exists(manifest_path):
+        with open(manifest_path, encoding="utf-8") as f:
+            previous = json.load(f).get("template")
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump({"template": name, "hash": content_hash, **report}, f, indent=2, ensure_ascii=False)
+    # Köhnə versiyanı sil ki, qovluqda yığılmasın
+    if previous and previous != name and os.path.exists(os.path.join(args.output_dir, previous)):
+        os.remove(os.path.join(args.output_dir, previous))
+
+    print(f"✅ {name}")
+    print(f"   HTML: {report['source_bytes'] / 1024:.1f} KB -> {report['output_bytes'] / 1024:.1f} KB")
+    print(f"   CSS:  {report['css_source_bytes'] / 1024:.1f} KB -> {report['css_output_bytes'] / 1024:.1f} KB")
+    if report["removed_selectors"]:
+        print(f"   Atılan selektorlar: {', '.join(report['removed_selectors'])}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,270 @@
+"""
+Çap üçün toplu PDF: ayrı-ayrı sertifikat PDF-lərini bir çoxsəhifəli fayla birləşdirir.
+
+/api/certificates/download/{signature} ilə endirilən hər PDF fonun, loqoların
+və imzanın öz surətini daşıyır. Burada hər giriş faylının səhifələri obyekt-
+obyekt nəticə faylına köçürülür; hər obyekt (şəkil, şrift, şrift faylı,
+ExtGState ...) istinad etdiyi obyektlər yenidən nömrələndikdən sonra
+serializasiya olunur və məzmununun SHA-256 hash-i yoxlanılır. Eyni məzmunlu
+obyekt artıq yazılıbsa, yenisi yazılmır, səhifə köhnəsinə istinad edir.
+Uşaqlar əvvəl emal olunduğundan eyni alt-qraflar (məs. şəkil + SMask) da
+bütövlükdə paylaşılır.
+
+Nəticə axınla yazılır: obyektlər hazır olan kimi fayla gedir, yaddaşda
+yalnız xref ofsetləri, hash cədvəli və cari giriş faylı qalır. Səhifə ağacı
+(/Pages) və xref cədvəli sonda yazılır.
+
+Chrome hər PDF-də şriftləri yalnız istifadə olunan simvollarla (subset)
+yerləşdirir; fərqli mətnli sertifikatlarda bu subset-lər fərqli ola bilər və
+onda ayrı saxlanılır - yalnız eyni baytlı obyektlər birləşdirilir.
+
+İstifadə:
+    python print_batch.py pdfs/ -o ceremony.pdf
+    python print_batch.py "downloads/certificate_*.pdf" -o ceremony.pdf --no-dedupe
+"""
+
+import argparse
+import glob
+import hashlib
+import io
+import os
+import time
+from collections import Counter
+
+from pypdf import PdfReader
+from pypdf.generic import ArrayObject, DictionaryObject, IndirectObject, NameObject, NullObject, NumberObject, \
+    StreamObject
+
+PDF_HEADER = b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n"
+CATALOG, PAGES = 1, 2
+# Valideyn /Pages düyünündən miras alına bilən səhifə atributları
+INHERITABLE = ("/Resources", "/MediaBox", "/CropBox", "/Rotate")
+# Köçürülmür: /Parent yeni ağaca bağlanır, struktur ağacı (tagged PDF) köçürülmür
+DROPPED_PAGE_KEYS = ("/Parent", "/StructParents")
+
+
+def _dump(value):
+    buffer = io.BytesIO()
+    value.write_to_stream(buffer)
+    return buffer.getvalue()
+
+
+def _kind(obj):
+    """Statistika üçün obyektin növü."""
+    if isinstance(obj, StreamObject):
+        subtype = obj.get("/Subtype")
+        if subtype == "/Image":
+            return "image"
+        if "/Length1" in obj or subtype in ("/Type1C", "/CIDFontType0C", "/OpenType"):
+            return "font_file"
+        return "stream"
+    if isinstance(obj, DictionaryObject) and obj.get("/Type") == "/Font":
+        return "font"
+    return "object"
+
+
+class PrintBatchWriter:
+    """
+    Səhifələri axınla yazan PDF yazıcısı:
+
+        with open("batch.pdf", "wb") as f:
+            writer = PrintBatchWriter(f)
+            writer.add_document(PdfReader("a.pdf"))
+            writer.close()
+    """
+
+    def __init__(self, f, dedupe=True):
+        self.f = f
+        self.dedupe = dedupe
+        self.position = 0
+        # offsets[n] - n nömrəli obyektin fayldakı yeri (0 istifadə olunmur)
+        self.offsets = [0, None, None]
+        self.kids = []
+        self.by_hash = {}
+        self.written = Counter()
+        self.reused = Counter()
+        self.reused_bytes = 0
+        self._done = {}
+        self._visiting = {}
+        self._write(PDF_HEADER)
+
+    def _write(self, data):
+        self.f.write(data)
+        self.position += len(data)
+
+    def _allocate(self):
+        self.offsets.append(None)
+        return len(self.offsets) - 1
+
+    def _put(self, number, body):
+        self.offsets[number] = self.position
+        self._write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+
+    def _remap(self, value):
+        """Birbaşa dəyərin surəti; dolayı istinadlar nəticə faylındakı nömrələrə çevrilir."""
+        if isinstance(value, IndirectObject):
+            return IndirectObject(self._emit(value), 0, None)
+        if isinstance(value, DictionaryObject):
+            return DictionaryObject({NameObject(key): self._remap(item) for key, item in dict.items(value)})
+        if isinstance(value, ArrayObject):
+            return ArrayObject(self._remap(item) for item in list.__iter__(value))
+        return value
+
+    def _body(self, obj):
+        if obj is None:
+            return _dump(NullObject())
+        if isinstance(obj, StreamObject):
+            # Axının baytları olduğu kimi (kodlanmış) köçürülür; /Length dolayı ola bilər
+            header = DictionaryObject({NameObject(key): self._remap(item) for key, item in dict.items(obj)
+                                       if key != "/Length"})
+            header[NameObject("/Length")] = NumberObject(len(obj._data))
+            return b"%s\nstream\n%s\nendstream" % (_dump(header), obj._data)
+        return _dump(self._remap(obj))
+
+    def _emit(self, reference):
+        """Giriş faylındakı obyekti yazır (və ya eynisini tapır); nəticə nömrəsini qaytarır."""
+        key = (reference.idnum, reference.generation)
+        number = self._done.get(key)
+        if number is not None:
+            return number
+        if key in self._visiting:
+            # Dövr (məs. annotasiyanın /P istinadı): nömrə əvvəlcədən ayrılır, belə obyekt birləşdirilmir
+            if self._visiting[key] is None:
+                self._visiting[key] = self._allocate()
+            return self._visiting[key]
+        self._visiting[key] = None
+        obj = reference.get_object()
+        body = self._body(obj)
+        number = self._visiting.pop(key)
+        kind = _kind(obj)
+        if number is None:
+            if self.dedupe:
+                digest = hashlib.sha256(body).digest()
+                number = self.by_hash.get(digest)
+                if number is not None:
+                    self.reused[kind] += 1
+                    self.reused_bytes += len(body)
+                    self._done[key] = number
+                    return number
+                number = self.by_hash[digest] = self._allocate()
+            else:
+                number = self._allocate()
+        self._put(number, body)
+        self.written[kind] += 1
+        self._done[key] = number
+        return number
+
+    def _page_items(self, page):
+        items = {key: value for key, value in dict.items(page) if key not in DROPPED_PAGE_KEYS}
+        missing = [key for key in INHERITABLE if key not in items]
+        node = page.get("/Parent")
+        while missing and node is not None:
+            node = node.get_object()
+            for key in list(missing):
+                if key in node:
+                    items[key] = dict.__getitem__(node, key)
+                    missing.remove(key)
+            node = node.get("/Parent")
+        return items
+
+    def add_document(self, reader):
+        """Bütün səhifələri əlavə edir; əlavə olunan səhifələrin sayını qaytarır."""
+        self._done = {}
+        self._visiting = {}
+        pages = list(reader.pages)
+        numbers = []
+        # Səhifələrə digər obyektlərdən (annotasiya /P, keçid /Dest) istinad oluna bilər
+        for page in pages:
+            number = self._allocate()
+            reference = page.indirect_reference
+            if reference is not None:
+                self._done[(reference.idnum, reference.generation)] = number
+            numbers.append(number)
+        for page, number in zip(pages, numbers):
+            items = self._page_items(page)
+            body = DictionaryObject({NameObject(key): self._remap(value) for key, value in items.items()})
+            body[NameObject("/Parent")] = IndirectObject(PAGES, 0, None)
+            self._put(number, _dump(body))
+            self.kids.append(number)
+        self._done = {}
+        return len(pages)
+
+    def close(self):
+        """Kataloq, səhifə ağacı, xref və trailer-i yazır."""
+        self._put(CATALOG, b"<< /Type /Catalog /Pages %d 0 R >>" % PAGES)
+        kids = b" ".join(b"%d 0 R" % number for number in self.kids)
+        self._put(PAGES, b"<< /Type /Pages /Count %d /Kids [%s] >>" % (len(self.kids), kids))
+        xref = self.position
+        self._write(b"xref\n0 %d\n0000000000 65535 f \n" % len(self.offsets))
+        self._write(b"".join(b"%010d 00000 n \n" % offset for offset in self.offsets[1:]))
+        self._write(b"trailer\n<< /Size %d /Root %d 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+                    % (len(self.offsets), CATALOG, xref))
+
+
+def collect_pdfs(patterns):
+    """Fayl, qovluq və glob nümunələrindən PDF-lərin siyahısı (qovluqda ada görə sıralı)."""
+    found = []
+    for pattern in patterns:
+        if os.path.isfile(pattern):
+            found.append(pattern)
+            continue
+        if os.path.isdir(pattern):
+            candidates = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        else:
+            candidates = sorted(glob.glob(pattern, recursive=True))
+        found.extend(path for path in candidates if path.lower().endswith(".pdf") and os.path.isfile(path))
+    return list(dict.fromkeys(os.path.normpath(path) for path in found))
+
+
+def assemble(inputs, output, dedupe=True, progress=None):
+    """inputs-dakı PDF-ləri output-a birləşdirir; PrintBatchWriter-i (statistika üçün) qaytarır."""
+    tmp_path = output + ".tmp"
+    with open(tmp_path, "wb") as f:
+        writer = PrintBatchWriter(f, dedupe)
+        for path in inputs:
+            reader = PdfReader(path)
+            if reader.is_encrypted:
+                reader.decrypt("")
+            pages = writer.add_document(reader)
+            if progress:
+                progress(path, pages)
+        writer.close()
+    os.replace(tmp_path, output)
+    return writer
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sertifikat PDF-lərini ortaq şəkil və şriftlərlə bir çap faylına "
+                                                 "birləşdirir.")
+    parser.add_argument("inputs", nargs="+", help="PDF faylları, qovluqlar və ya glob nümunələri")
+    parser.add_argument("-o", "--output", required=True, help="nəticə PDF")
+    parser.add_argument("--no-dedupe", action="store_true", help="eyni obyektləri birləşdirmə (müqayisə üçün)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="hər faylı göstər")
+    args = parser.parse_args(argv)
+
+    inputs = [path for path in collect_pdfs(args.inputs) if os.path.abspath(path) != os.path.abspath(args.output)]
+    if not inputs:
+        print("⚠️  PDF tapılmadı")
+        return 1
+
+    started = time.perf_counter()
+    progress = (lambda path, pages: print(f"   {path}: {pages} səhifə")) if args.verbose else None
+    writer = assemble(inputs, args.output, not args.no_dedupe, progress)
+    elapsed = time.perf_counter() - started
+
+    summed = sum(os.path.getsize(path) for path in inputs)
+    size = os.path.getsize(args.output)
+    print(f"✅ {args.output}: {len(inputs)} fayl, {len(writer.kids)} səhifə, {size / 1024 / 1024:.2f} MB "
+          f"(ayrı fayllar cəmi {summed / 1024 / 1024:.2f} MB, {size / summed * 100 if summed else 0:.1f}%), "
+          f"{elapsed:.2f} s")
+    if writer.dedupe:
+        print(f"♻️  Təkrar istifadə: {writer.reused['image']} şəkil, {writer.reused['font']} şrift, "
+              f"{writer.reused['font_file']} şrift faylı, {sum(writer.reused.values())} obyekt cəmi "
+              f"({writer.reused_bytes / 1024 / 1024:.2f} MB yazılmadı)")
+        print(f"📊 Yazılan: {writer.written['image']} şəkil, {writer.written['font']} şrift, "
+              f"{writer.written['font_file']} şrift faylı, {sum(writer.written.values())} obyekt cəmi")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,145 @@
+"""
+Sertifikat yoxlama linkləri üçün toplu QR kod generasiyası.
+
+Hər URL kompakt SVG fraqmentinə çevrilir: XML bəyannaməsi, sinif adları
+və ölçü atributları yoxdur, bütün modullar tək <path> elementində minimal
+"h/m" əmrləri ilə yazılır (segno). Nəticələr URL + xəta korreksiyası
+səviyyəsi + parametrlərə görə diskdə keşlənir, ona görə də eyni
+sertifikatların yenidən yaradılması QR mərhələsini demək olar ki, pulsuz edir.
+
+Tələb: pip install segno
+
+İstifadə:
+    python qr_codes.py signatures.txt --base-url https://aqrar.az -o qr.json
+    python qr_codes.py urls.txt --urls -o qr_svgs/ --error M
+"""
+
+import argparse
+import base64
+import io
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import segno
+
+from keying_cache import DEFAULT_MAX_AGE, DEFAULT_MAX_BYTES, KeyingCache
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(HERE, ".qr_cache")
+# QR kodlamanın nəticəsi dəyişəndə artırılmalıdır (açarlamanın CACHE_VERSION-undan asılı deyil)
+QR_CACHE_VERSION = 1
+DEFAULT_BASE_URL = "http://localhost:8000"
+ERROR_LEVELS = ("L", "M", "Q", "H")
+
+# PHP servisindəki kimi aşağı səviyyə: URL-lər qısa, kod kiçik qalır
+DEFAULT_ERROR = "L"
+DEFAULT_BORDER = 2
+
+# Bundan az yeni kod üçün proses hovuzu açmağa dəyməz
+MIN_POOL_JOBS = 64
+
+
+def verification_url(signature, base_url=DEFAULT_BASE_URL):
+    """İmzadan ictimai yoxlama linki: /certificates/verify/{signature}"""
+    return f"{base_url.rstrip('/')}/certificates/verify/{signature}"
+
+
+def qr_svg(url, error=DEFAULT_ERROR, border=DEFAULT_BORDER):
+    """URL-i kompakt SVG fraqmentinə çevirir (viewBox ilə, istənilən ölçüyə miqyaslanır)."""
+    qr = segno.make(url, error=error, boost_error=False, micro=False)
+    buffer = io.BytesIO()
+    qr.save(buffer, kind="svg", xmldecl=False, svgns=True, nl=False, omitsize=True,
+            border=border, svgclass=None, lineclass=None)
+    return buffer.getvalue().decode("ascii")
+
+
+def svg_data_uri(svg):
+    """SVG fraqmentini <img src> üçün data URI-yə çevirir (PHP servisi ilə eyni formada)."""
+    return "data:image/svg+xml;base64," + base64.b64encode(svg.encode("utf-8")).decode("ascii")
+
+
+def _encode_job(job):
+    url, error, border = job
+    return url, qr_svg(url, error, border)
+
+
+def bulk_qr(urls, error=DEFAULT_ERROR, border=DEFAULT_BORDER, workers=None, cache=None, stats=None):
+    """
+    URL siyahısı üçün {url: svg} qaytarır. Keşdə olmayanlar proses hovuzunda
+    yaradılır və keşə yazılır. stats (dict) verilibsə, hits/misses ilə doldurulur.
+    """
+    result, keys, missing = {}, {}, []
+    for url in dict.fromkeys(urls):
+        if cache is not None:
+            key = cache.key_for_params({"qr": url, "error": error, "border": border}, QR_CACHE_VERSION)
+            data = cache.read(key)
+            if data is not None:
+                result[url] = data.decode("ascii")
+                continue
+            keys[url] = key
+        missing.append(url)
+
+    jobs = [(url, error, border) for url in missing]
+    if workers == 1 or len(jobs) < MIN_POOL_JOBS:
+        encoded = [_encode_job(job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            encoded = list(pool.map(_encode_job, jobs, chunksize=MIN_POOL_JOBS))
+    for url, svg in encoded:
+        result[url] = svg
+        if url in keys:
+            cache.write(keys[url], svg.encode("ascii"))
+
+    if stats is not None:
+        stats["hits"] = len(result) - len(missing)
+        stats["misses"] = len(missing)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Yoxlama linkləri üçün toplu QR SVG generasiyası.")
+    parser.add_argument("input", help="hər sətirdə bir imza (və ya --urls ilə tam URL)")
+    parser.add_argument("--urls", action="store_true", help="giriş faylında imza yox, hazır URL-lər var")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL)
+    parser.add_argument("-o", "--output", required=True,
+                        help=".json ilə bitirsə {url: svg} xəritəsi, əks halda SVG faylları üçün qovluq")
+    parser.add_argument("--error", choices=ERROR_LEVELS, default=DEFAULT_ERROR, help="xəta korreksiyası")
+    parser.add_argument("--border", type=int, default=DEFAULT_BORDER, help="sakit zona, modul (default: 2)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    args = parser.parse_args(argv)
+
+    with open(args.input, encoding="utf-8") as f:
+        lines = [line.strip() for line in f if line.strip()]
+    urls = lines if args.urls else [verification_url(line, args.base_url) for line in lines]
+
+    cache = None if args.no_cache else KeyingCache(args.cache_dir, DEFAULT_MAX_BYTES, DEFAULT_MAX_AGE)
+    started = time.perf_counter()
+    stats = {}
+    svgs = bulk_qr(urls, args.error, args.border, args.jobs, cache, stats)
+    elapsed = time.perf_counter() - started
+
+    if args.output.endswith(".json"):
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(svgs, f)
+    else:
+        os.makedirs(args.output, exist_ok=True)
+        for index, url in enumerate(svgs):
+            name = url.rstrip("/").rsplit("/", 1)[-1] if not args.urls else f"qr_{index:06d}"
+            with open(os.path.join(args.output, f"{name}.svg"), "w", encoding="ascii") as f:
+                f.write(svgs[url])
+    if cache is not None:
+        cache.evict()
+
+    average = sum(map(len, svgs.values())) / max(len(svgs), 1)
+    print(f"✅ {len(svgs)} QR kod: {elapsed * 1000:.1f} ms "
+          f"(keşdən: {stats['hits']}, yeni: {stats['misses']}), orta ölçü {average:.0f} bayt")
+    print(f"   Nəticə: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
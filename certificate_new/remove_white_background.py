@@ -1,25 +1,502 @@
-from PIL import Image
+import argparse
+import glob
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 
-def remove_white_background(input_path, output_path, threshold=240):
+from PIL import Image, ImageChops
+
+from keying_cache import DEFAULT_CACHE_DIR, DEFAULT_MAX_AGE, DEFAULT_MAX_BYTES, KeyingCache
+
+# tooling_trace repo kökündədir (skript certificate_new/ içindən işə salınır)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from tooling_trace import tracer  # noqa: E402
+
+# Şəffaf edilən piksellərin yeni dəyəri (köhnə versiya ilə eyni)
+TRANSPARENT = (255, 255, 255, 0)
+
+# Zolaqlı rejimdə bir pikselin emalı üçün təxmini iş yaddaşı (bayt):
+# RGBA kəsik (4) + R/G/B kanalları (3) + kanal maskaları (3) + yekun maska (1) + ehtiyat
+WORKING_BYTES_PER_PIXEL = 12
+
+# Zolaqlı rejimdə default yaddaş limiti (bütün paralel zolaqlar üçün cəmi)
+DEFAULT_MEMORY_LIMIT = 64 * 1024 * 1024
+
+# Çıxış formatları və onların fayl uzantıları
+OUTPUT_EXTENSIONS = {"png": ".png", "webp": ".webp"}
+
+# Nəticəyə təsir etməyən parametrlər - keş açarına daxil edilmir
+OUTPUT_NEUTRAL_OPTIONS = ("tiled", "memory_limit", "threads")
+
+
+def _threshold_lut(threshold):
+    """`v > threshold` şərti üçün 256 elementli cədvəl (255 = bəli, 0 = xeyr)."""
+    return [255 if v > threshold else 0 for v in range(256)]
+
+
+def white_mask(img, threshold=240, mode="rgb"):
+    """
+    Ağ sayılan pikselləri göstərən "L" maskası qaytarır (255 = ağ).
+
+    mode="rgb" - hər kanal ayrıca yoxlanılır: R, G və B hamısı threshold-dan
+    böyük olmalıdır. threshold tək ədəd və ya (r, g, b) üçlüyü ola bilər.
+    mode="luminance" - yalnız parlaqlıq (L kanalı) tək ədəd threshold ilə
+    müqayisə olunur.
+    """
+    if mode == "luminance":
+        if not isinstance(threshold, int):
+            raise ValueError("luminance rejimində threshold tək ədəd olmalıdır")
+        return img.convert("L").point(_threshold_lut(threshold))
+    if mode != "rgb":
+        raise ValueError(f"Naməlum rejim: {mode}")
+
+    if isinstance(threshold, int):
+        threshold = (threshold, threshold, threshold)
+    if img.mode not in ("RGB", "RGBA"):
+        img = img.convert("RGB")
+    r, g, b = (img.getchannel(band) for band in "RGB")
+    mask = r.point(_threshold_lut(threshold[0]))
+    # 0/255 maskalarda minimum məntiqi "və" deməkdir
+    mask = ImageChops.darker(mask, g.point(_threshold_lut(threshold[1])))
+    return ImageChops.darker(mask, b.point(_threshold_lut(threshold[2])))
+
+
+def key_image(img, threshold=240, mode="rgb"):
+    """
+    Şəkli RGBA-ya çevirib ağ pikselləri şəffaf edir və yeni şəkli qaytarır.
+    Bütün əməliyyatlar Pillow-un kanal səviyyəsində gedir, Python dövrü yoxdur.
+    """
+    img = img.convert("RGBA")
+    img.paste(TRANSPARENT, mask=white_mask(img, threshold, mode))
+    return img
+
+
+def strip_boxes(size, rows):
+    """Şəkli hündürlüyü `rows` olan üfüqi zolaqlara bölür: [(0, y0, w, y1), ...]."""
+    width, height = size
+    return [(0, top, width, min(top + rows, height)) for top in range(0, height, rows)]
+
+
+def key_image_tiled(img, threshold=240, mode="rgb", memory_limit=DEFAULT_MEMORY_LIMIT, threads=None):
+    """
+    key_image ilə eyni nəticəni zolaq-zolaq hesablayır.
+
+    Mənbə şəkil bir dəfə Pillow-un öz buferində saxlanılır, maska və kanal
+    nüsxələri isə yalnız zolaq ölçüsündə yaradılır. Zolaqların hündürlüyü elə
+    seçilir ki, `threads` paralel zolağın iş yaddaşı memory_limit-i keçməsin.
+    Zolaqlar bir-birinə toxunmadığı üçün eyni şəklə paralel yazıla bilər.
+    """
+    threads = threads or os.cpu_count() or 1
+    img.load()
+    # key_image kimi mənbəyə toxunulmur
+    converted = img.mode != "RGBA"
+    out = Image.new("RGBA", img.size) if converted else img.copy()
+    width = max(img.width, 1)
+    rows = max(1, memory_limit // (threads * width * WORKING_BYTES_PER_PIXEL))
+
+    def key_strip(box):
+        region = img.crop(box)
+        if converted:
+            region = region.convert("RGBA")
+            out.paste(region, box)
+        out.paste(TRANSPARENT, box, white_mask(region, threshold, mode))
+
+    boxes = strip_boxes(img.size, rows)
+    if threads == 1 or len(boxes) == 1:
+        for box in boxes:
+            key_strip(box)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            # list() istisnaları (əgər varsa) burada yenidən qaldırır
+            list(pool.map(key_strip, boxes))
+    return out
+
+
+def opaque_bbox(img, rows=None):
+    """
+    Şəffaf olmayan piksellərin sərhəd qutusu (l, t, r, b); hamısı şəffafdırsa None.
+    rows verilibsə, alfa kanalı zolaq-zolaq yoxlanılır (tam ölçülü nüsxə yaranmır).
+    """
+    if rows is None:
+        return img.getchannel("A").getbbox()
+    bbox = None
+    for box in strip_boxes(img.size, rows):
+        strip_bbox = img.crop(box).getchannel("A").getbbox()
+        if strip_bbox is None:
+            continue
+        left, top, right, bottom = strip_bbox
+        top, bottom = top + box[1], bottom + box[1]
+        if bbox is None:
+            bbox = (left, top, right, bottom)
+        else:
+            bbox = (min(bbox[0], left), min(bbox[1], top), max(bbox[2], right), max(bbox[3], bottom))
+    return bbox
+
+
+def trim_transparent(img, padding=0, rows=None):
+    """
+    Şəkli şəffaf olmayan hissənin qutusuna qədər kəsir, ətrafında `padding`
+    piksel saxlayır. (kəsilmiş_şəkil, qutu) qaytarır. Şəkil tam şəffafdırsa,
+    olduğu kimi qalır.
+    """
+    bbox = opaque_bbox(img, rows)
+    if bbox is None:
+        return img, (0, 0, img.width, img.height)
+    left, top, right, bottom = bbox
+    box = (
+        max(0, left - padding),
+        max(0, top - padding),
+        min(img.width, right + padding),
+        min(img.height, bottom + padding),
+    )
+    return img.crop(box), box
+
+
+def crop_info(original_size, box, padding):
+    """Kəsmə haqqında sidecar məlumatı: layout-lar bu ofsetlərlə düzəliş edə bilər."""
+    width, height = original_size
+    left, top, right, bottom = box
+    return {
+        "original_size": [width, height],
+        "box": [left, top, right, bottom],
+        "size": [right - left, bottom - top],
+        "offset": {"left": left, "top": top, "right": width - right, "bottom": height - bottom},
+        "padding": padding,
+    }
+
+
+def sidecar_path_for(output_path):
+    """aqrar_x1.png -> aqrar_x1.crop.json"""
+    return os.path.splitext(output_path)[0] + ".crop.json"
+
+
+def written_paths(output_path, options):
+    """key_file-in bu parametrlərlə yazacağı bütün fayllar."""
+    if options.get("trim"):
+        return [output_path, sidecar_path_for(output_path)]
+    return [output_path]
+
+
+def save_image(img, output_path, output_format="png", colors=None, compress_level=6, optimize=False,
+               webp_lossless=True, webp_quality=90):
+    """
+    Açarlanmış şəkli seçilmiş formatda yazır.
+    colors - PNG üçün palitra kvantlaşdırması (məs. 16); iki rəngli loqo və
+             imzalar üçün 32 bitlik RGBA-dan xeyli kiçik fayl verir.
+    compress_level/optimize - PNG sıxılma səviyyəsi (0-9) və əlavə optimallaşdırma.
+    webp_lossless/webp_quality - WebP itkisiz və ya itkili (keyfiyyət 0-100).
+    """
+    if output_format == "webp":
+        # method=6 itkisiz rejimdə daha kiçik fayl verir, itkili rejimdə isə çox yavaşdır
+        img.save(output_path, "WEBP", lossless=webp_lossless, quality=webp_quality,
+                 method=6 if webp_lossless else 4)
+        return
+    if output_format != "png":
+        raise ValueError(f"Naməlum format: {output_format}")
+    if colors:
+        # FASTOCTREE alfa kanalını saxlayır, palitra PNG-yə tRNS kimi yazılır
+        img = img.quantize(colors, method=Image.Quantize.FASTOCTREE)
+    img.save(output_path, "PNG", compress_level=compress_level, optimize=optimize)
+
+
+def key_file(input_path, output_path, threshold=240, mode="rgb", tiled=False,
+             memory_limit=DEFAULT_MEMORY_LIMIT, threads=None, trim=False, trim_padding=0,
+             **save_options):
+    """
+    Faylı oxuyub açarlayır və yazır (heç nə çap etmir).
+    trim=True olduqda nəticə şəffaf kənarlardan təmizlənir və kəsmə ofsetləri
+    yanında <ad>.crop.json faylına yazılır.
+    save_options - save_image-ə ötürülür (output_format, colors, ...).
+    """
+    rows = None
+    with tracer.span("decode", file=os.path.basename(input_path)):
+        img = Image.open(input_path)
+        img.load()
+    with tracer.span("keying", tiled=tiled):
+        if tiled:
+            img = key_image_tiled(img, threshold, mode, memory_limit, threads)
+            rows = max(1, memory_limit // (max(img.width, 1) * WORKING_BYTES_PER_PIXEL))
+        else:
+            img = key_image(img, threshold, mode)
+
+    if trim:
+        with tracer.span("trim"):
+            original_size = img.size
+            img, box = trim_transparent(img, trim_padding, rows)
+            with open(sidecar_path_for(output_path), "w", encoding="utf-8") as f:
+                json.dump(crop_info(original_size, box, trim_padding), f, indent=2)
+    with tracer.span("encode", format=save_options.get("output_format", "png")):
+        save_image(img, output_path, **save_options)
+
+
+def remove_white_background(input_path, output_path, threshold=240, mode="rgb", **options):
     """
     Ağ fonu şəffaf edən funksiya.
-    threshold - ağ rəngin intensivlik səviyyəsi (0-255). 
+    threshold - ağ rəngin intensivlik səviyyəsi (0-255).
     Daha aşağı qoysan, az silər.
+    mode - "rgb" (hər kanal ayrıca) və ya "luminance" (parlaqlığa görə).
+    options - key_file-in əlavə parametrləri (tiled, memory_limit, threads, trim, trim_padding).
+    """
+    key_file(input_path, output_path, threshold, mode, **options)
+    print(f"✅ Yeni şəffaf şəkil yaradıldı: {output_path}")
+
+
+# --- Toplu (batch) rejim ---
+
+IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg")
+
+
+def is_known_output(path, suffix):
     """
-    img = Image.open(input_path).convert("RGBA")
-    datas = img.getdata()
+    path bu alətin nəticəsidirmi: adı suffix ilə bitir və yanında ya mənbəyi
+    (imza1.png -> imza.png/.jpg/.jpeg), ya da --trim sidecar-ı var.
+    """
+    directory = os.path.dirname(path)
+    stem = os.path.splitext(os.path.basename(path))[0]
+    if not suffix or len(stem) <= len(suffix) or not stem.endswith(suffix):
+        return False
+    if os.path.isfile(sidecar_path_for(path)):
+        return True
+    source_stem = stem[:-len(suffix)]
+    return any(os.path.isfile(os.path.join(directory, source_stem + ext))
+               for extension in IMAGE_EXTENSIONS for ext in (extension, extension.upper()))
+
 
-    new_data = []
-    for item in datas:
-        # Əgər piksel ağ rəngə yaxındırsa — şəffaf elə
-        if item[0] > threshold and item[1] > threshold and item[2] > threshold:
-            new_data.append((255, 255, 255, 0))
+def collect_inputs(patterns, skip_suffix=None, skipped=None):
+    """
+    Fayl, qovluq və glob nümunələrindən emal ediləcək şəkillərin siyahısını
+    qaytarır. skip_suffix verilibsə, qovluq/glob axtarışında yalnız alətin öz
+    nəticələri (is_known_output, məs. imza.png yanındakı imza1.png) buraxılır;
+    adı sadəcə şəkilçi ilə bitən mənbələr (aqrar_logo_1.png) emal olunur.
+    Buraxılan fayllar skipped siyahısına əlavə edilir.
+    """
+    found = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            candidates = sorted(os.path.join(pattern, name) for name in os.listdir(pattern))
+        elif os.path.isfile(pattern):
+            found.append(pattern)
+            continue
         else:
-            new_data.append(item)
+            candidates = sorted(glob.glob(pattern, recursive=True))
+        for path in candidates:
+            ext = os.path.splitext(path)[1]
+            if ext.lower() not in IMAGE_EXTENSIONS or not os.path.isfile(path):
+                continue
+            if is_known_output(path, skip_suffix):
+                if skipped is not None:
+                    skipped.append(os.path.normpath(path))
+                continue
+            found.append(path)
+    # Eyni fayl bir neçə nümunəyə uyğun gələ bilər
+    return list(dict.fromkeys(os.path.normpath(path) for path in found))
+
+
+def output_path_for(input_path, output_dir=None, suffix="1", output_format="png"):
+    """aqrar_x.png -> aqrar_x1.png (output_dir verilibsə, həmin qovluğa)."""
+    stem = os.path.splitext(os.path.basename(input_path))[0]
+    directory = output_dir or os.path.dirname(input_path)
+    return os.path.join(directory, f"{stem}{suffix}{OUTPUT_EXTENSIONS[output_format]}")
+
+
+def _process_job(job):
+    """
+    Proses hovuzunda işləyən tapşırıq: (giriş, çıxış, parametrlər, trace) -> nəticə.
+    trace=True olduqda bu prosesdə yazılmış span-lar da nəticə ilə qaytarılır.
+    """
+    input_path, output_path, options, trace = job
+    if trace:
+        tracer.enable()
+    started = time.perf_counter()
+    with tracer.span("key_file", file=os.path.basename(input_path)):
+        key_file(input_path, output_path, **options)
+    return input_path, output_path, time.perf_counter() - started, tracer.drain() if trace else None
+
+
+def process_batch(inputs, output_dir=None, suffix="1", workers=None, cache=None, **options):
+    """
+    Şəkilləri proses hovuzunda paralel açarlayır.
+    Hər fayl bitdikcə (giriş, çıxış, saniyə, keşdən_gəldi) dördlüyünü yield edir.
+    workers=1 olduqda hovuz yaradılmır, hər şey cari prosesdə gedir.
+    cache - KeyingCache; verilibsə, dəyişməmiş fayllar yenidən emal olunmur.
+    options - key_file-ə ötürülən parametrlər (threshold, mode, tiled, ...).
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    params = {name: value for name, value in options.items() if name not in OUTPUT_NEUTRAL_OPTIONS}
+
+    jobs = []
+    keys = {}
+    for path in inputs:
+        output_path = output_path_for(path, output_dir, suffix, options.get("output_format", "png"))
+        if cache is not None:
+            started = time.perf_counter()
+            with tracer.span("cache lookup", file=os.path.basename(path)):
+                key = cache.key_for(path, params)
+                hit = cache.get(key, written_paths(output_path, options))
+            if hit:
+                yield path, output_path, time.perf_counter() - started, True
+                continue
+            keys[path] = key
+        jobs.append((path, output_path, options, tracer.enabled))
+
+    def finished(result):
+        input_path, output_path, seconds, events = result
+        tracer.merge(events)
+        if input_path in keys:
+            with tracer.span("cache store", file=os.path.basename(input_path)):
+                cache.put(keys[input_path], written_paths(output_path, options))
+        return input_path, output_path, seconds, False
+
+    if workers == 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield finished(_process_job(job))
+        return
+
+    pool_size = min(workers or os.cpu_count() or 1, len(jobs))
+    if options.get("tiled"):
+        # Hər proses öz thread hovuzunu açır: CPU-lar (və ya --threads) proseslər arasında bölünür
+        threads = max(1, (options.get("threads") or os.cpu_count() or 1) // pool_size)
+        pool_options = dict(options, threads=threads)
+        jobs = [(path, output_path, pool_options, trace) for path, output_path, _options, trace in jobs]
+
+    with ProcessPoolExecutor(max_workers=pool_size) as pool:
+        futures = [pool.submit(_process_job, job) for job in jobs]
+        for future in as_completed(futures):
+            yield finished(future.result())
+
+
+def parse_threshold(value):
+    """Məs. "240" -> 240, "250,240,230" -> (250, 240, 230)."""
+    parts = [int(part) for part in value.split(",")]
+    if len(parts) == 1:
+        return parts[0]
+    if len(parts) != 3:
+        raise argparse.ArgumentTypeError("threshold ya bir, ya da üç ədəd olmalıdır")
+    return tuple(parts)
+
+
+def _format_size_change(before, after):
+    """Ölçü dəyişikliyi, məs. "61.2 KB -> 18.4 KB (-69.9%)"."""
+    change = (after - before) / before * 100 if before else 0.0
+    return f"{before / 1024:.1f} KB -> {after / 1024:.1f} KB ({change:+.1f}%)"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Şəkillərin ağ fonunu şəffaf edir (fayl, qovluq və ya glob qəbul edir)."
+    )
+    parser.add_argument("paths", nargs="+", help="fayllar, qovluqlar və ya glob nümunələri")
+    parser.add_argument("-o", "--output-dir", help="nəticələrin yazılacağı qovluq (default: mənbə ilə yanaşı)")
+    parser.add_argument("--suffix", default="1", help="çıxış faylının adına əlavə (default: 1, aqrar_x -> aqrar_x1)")
+    parser.add_argument("-t", "--threshold", type=parse_threshold, default=240,
+                        help="0-255 və ya kanal üzrə R,G,B (yalnız --mode rgb; default: 240)")
+    parser.add_argument("--mode", choices=("rgb", "luminance"), default="rgb")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count(),
+                        help="paralel proseslərin sayı (default: CPU sayı)")
+    parser.add_argument("--tiled", action="store_true",
+                        help="böyük şəkilləri zolaq-zolaq, məhdud yaddaşla emal et")
+    parser.add_argument("--memory-limit", type=int, default=DEFAULT_MEMORY_LIMIT // (1024 * 1024),
+                        help="zolaqlı rejimdə bir fayl üçün iş yaddaşı limiti, MB (default: 64)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="zolaqlı rejimdə thread sayı; bir neçə proses olduqda onlar arasında bölünür "
+                             "(default: CPU sayı)")
+    parser.add_argument("--trim", action="store_true",
+                        help="nəticəni şəffaf olmayan hissəyə qədər kəs, ofsetləri <ad>.crop.json-a yaz")
+    parser.add_argument("--trim-padding", type=int, default=0,
+                        help="kəsmədə saxlanılan kənar boşluq, piksel (default: 0)")
+    parser.add_argument("--format", dest="output_format", choices=sorted(OUTPUT_EXTENSIONS), default="png",
+                        help="çıxış formatı (default: png)")
+    parser.add_argument("--colors", type=int, default=None,
+                        help="PNG-ni bu qədər rəngli palitraya kvantlaşdır (məs. 16, maks. 256)")
+    parser.add_argument("--compress-level", type=int, choices=range(10), default=6, metavar="0-9",
+                        help="PNG sıxılma səviyyəsi (default: 6)")
+    parser.add_argument("--png-optimize", action="store_true", help="PNG üçün əlavə optimallaşdırma (yavaş)")
+    parser.add_argument("--webp-lossy", action="store_true", help="WebP-ni itkili yaz (default: itkisiz)")
+    parser.add_argument("--webp-quality", type=int, default=90, help="WebP keyfiyyəti 0-100 (default: 90)")
+    parser.add_argument("--no-cache", action="store_true", help="keşdən istifadə etmə")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="keş qovluğu")
+    parser.add_argument("--cache-max-size", type=int, default=DEFAULT_MAX_BYTES // (1024 * 1024),
+                        help="keşin maksimal ölçüsü, MB (default: 512)")
+    parser.add_argument("--cache-max-age", type=float, default=DEFAULT_MAX_AGE / 86400,
+                        help="keş qeydlərinin maksimal yaşı, gün (default: 30)")
+    parser.add_argument("--tune", action="store_true",
+                        help="faylları emal etmə: histoqramdan threshold təklif et "
+                             "(önizləmə üçün threshold_tuning.py --preview-dir)")
+    parser.add_argument("--trace", metavar="FAYL",
+                        help="mərhələ vaxtlarını Chrome trace JSON kimi yaz (chrome://tracing, Perfetto)")
+    args = parser.parse_args(argv)
+    if args.mode == "luminance" and isinstance(args.threshold, tuple):
+        parser.error("--mode luminance tək threshold qəbul edir (R,G,B yalnız --mode rgb ilə)")
+    if args.trace:
+        tracer.enable()
+
+    # Nəticələr mənbə ilə yanaşı yazılırsa, əvvəlki nəticələri yenidən emal etmə
+    skip_suffix = None if args.output_dir else args.suffix
+    skipped = []
+    inputs = collect_inputs(args.paths, skip_suffix=skip_suffix, skipped=skipped)
+    for path in dict.fromkeys(skipped):
+        print(f"⚠️  Buraxıldı (əvvəlki nəticə): {path}")
+    if not inputs:
+        print("⚠️  Emal ediləcək şəkil tapılmadı")
+        return 1
+
+    if args.tune:
+        # threshold_tuning bu moduldan idxal edir, ona görə yalnız burada yüklənir
+        from threshold_tuning import DEFAULT_PREVIEW_THRESHOLDS, format_result, tune_file
+        thresholds = sorted({*DEFAULT_PREVIEW_THRESHOLDS,
+                             *(args.threshold if isinstance(args.threshold, tuple) else (args.threshold,))})
+        for path in inputs:
+            print("\n".join(format_result(tune_file(path, args.mode), thresholds)))
+        return 0
+
+    cache = None
+    if not args.no_cache:
+        cache = KeyingCache(args.cache_dir, args.cache_max_size * 1024 * 1024, args.cache_max_age * 86400)
+
+    started = time.perf_counter()
+    total_busy = 0.0
+    hits = 0
+    options = {"threshold": args.threshold, "mode": args.mode}
+    if args.trim:
+        options.update(trim=True, trim_padding=args.trim_padding)
+    if args.output_format == "webp":
+        options.update(output_format="webp", webp_lossless=not args.webp_lossy, webp_quality=args.webp_quality)
+    else:
+        options.update(colors=args.colors, compress_level=args.compress_level, optimize=args.png_optimize)
+    if args.tiled:
+        options.update(tiled=True, memory_limit=args.memory_limit * 1024 * 1024, threads=args.threads)
+    size_before = size_after = 0
+    for input_path, output_path, seconds, cached in process_batch(
+        inputs, args.output_dir, args.suffix, args.jobs, cache, **options
+    ):
+        total_busy += seconds
+        hits += cached
+        before, after = os.path.getsize(input_path), os.path.getsize(output_path)
+        size_before += before
+        size_after += after
+        marker = "♻️ " if cached else "✅"
+        print(f"{marker} {seconds * 1000:8.1f} ms  {input_path} -> {output_path}  "
+              f"{_format_size_change(before, after)}")
+    elapsed = time.perf_counter() - started
+
+    if cache is not None:
+        with tracer.span("cache evict"):
+            evicted = cache.evict()
+        if evicted:
+            print(f"🧹 Keşdən {evicted} köhnə qeyd silindi")
+
+    print(f"\n📊 {len(inputs)} fayl, {args.jobs} proses, keşdən: {hits}")
+    print(f"   Ümumi vaxt: {elapsed:.3f} s, fayllar üzrə cəm: {total_busy:.3f} s")
+    print(f"   Orta: {total_busy / len(inputs) * 1000:.1f} ms/fayl")
+    print(f"   Ölçü: {_format_size_change(size_before, size_after)}")
+    if args.trace:
+        print()
+        tracer.finish(args.trace, out=sys.stdout)
+    return 0
 
-    img.putdata(new_data)
-    img.save(output_path, "PNG")
-    print(f"✅ Yeni şəffaf şəkil yaradıldı: {output_path}")
 
-# Nümunə istifadə:
-remove_white_background("aqrar_x.png", "aqrar_x1.png")
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,415 @@
+"""
+Sertifikat HTML-lərinin toplu yaradılması.
+
+cer.html (və istəyə görə style.css) bir dəfə "kompilyasiya" olunur: statik
+hissələr (stil, fon, loqolar, imza - data URI kimi) hazır sətir fraqmentlərinə
+çevrilir, dinamik yerlər (data-generate="Dinamik") isə slotlara. Hər sertifikat
+üçün yalnız slotlar doldurulur, qalan hər şey paylaşılır.
+
+Qaydalar CertificateGeneratorService::createCertificateHtml ilə eynidir:
+sertifikat nömrəsi AZ-<il>-<user_id:06d>, tarix "d / m / Y", ad-soyad üçün
+first_name/last_name -> username -> email fallback-ı, təsvir üçün "az" dili.
+
+PDF çevrilməsi ayrıca mərhələdir və PDF_BACKENDS-dən seçilir ("none" - yalnız
+HTML, "chrome" - headless Chrome), beləliklə HTML mərhələsi tək ölçülə bilər.
+
+İstifadə:
+    python render_certificates.py records.json -o out/
+    python render_certificates.py records.csv -o out/ -j 8 --qr --pdf-backend chrome
+"""
+
+import argparse
+import base64
+import csv
+import hashlib
+import html
+import json
+import mimetypes
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from html.parser import HTMLParser
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_TEMPLATE = os.path.join(HERE, "cer.html")
+DEFAULT_BUNDLE = os.path.join(HERE, "assets.bundle.json")
+DEFAULT_BASE_URL = "http://localhost:8000"
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+DATE_PATTERN = re.compile(r"\d{2}\s*/\s*\d{2}\s*/\s*\d{4}")
+SRC_PATTERN = re.compile(r'src="([^"]+)"')
+STYLE_PATTERN = re.compile(r"(<style[^>]*>)(.*?)(</style>)", re.S | re.I)
+
+
+# --- Şablonun kompilyasiyası ---
+
+class _SlotFinder(HTMLParser):
+    """data-generate="Dinamik" elementlərinin mətndəki yerlərini tapır."""
+
+    def __init__(self, text):
+        super().__init__(convert_charrefs=True)
+        # getpos() sətirləri yalnız "\n" ilə sayır
+        self.line_offsets = [0]
+        for line in text.split("\n"):
+            self.line_offsets.append(self.line_offsets[-1] + len(line) + 1)
+        self.stack = []
+        self.pending = None
+        self.slots = []
+
+    def _offset(self):
+        line, column = self.getpos()
+        return self.line_offsets[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        offset = self._offset()
+        start_tag = self.get_starttag_text()
+        if attrs.get("data-generate") == "Dinamik":
+            if tag == "img":
+                match = SRC_PATTERN.search(start_tag)
+                self.slots.append((offset + match.start(1), offset + match.end(1), "qr_src"))
+            else:
+                parent_class = self.stack[-1][1].get("class", "") if self.stack else ""
+                self.pending = {"tag": tag, "start": offset + len(start_tag), "parent_class": parent_class,
+                                "text": ""}
+        if tag not in VOID_ELEMENTS:
+            self.stack.append((tag, attrs))
+
+    def handle_data(self, data):
+        if self.pending is not None:
+            self.pending["text"] += data
+
+    def handle_endtag(self, tag):
+        if self.pending is not None and tag == self.pending["tag"]:
+            name = self._classify(self.pending)
+            if name:
+                self.slots.append((self.pending["start"], self._offset(), name))
+            self.pending = None
+        if self.stack and self.stack[-1][0] == tag:
+            self.stack.pop()
+
+    @staticmethod
+    def _classify(element):
+        """PHP servisindəki qaydalarla eyni: mətnə və valideynə görə slotun adı."""
+        text = element["text"].strip()
+        if text.startswith("AZ-"):
+            return "certificate_number"
+        if DATE_PATTERN.search(text):
+            return "issue_date"
+        if element["parent_class"] == "main_content_user":
+            return "full_name" if element["tag"] == "h2" else "description"
+        return None
+
+
+class CompiledTemplate:
+    """
+    Statik fraqmentlər (UTF-8 bayt kimi, bir dəfə kodlanmış) və onların
+    arasındakı slot adları. defaults - şablondakı ilkin slot dəyərləri.
+    """
+
+    def __init__(self, parts, slots, defaults, version):
+        self.parts = [part.encode("utf-8") for part in parts]
+        self.slots = slots
+        self.defaults = defaults
+        self.version = version
+
+    def chunks(self, values):
+        """values - slot adı -> artıq escape olunmuş sətir; olmayanlar üçün default."""
+        yield self.parts[0]
+        for name, part in zip(self.slots, self.parts[1:]):
+            value = values.get(name)
+            yield (self.defaults[name] if value is None else value).encode("utf-8")
+            yield part
+
+    def render(self, values):
+        return b"".join(self.chunks(values)).decode("utf-8")
+
+
+def load_asset_uris(template_dir, bundle_path=DEFAULT_BUNDLE):
+    """Şəkil adı -> data URI. build_asset_bundle.py paketi varsa ondan, yoxdursa fayllardan."""
+    if bundle_path and os.path.exists(bundle_path):
+        with open(bundle_path, encoding="utf-8") as f:
+            return json.load(f)["assets"]
+    uris = {}
+    for name in os.listdir(template_dir):
+        mime = mimetypes.guess_type(name)[0]
+        if mime and mime.startswith("image/"):
+            with open(os.path.join(template_dir, name), "rb") as f:
+                uris[name] = f"data:{mime};base64,{base64.b64encode(f.read()).decode('ascii')}"
+    return uris
+
+
+def compile_template(template_path=DEFAULT_TEMPLATE, css_path=None, bundle_path=DEFAULT_BUNDLE):
+    """
+    Şablonu bir dəfə təhlil edib CompiledTemplate qaytarır.
+    css_path verilibsə, <style> blokunun məzmunu həmin faylla əvəz olunur.
+    Nisbi şəkil yolları (/bg_3.png) data URI-lərlə əvəz olunur.
+    """
+    with open(template_path, encoding="utf-8") as f:
+        text = f.read()
+    if css_path:
+        with open(css_path, encoding="utf-8") as f:
+            css = f.read()
+        text = STYLE_PATTERN.sub(lambda m: m.group(1) + css + m.group(3), text, count=1)
+
+    finder = _SlotFinder(text)
+    finder.feed(text)
+    finder.close()
+    spans = sorted(finder.slots)
+
+    assets = load_asset_uris(os.path.dirname(os.path.abspath(template_path)), bundle_path)
+
+    def inline_images(fragment):
+        def replace(match):
+            uri = assets.get(match.group(1).lstrip("/"))
+            return f'src="{uri}"' if uri else match.group(0)
+        return SRC_PATTERN.sub(replace, fragment)
+
+    parts, slots, defaults, position = [], [], {}, 0
+    for start, end, name in spans:
+        parts.append(inline_images(text[position:start]))
+        slots.append(name)
+        default = text[start:end]
+        if name == "qr_src":
+            default = assets.get(default.lstrip("/"), default)
+        defaults[name] = default
+        position = end
+    parts.append(inline_images(text[position:]))
+
+    version = hashlib.sha256("\0".join(parts + slots).encode()).hexdigest()[:12]
+    return CompiledTemplate(parts, slots, defaults, version)
+
+
+# --- Qeydlər ---
+
+def load_records(path):
+    """CSV və ya JSON (siyahı və ya {"records": [...]}) faylından qeydlər."""
+    if path.lower().endswith(".csv"):
+        with open(path, newline="", encoding="utf-8-sig") as f:
+            return list(csv.DictReader(f))
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    return data["records"] if isinstance(data, dict) else data
+
+
+def _flatten(record):
+    """PHP-dəki $userData/$examData/$trainingData formasını düz açarlara çevirir."""
+    flat = {key: value for key, value in record.items() if not isinstance(value, dict)}
+    for prefix in ("user", "exam", "training"):
+        nested = record.get(prefix)
+        if isinstance(nested, dict):
+            for key, value in nested.items():
+                flat.setdefault(f"{prefix}_{key}" if key in ("id", "title", "description") else key, value)
+    return flat
+
+
+def full_name(record):
+    first, last = (record.get("first_name") or "").strip(), (record.get("last_name") or "").strip()
+    if first and last:
+        return f"{first} {last}"
+    if first:
+        return first
+    if record.get("username"):
+        return record["username"]
+    if record.get("email"):
+        return record["email"].split("@")[0]
+    return "İstifadəçi"
+
+
+def certificate_description(record):
+    description = record.get("certificate_description")
+    if isinstance(description, str) and description.strip().startswith("{"):
+        try:
+            description = json.loads(description)
+        except ValueError:
+            pass
+    if isinstance(description, dict):
+        return description.get("az") or next(iter(description.values()), "") or ""
+    return (description or "").strip()
+
+
+def certificate_context(record, issued_at, base_url=DEFAULT_BASE_URL, index=0):
+    """
+    Bir qeyd üçün slot dəyərləri (escape olunmuş) və metadata. issued_at bütün
+    partiya üçün eynidir, ona görə hesablanan imzaya qeydin sertifikat nömrəsi
+    və partiyadakı sırası (index) da daxildir - eyni istifadəçi/imtahan üçün
+    iki qeyd bir-birinin faylını əzmir.
+    """
+    record = _flatten(record)
+    user_id = int(record.get("user_id") or record.get("id") or 0)
+    signature = record.get("digital_signature") or hashlib.sha256(
+        "{}_{}_{}_{}_{}_{}_{}_{}".format(
+            user_id, record.get("exam_id", ""), record.get("exam_title", ""),
+            record.get("first_name", ""), record.get("last_name", ""), issued_at.isoformat(),
+            record.get("certificate_number", ""), index,
+        ).encode()
+    ).hexdigest()
+    pdf_url = f"{base_url.rstrip('/')}/storage/certificates/certificate_{signature}.pdf"
+    return {
+        "signature": signature,
+        "pdf_url": pdf_url,
+        "values": {
+            "certificate_number": html.escape(
+                record.get("certificate_number") or f"AZ-{issued_at.year}-{user_id:06d}", quote=False),
+            "issue_date": html.escape(issued_at.strftime("%d / %m / %Y"), quote=False),
+            "full_name": html.escape(full_name(record), quote=False),
+            "description": html.escape(certificate_description(record), quote=False),
+            "qr_src": html.escape(record["qr_src"]) if record.get("qr_src") else None,
+        },
+    }
+
+
+# --- Toplu render ---
+
+_worker_template = None
+
+
+def _init_worker(template):
+    global _worker_template
+    _worker_template = template
+
+
+def _render_chunk(args):
+    """İşçi prosesdə bir qrup sertifikatı yazır, (imza, html_yolu) siyahısı qaytarır."""
+    contexts, output_dir = args
+    written = []
+    for context in contexts:
+        path = os.path.join(output_dir, f"certificate_{context['signature']}.html")
+        with open(path, "wb") as f:
+            f.writelines(_worker_template.chunks(context["values"]))
+        written.append((context["signature"], path))
+    return written
+
+
+def render_batch(template, contexts, output_dir, workers=None, chunk_size=200):
+    """Kontekstləri qruplara bölüb proses hovuzunda HTML fayllarına yazır."""
+    os.makedirs(output_dir, exist_ok=True)
+    chunks = [(contexts[i:i + chunk_size], output_dir) for i in range(0, len(contexts), chunk_size)]
+    if workers == 1 or len(chunks) <= 1:
+        _init_worker(template)
+        return [item for chunk in chunks for item in _render_chunk(chunk)]
+    written = []
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(template,)) as pool:
+        for result in pool.map(_render_chunk, chunks):
+            written.extend(result)
+    return written
+
+
+# --- PDF backend-ləri ---
+
+class NullPdfBackend:
+    """PDF yaratmır - HTML mərhələsini ayrıca ölçmək və yoxlamaq üçün."""
+
+    def convert(self, html_path, pdf_path):
+        return False
+
+
+class ChromePdfBackend:
+    """Headless Chrome ilə PDF (PHP servisindəki generatePdf ilə eyni parametrlər)."""
+
+    CANDIDATES = ("google-chrome", "chromium", "chromium-browser", "chrome")
+
+    def __init__(self, executable=None):
+        self.executable = executable or next(
+            (path for path in map(shutil.which, self.CANDIDATES) if path), None)
+        if not self.executable:
+            raise RuntimeError("Chrome/Chromium tapılmadı")
+
+    def convert(self, html_path, pdf_path):
+        with tempfile.TemporaryDirectory(prefix="chrome_user_data_") as user_data_dir:
+            result = subprocess.run([
+                self.executable, "--headless=new", "--no-sandbox", "--disable-dev-shm-usage",
+                "--disable-gpu", "--disable-software-rasterizer", "--run-all-compositor-stages-before-draw",
+                "--virtual-time-budget=5000", f"--user-data-dir={user_data_dir}",
+                f"--print-to-pdf={pdf_path}", "--print-to-pdf-no-header",
+                "file://" + os.path.abspath(html_path),
+            ], capture_output=True)
+        return result.returncode == 0 and os.path.exists(pdf_path)
+
+
+PDF_BACKENDS = {"none": NullPdfBackend, "chrome": ChromePdfBackend}
+
+
+def _convert_one(args):
+    backend_name, html_path = args
+    pdf_path = os.path.splitext(html_path)[0] + ".pdf"
+    return html_path, PDF_BACKENDS[backend_name]().convert(html_path, pdf_path)
+
+
+def convert_batch(backend_name, html_paths, workers=None):
+    """HTML fayllarını seçilmiş backend ilə paralel PDF-ə çevirir."""
+    if backend_name == "none":
+        return []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_convert_one, [(backend_name, path) for path in html_paths]))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sertifikat HTML-lərini (və PDF-lərini) toplu yaradır.")
+    parser.add_argument("records", help="qeydlər: CSV və ya JSON")
+    parser.add_argument("-o", "--output-dir", required=True)
+    parser.add_argument("--template", default=DEFAULT_TEMPLATE)
+    parser.add_argument("--css", default=None, help="<style> blokunu bu faylla əvəz et (məs. style.css)")
+    parser.add_argument("--bundle", default=DEFAULT_BUNDLE, help="build_asset_bundle.py --format json nəticəsi")
+    parser.add_argument("--base-url", default=DEFAULT_BASE_URL, help="PDF linkləri üçün tətbiqin ünvanı")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--chunk-size", type=int, default=200, help="bir işçiyə bir dəfədə verilən qeyd sayı")
+    parser.add_argument("--pdf-backend", choices=sorted(PDF_BACKENDS), default="none")
+    parser.add_argument("--qr", action="store_true",
+                        help="hər sertifikat üçün PDF linkinin QR kodunu yarat (qr_codes.py, keşlə)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    template = compile_template(args.template, args.css, args.bundle)
+    compiled = time.perf_counter()
+
+    issued_at = datetime.now().astimezone()
+    contexts = [certificate_context(record, issued_at, args.base_url, index)
+                for index, record in enumerate(load_records(args.records))]
+    # Qeyddə verilmiş digital_signature təkrarlana bilər: eyni fayl adı bir-birini əzərdi
+    duplicates = [signature for signature, count in Counter(context["signature"] for context in contexts).items()
+                  if count > 1]
+    if duplicates:
+        for signature in duplicates:
+            print(f"❌ Təkrarlanan imza: {signature}")
+        return 1
+    if args.qr:
+        # segno yalnız QR lazım olanda tələb olunur
+        from qr_codes import DEFAULT_CACHE_DIR as QR_CACHE_DIR, bulk_qr, svg_data_uri
+        from keying_cache import KeyingCache
+
+        svgs = bulk_qr([context["pdf_url"] for context in contexts], workers=args.jobs,
+                       cache=KeyingCache(QR_CACHE_DIR))
+        for context in contexts:
+            context["values"]["qr_src"] = svg_data_uri(svgs[context["pdf_url"]])
+    prepared = time.perf_counter()
+
+    written = render_batch(template, contexts, args.output_dir, args.jobs, args.chunk_size)
+    rendered = time.perf_counter()
+
+    converted = convert_batch(args.pdf_backend, [path for _signature, path in written], args.jobs)
+    finished = time.perf_counter()
+
+    print(f"✅ Şablon {template.version} kompilyasiya olundu: {(compiled - started) * 1000:.1f} ms "
+          f"({len(template.slots)} slot)")
+    print(f"✅ {len(contexts)} qeyd hazırlandı: {(prepared - compiled) * 1000:.1f} ms")
+    files = len({path for _signature, path in written})
+    print(f"✅ {files} HTML yazıldı: {(rendered - prepared) * 1000:.1f} ms "
+          f"({files / max(rendered - prepared, 1e-9):.0f} sertifikat/s)")
+    if args.pdf_backend != "none":
+        failed = [path for path, ok in converted if not ok]
+        print(f"✅ {len(converted) - len(failed)} PDF yaradıldı ({args.pdf_backend}): {finished - rendered:.2f} s")
+        for path in failed:
+            print(f"❌ PDF alınmadı: {path}")
+        return 1 if failed else 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,240 @@
+"""
+Ağ fonun silinməsi üçün threshold seçimi (tuning rejimi).
+
+remove_white_background pikseli yalnız min(R, G, B) > threshold olduqda
+(luminance rejimində L > threshold) şəffaf edir. Ona görə şəkil bir dəfə
+oxunur və həmin dəyərin 256 elementli histoqramı qurulur (Pillow-un C
+kodunda, Python dövrü yoxdur). Histoqramın kumulyativ cəmi 0-255 arası
+istənilən threshold üçün neçə pikselin şəffaf olacağını sabit vaxtda
+verir - hər threshold üçün şəkli yenidən emal etməyə ehtiyac qalmır.
+
+Təklif olunan threshold fon (ağ) zirvəsi ilə ön plan arasındakı
+çuxurdur (valley). Seçilmiş threshold-lar üçün kiçik önizləmə zolağı da
+çəkilə bilər: şəkil əvvəlcə kiçildilir, sonra hər threshold ilə açarlanır.
+
+İstifadə:
+    python threshold_tuning.py aqrar_x.png
+    python threshold_tuning.py . --at 200,220,240,250 --preview-dir /tmp/tune
+"""
+
+import argparse
+import json
+import os
+import time
+
+from PIL import Image, ImageChops, ImageDraw
+
+from remove_white_background import collect_inputs, key_image
+
+DEFAULT_PREVIEW_THRESHOLDS = (200, 220, 240, 250)
+DEFAULT_PREVIEW_HEIGHT = 160
+# Fon zirvəsində (±SMOOTHING_RADIUS) bu hissədən az piksel varsa, şəkildə ağ fon yoxdur
+MIN_BACKGROUND_FRACTION = 0.05
+# Fon zirvəsi bu dəyərdən yuxarıda axtarılır
+BACKGROUND_FLOOR = 192
+# Çuxurun dibi sayılan səviyyə: minimum + bütün piksellərin bu hissəsi (səs-küy)
+VALLEY_TOLERANCE = 0.0005
+SMOOTHING_RADIUS = 2
+
+
+def value_histogram(img, mode="rgb"):
+    """
+    Hər pikselin min(R, G, B) (luminance rejimində L) dəyərinin histoqramı.
+    Artıq tam şəffaf olan piksellər sayılmır.
+    """
+    mask = None
+    if "A" in img.mode or "transparency" in img.info:
+        img = img.convert("RGBA")
+        mask = img.getchannel("A").point(lambda a: 255 if a else 0)
+    if mode == "luminance":
+        values = img.convert("L")
+    elif mode == "rgb":
+        if img.mode not in ("RGB", "RGBA"):
+            img = img.convert("RGB")
+        r, g, b = (img.getchannel(band) for band in "RGB")
+        values = ImageChops.darker(ImageChops.darker(r, g), b)
+    else:
+        raise ValueError(f"Naməlum rejim: {mode}")
+    return values.histogram(mask)
+
+
+class ThresholdHistogram:
+    """Histoqram + hər threshold üçün şəffaf olacaq piksellərin sayı (O(1) sorğu)."""
+
+    def __init__(self, histogram):
+        self.histogram = list(histogram)
+        self.total = sum(self.histogram)
+        # above[t] = dəyəri t-dən böyük olan piksellər
+        self.above = [0] * 256
+        running = 0
+        for value in range(255, -1, -1):
+            self.above[value] = running
+            running += self.histogram[value]
+
+    @classmethod
+    def from_image(cls, img, mode="rgb"):
+        return cls(value_histogram(img, mode))
+
+    def transparent(self, threshold):
+        return self.above[threshold]
+
+    def fraction(self, threshold):
+        return self.above[threshold] / self.total if self.total else 0.0
+
+    def suggest(self):
+        """
+        Fon zirvəsi ilə ön plan zirvəsi arasındakı çuxur; fon (ağ) zirvəsi və
+        ya aralarında çuxur yoxdursa None. Çuxur düz olduqda (bir neçə threshold demək olar ki,
+        eyni nəticəni verir) fona ən yaxın düz hissənin ortası seçilir.
+        """
+        if self.total == 0:
+            return None
+        smooth = _smooth(self.histogram, SMOOTHING_RADIUS)
+        background = max(range(BACKGROUND_FLOOR, 256), key=lambda value: smooth[value])
+        peak = self.histogram[max(0, background - SMOOTHING_RADIUS):background + SMOOTHING_RADIUS + 1]
+        if sum(peak) < self.total * MIN_BACKGROUND_FRACTION:
+            return None
+        # Fon zirvəsinin yamacı ilə ilk yerli minimuma qədər enilir; ön plan
+        # zirvəsi ondan aşağıda ən böyük dəyərdir
+        foot = background
+        while foot > 0 and smooth[foot - 1] <= smooth[foot]:
+            foot -= 1
+        if foot == 0:
+            return None
+        foreground = max(range(foot), key=lambda value: smooth[value])
+        if foreground + 1 >= background:
+            # Zirvələr yan-yanadır, aralarında çuxur yoxdur
+            return None
+        floor = min(smooth[foreground + 1:background]) + self.total * VALLEY_TOLERANCE
+        # Dibə düşən nöqtələrin fona ən yaxın ardıcıl zolağı (fonun ətəyi)
+        end = max(value for value in range(foreground + 1, background) if smooth[value] <= floor)
+        start = end
+        while start - 1 > foreground and smooth[start - 1] <= floor:
+            start -= 1
+        return (start + end) // 2
+
+
+def _smooth(values, radius):
+    """Sürüşən orta (kənarlarda pəncərə qısalır)."""
+    prefix = [0]
+    for value in values:
+        prefix.append(prefix[-1] + value)
+    size = len(values)
+    return [(prefix[min(size, i + radius + 1)] - prefix[max(0, i - radius)])
+            / (min(size, i + radius + 1) - max(0, i - radius)) for i in range(size)]
+
+
+def _checkerboard(size, cell=8):
+    board = Image.new("RGBA", size, (255, 255, 255, 255))
+    draw = ImageDraw.Draw(board)
+    for top in range(0, size[1], cell):
+        for left in range((top // cell) % 2 * cell, size[0], cell * 2):
+            draw.rectangle((left, top, left + cell - 1, top + cell - 1), fill=(204, 204, 204, 255))
+    return board
+
+
+def preview_strip(img, thresholds=DEFAULT_PREVIEW_THRESHOLDS, mode="rgb", height=DEFAULT_PREVIEW_HEIGHT,
+                  histogram=None):
+    """
+    Hər threshold üçün kiçildilmiş, açarlanmış şəkil (dama fonu üzərində)
+    yan-yana bir zolaqda; altında threshold və şəffaf piksellərin faizi.
+    """
+    thumbnail = img.convert("RGBA")
+    thumbnail.thumbnail((max(1, img.width * height // max(img.height, 1)), height))
+    label_height = 16
+    tile_width, tile_height = thumbnail.size
+    strip = Image.new("RGBA", (tile_width * len(thresholds), tile_height + label_height), (255, 255, 255, 255))
+    draw = ImageDraw.Draw(strip)
+    board = _checkerboard(thumbnail.size)
+    for index, threshold in enumerate(thresholds):
+        tile = Image.alpha_composite(board, key_image(thumbnail, threshold, mode))
+        strip.paste(tile, (index * tile_width, 0))
+        label = f"{threshold}"
+        if histogram is not None:
+            label += f"  {histogram.fraction(threshold) * 100:.1f}%"
+        draw.text((index * tile_width + 4, tile_height + 2), label, fill=(0, 0, 0, 255))
+    return strip.convert("RGB")
+
+
+def tune_file(path, mode="rgb", thresholds=DEFAULT_PREVIEW_THRESHOLDS, preview_dir=None,
+              preview_height=DEFAULT_PREVIEW_HEIGHT):
+    """Bir şəkil üçün nəticə: histoqram, təklif və (istənilibsə) önizləmə faylı."""
+    with Image.open(path) as img:
+        histogram = ThresholdHistogram.from_image(img, mode)
+        preview = None
+        if preview_dir:
+            os.makedirs(preview_dir, exist_ok=True)
+            stem = os.path.splitext(os.path.basename(path))[0]
+            preview = os.path.join(preview_dir, f"{stem}.tune.png")
+            preview_strip(img, thresholds, mode, preview_height, histogram).save(preview)
+    return {
+        "path": path,
+        "pixels": histogram.total,
+        "suggested": histogram.suggest(),
+        "transparent": [histogram.transparent(threshold) for threshold in range(256)],
+        "preview": preview,
+        "histogram": histogram,
+    }
+
+
+def format_result(result, thresholds):
+    histogram = result["histogram"]
+    suggested = result["suggested"]
+    lines = [f"🎯 {result['path']}: {result['pixels']} piksel, təklif olunan threshold: "
+             + (f"{suggested} ({histogram.fraction(suggested) * 100:.1f}% şəffaf)"
+                if suggested is not None else "yoxdur (ağ fon və ya çuxur tapılmadı)")]
+    lines.append("   " + "  ".join(f"{threshold}: {histogram.fraction(threshold) * 100:5.1f}%"
+                                   for threshold in thresholds))
+    if result["preview"]:
+        lines.append(f"   Önizləmə: {result['preview']}")
+    return lines
+
+
+def parse_thresholds(value):
+    """Məs. "200,220,240" -> (200, 220, 240)."""
+    thresholds = tuple(int(part) for part in value.split(","))
+    if not all(0 <= threshold <= 255 for threshold in thresholds):
+        raise argparse.ArgumentTypeError("threshold 0-255 arası olmalıdır")
+    return thresholds
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Histoqram əsasında ağ fon threshold-unu seçir.")
+    parser.add_argument("paths", nargs="+", help="fayllar, qovluqlar və ya glob nümunələri")
+    parser.add_argument("--mode", choices=("rgb", "luminance"), default="rgb")
+    parser.add_argument("--at", type=parse_thresholds, default=DEFAULT_PREVIEW_THRESHOLDS,
+                        help="cədvəl və önizləmə üçün threshold-lar (default: 200,220,240,250)")
+    parser.add_argument("--preview-dir", help="önizləmə zolaqlarının (<ad>.tune.png) yazılacağı qovluq")
+    parser.add_argument("--preview-height", type=int, default=DEFAULT_PREVIEW_HEIGHT)
+    parser.add_argument("--json", metavar="FAYL", help="bütün 256 threshold üçün sayları JSON-a yaz")
+    parser.add_argument("--skip-suffix", default="1",
+                        help="qovluq/glob axtarışında buraxılan nəticə fayllarının şəkilçisi; yalnız mənbəyi "
+                             "və ya sidecar-ı olanlar buraxılır (default: 1, məs. imza.png yanındakı imza1.png)")
+    args = parser.parse_args(argv)
+
+    skipped = []
+    inputs = collect_inputs(args.paths, skip_suffix=args.skip_suffix or None, skipped=skipped)
+    for path in dict.fromkeys(skipped):
+        print(f"⚠️  Buraxıldı (əvvəlki nəticə): {path}")
+    if not inputs:
+        print("⚠️  Şəkil tapılmadı")
+        return 1
+
+    started = time.perf_counter()
+    results = []
+    for path in inputs:
+        result = tune_file(path, args.mode, args.at, args.preview_dir, args.preview_height)
+        results.append(result)
+        print("\n".join(format_result(result, args.at)))
+    elapsed = time.perf_counter() - started
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump([{key: value for key, value in result.items() if key != "histogram"} for result in results],
+                      f, indent=2)
+    print(f"\n📊 {len(inputs)} şəkil, {elapsed * 1000:.1f} ms (şəkil başına bir keçid)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
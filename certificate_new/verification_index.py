@@ -0,0 +1,373 @@
+"""
+Sertifikatların oflayn, toplu yoxlanışı üçün indeks.
+
+Tərəfdaşların göndərdiyi minlərlə sertifikat nömrəsini bir-bir
+/api/v1/certificates/{certificateNumber}/verify ilə yoxlamaq əvəzinə,
+certificates cədvəlinin lokal ixracından (export) bir indeks faylı
+qurulur və bütün CSV bir keçiddə onunla yoxlanılır.
+
+İndeks bir fayldır və mmap ilə açılır (yaddaşa tam oxunmur):
+  * başlıq (format versiyası, qeyd ölçüsü, say, qurulma vaxtı)
+  * Bloom filtri - indeksdə olmayan nömrə/imzalar üçün diskə toxunmadan
+    sürətli "yoxdur" cavabı
+  * nömrəyə görə sıralanmış sabit enli qeydlər: nömrə, imzanın SHA-256
+    hash-inin ilk 16 baytı, status, bitmə tarixi
+  * imza hash-inə görə sıralanmış (hash, qeyd nömrəsi) cədvəli
+
+Status Certificate modelindəki kimi hesablanır: status "active" və
+bitmə tarixi çatmayıbsa - etibarlıdır (isActive). İndeks ixrac anının
+şəklidir; sonradan ləğv edilənlər yalnız yenidən qurulandan sonra görünür.
+
+İxrac: başlığında certificate_number, digital_signature, status,
+expiry_date sütunları olan CSV/TSV (məs. mysql --batch nəticəsi) və ya
+eyni sahəli JSON massivi / JSON Lines.
+
+İstifadə:
+    python verification_index.py build certificates.tsv -o certificates.vidx
+    python verification_index.py verify certificates.vidx partner.csv -o partner.verified.csv
+"""
+
+import argparse
+import csv
+import datetime
+import hashlib
+import json
+import math
+import mmap
+import os
+import struct
+import time
+
+MAGIC = b"CVIX"
+FORMAT_VERSION = 1
+# magic, versiya, nömrə sahəsinin eni, qeyd ölçüsü, say, imza sayı, Bloom bitləri, hash sayı, qurulma vaxtı
+HEADER = struct.Struct("<4sHHIQQQIq")
+SIGNATURE_ENTRY = struct.Struct("<16sI")
+SIGNATURE_HASH_SIZE = 16
+
+STATUSES = ("active", "revoked", "expired")
+NO_EXPIRY = 2 ** 31 - 1
+EPOCH = datetime.date(1970, 1, 1)
+DEFAULT_FP_RATE = 0.01
+
+# Yoxlama nəticələri
+VALID = "valid"
+EXPIRED = "expired"
+REVOKED = "revoked"
+NOT_FOUND = "not_found"
+
+
+def signature_hash(signature):
+    return hashlib.sha256(signature.encode("utf-8")).digest()[:SIGNATURE_HASH_SIZE]
+
+
+def _record_struct(number_width):
+    return struct.Struct(f"<{number_width}s{SIGNATURE_HASH_SIZE}sBi")
+
+
+def _bloom_positions(key, bits, hashes):
+    """Double hashing: h1 + i*h2 (Kirsch-Mitzenmacher)."""
+    digest = hashlib.blake2b(key, digest_size=16).digest()
+    h1 = int.from_bytes(digest[:8], "little")
+    h2 = int.from_bytes(digest[8:], "little") | 1
+    return [(h1 + i * h2) % bits for i in range(hashes)]
+
+
+def bloom_size(count, fp_rate=DEFAULT_FP_RATE):
+    """(bit sayı, hash sayı) - count element və fp_rate yalançı müsbət ehtimalı üçün."""
+    count = max(count, 1)
+    bits = max(64, math.ceil(-count * math.log(fp_rate) / math.log(2) ** 2))
+    return bits, max(1, round(bits / count * math.log(2)))
+
+
+def _number_key(number):
+    return b"n" + number.encode("utf-8")
+
+
+def _signature_key(digest):
+    return b"s" + digest
+
+
+def _parse_date(value):
+    """"2026-05-01" / "2026-05-01 00:00:00" / "01.05.2026" -> date; boş və ya NULL -> None."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    if not value or value.upper() == "NULL":
+        return None
+    for pattern in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.datetime.strptime(value[:10], pattern).date()
+        except ValueError:
+            continue
+    raise ValueError(f"Tarix tanınmadı: {value!r}")
+
+
+def _clean(value):
+    if value is None:
+        return None
+    value = str(value).strip()
+    return None if not value or value.upper() == "NULL" else value
+
+
+def read_export(path):
+    """İxrac faylının sətirləri (dict) - CSV/TSV, JSON massivi və ya JSON Lines."""
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        head = f.read(4096)
+        f.seek(0)
+        stripped = head.lstrip()
+        if stripped.startswith("["):
+            yield from json.load(f)
+        elif stripped.startswith("{"):
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+        else:
+            delimiter = "\t" if "\t" in head.split("\n", 1)[0] else ","
+            yield from csv.DictReader(f, delimiter=delimiter)
+
+
+def build_index(rows, path, fp_rate=DEFAULT_FP_RATE):
+    """İxrac sətirlərindən indeks faylı qurur; (qeyd sayı, təkrarlanan nömrələr) qaytarır."""
+    records = {}
+    duplicates = 0
+    for row in rows:
+        number = _clean(row.get("certificate_number"))
+        if number is None:
+            continue
+        status = _clean(row.get("status")) or "active"
+        if status not in STATUSES:
+            raise ValueError(f"Naməlum status {status!r}: {number}")
+        signature = _clean(row.get("digital_signature"))
+        expiry = _parse_date(row.get("expiry_date"))
+        if number in records:
+            duplicates += 1
+        records[number] = (
+            signature_hash(signature) if signature else b"",
+            STATUSES.index(status),
+            (expiry - EPOCH).days if expiry else NO_EXPIRY,
+        )
+
+    numbers = sorted(records, key=lambda number: number.encode("utf-8"))
+    number_width = max((len(number.encode("utf-8")) for number in numbers), default=1)
+    record = _record_struct(number_width)
+    signatures = sorted((records[number][0], index) for index, number in enumerate(numbers) if records[number][0])
+    bits, hashes = bloom_size(len(numbers) + len(signatures), fp_rate)
+    bloom = bytearray((bits + 7) // 8)
+    for number in numbers:
+        for position in _bloom_positions(_number_key(number), bits, hashes):
+            bloom[position >> 3] |= 1 << (position & 7)
+    for digest, _index in signatures:
+        for position in _bloom_positions(_signature_key(digest), bits, hashes):
+            bloom[position >> 3] |= 1 << (position & 7)
+
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, FORMAT_VERSION, number_width, record.size, len(numbers), len(signatures),
+                            bits, hashes, int(time.time())))
+        f.write(bloom)
+        for number in numbers:
+            digest, status, expiry = records[number]
+            f.write(record.pack(number.encode("utf-8"), digest.ljust(SIGNATURE_HASH_SIZE, b"\0"), status, expiry))
+        for digest, index in signatures:
+            f.write(SIGNATURE_ENTRY.pack(digest, index))
+    os.replace(tmp_path, path)
+    return len(numbers), duplicates
+
+
+class VerificationIndex:
+    """mmap ilə açılmış indeks: nömrə və ya imza ilə O(log n) axtarış, Bloom ilə sürətli "yoxdur"."""
+
+    def __init__(self, path):
+        self._file = open(path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        (magic, version, self.number_width, record_size, self.count, self.signature_count,
+         self.bloom_bits, self.bloom_hashes, self.built_at) = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"{path}: yoxlama indeksi deyil (və ya köhnə versiyadır)")
+        self._record = _record_struct(self.number_width)
+        if self._record.size != record_size:
+            raise ValueError(f"{path}: qeyd ölçüsü uyğun gəlmir")
+        self._bloom_offset = HEADER.size
+        self._records_offset = self._bloom_offset + (self.bloom_bits + 7) // 8
+        self._signatures_offset = self._records_offset + self.count * record_size
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def might_contain(self, key):
+        data, offset = self._map, self._bloom_offset
+        return all(data[offset + (position >> 3)] >> (position & 7) & 1
+                   for position in _bloom_positions(key, self.bloom_bits, self.bloom_hashes))
+
+    def _record_at(self, index):
+        return self._record.unpack_from(self._map, self._records_offset + index * self._record.size)
+
+    def _decode(self, fields):
+        number, _digest, status, expiry = fields
+        return (number.rstrip(b"\0").decode("utf-8"), STATUSES[status],
+                None if expiry == NO_EXPIRY else EPOCH + datetime.timedelta(days=expiry))
+
+    def find_number(self, number):
+        """(nömrə, status, bitmə tarixi) və ya None."""
+        raw = number.encode("utf-8")
+        if len(raw) > self.number_width or not self.might_contain(_number_key(number)):
+            return None
+        key = raw.ljust(self.number_width, b"\0")
+        size, offset, data = self._record.size, self._records_offset, self._map
+        low, high = 0, self.count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * size
+            if data[start:start + self.number_width] < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.count:
+            fields = self._record_at(low)
+            if fields[0] == key:
+                return self._decode(fields)
+        return None
+
+    def find_signature(self, signature):
+        digest = signature_hash(signature)
+        if not self.might_contain(_signature_key(digest)):
+            return None
+        size, offset, data = SIGNATURE_ENTRY.size, self._signatures_offset, self._map
+        low, high = 0, self.signature_count
+        while low < high:
+            middle = (low + high) // 2
+            start = offset + middle * size
+            if data[start:start + SIGNATURE_HASH_SIZE] < digest:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self.signature_count:
+            found, index = SIGNATURE_ENTRY.unpack_from(data, offset + low * size)
+            if found == digest:
+                return self._decode(self._record_at(index))
+        return None
+
+
+def _looks_like_signature(value):
+    """digital_signature SHA-256 hex-dir (64 simvol)."""
+    return len(value) == 64 and all(char in "0123456789abcdefABCDEF" for char in value)
+
+
+def classify(record, today):
+    """Certificate::isActive() / isExpired() ilə eyni: bitmə günündən etibarən vaxtı keçmiş sayılır."""
+    if record is None:
+        return NOT_FOUND
+    _number, status, expiry = record
+    if status == "revoked":
+        return REVOKED
+    if status == "expired" or (expiry is not None and today >= expiry):
+        return EXPIRED
+    return VALID
+
+
+def verify_csv(index, source, destination, column=None, by="auto", today=None):
+    """
+    source CSV-ni bir keçiddə yoxlayır, hər sətrə verification_status,
+    certificate_number və expiry_date sütunlarını əlavə edib destination-a
+    yazır. Nəticələrin sayını (dict) qaytarır.
+    """
+    today = today or datetime.date.today()
+    counts = dict.fromkeys((VALID, EXPIRED, REVOKED, NOT_FOUND), 0)
+    with open(source, encoding="utf-8-sig", newline="") as f_in, \
+            open(destination, "w", encoding="utf-8", newline="") as f_out:
+        head = f_in.readline()
+        f_in.seek(0)
+        delimiter = "\t" if "\t" in head else ";" if head.count(";") > head.count(",") else ","
+        reader = csv.reader(f_in, delimiter=delimiter)
+        writer = csv.writer(f_out, delimiter=delimiter)
+        header = next(reader, None)
+        if header is None:
+            return counts
+        names = [name.strip().lower() for name in header]
+        if column is not None:
+            if column.lower() not in names:
+                raise ValueError(f"Sütun tapılmadı: {column} (var: {', '.join(header)})")
+            position = names.index(column.lower())
+        else:
+            known = [name for name in ("certificate_number", "number", "digital_signature", "signature")
+                     if name in names]
+            position = names.index(known[0]) if known else 0
+            if not known:
+                # Başlıq yoxdur: birinci sətir də yoxlanılır
+                reader = _prepend(header, reader)
+                header = names = [f"column{i + 1}" for i in range(len(header))]
+        # İmza ilə yoxlananda tapılan nömrə də yazılır
+        add_number = "certificate_number" not in names
+        writer.writerow(header + ["verification_status"] + (["certificate_number"] if add_number else [])
+                        + ["expiry_date"])
+        for row in reader:
+            value = row[position].strip() if position < len(row) else ""
+            record = None
+            if value:
+                if by == "signature" or (by == "auto" and _looks_like_signature(value)):
+                    record = index.find_signature(value)
+                if record is None and by != "signature":
+                    record = index.find_number(value)
+            result = classify(record, today)
+            counts[result] += 1
+            expiry = record[2].isoformat() if record and record[2] else ""
+            number = [record[0] if record else ""] if add_number else []
+            writer.writerow(row + [result] + number + [expiry])
+    return counts
+
+
+def _prepend(first, rows):
+    yield first
+    yield from rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sertifikatların oflayn toplu yoxlanışı üçün indeks.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="ixrac faylından indeks qur")
+    build.add_argument("export", help="certificates cədvəlinin ixracı (CSV/TSV, JSON və ya JSON Lines)")
+    build.add_argument("-o", "--output", required=True, help="indeks faylı (məs. certificates.vidx)")
+    build.add_argument("--fp-rate", type=float, default=DEFAULT_FP_RATE,
+                       help="Bloom filtrinin yalançı müsbət ehtimalı (default: 0.01)")
+    verify = commands.add_parser("verify", help="CSV-dəki sertifikatları indekslə yoxla")
+    verify.add_argument("index")
+    verify.add_argument("csv", help="yoxlanılacaq CSV (nömrə və ya imza sütunu ilə)")
+    verify.add_argument("-o", "--output", help="nəticə CSV (default: <ad>.verified.csv)")
+    verify.add_argument("--column", help="nömrə/imza sütununun adı (default: avtomatik)")
+    verify.add_argument("--by", choices=("auto", "number", "signature"), default="auto")
+    verify.add_argument("--as-of", type=lambda value: _parse_date(value), default=None,
+                        help="bu tarixə görə yoxla, YYYY-MM-DD (default: bu gün)")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.command == "build":
+        count, duplicates = build_index(read_export(args.export), args.output, args.fp_rate)
+        print(f"✅ {args.output}: {count} sertifikat, {os.path.getsize(args.output) / 1024:.1f} KB "
+              f"({time.perf_counter() - started:.2f} s)")
+        if duplicates:
+            print(f"⚠️  {duplicates} təkrarlanan nömrə (sonuncu saxlanıldı)")
+        return 0
+
+    output = args.output or os.path.splitext(args.csv)[0] + ".verified.csv"
+    with VerificationIndex(args.index) as index:
+        counts = verify_csv(index, args.csv, output, args.column, args.by, args.as_of)
+        built = datetime.datetime.fromtimestamp(index.built_at)
+    total = sum(counts.values())
+    elapsed = time.perf_counter() - started
+    print(f"✅ {output}: {total} sətir, {elapsed:.2f} s")
+    print(f"📊 etibarlı: {counts[VALID]}, vaxtı keçmiş: {counts[EXPIRED]}, ləğv edilmiş: {counts[REVOKED]}, "
+          f"tapılmadı: {counts[NOT_FOUND]}")
+    print(f"   İndeks {built:%Y-%m-%d %H:%M} tarixində qurulub; sonrakı dəyişikliklər nəzərə alınmayıb")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
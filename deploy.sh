@@ -22,6 +22,16 @@ php artisan storage:link --force
 echo "🗄️ Running migrations..."
 php artisan migrate --force
 
+# Pre-encode certificate images into a data URI bundle
+echo "🖼️ Building certificate asset bundle..."
+python3 certificate_new/flatten_background.py || echo "⚠️ Background flattening failed, certificates will composite layers in Chrome"
+python3 certificate_new/build_asset_bundle.py || echo "⚠️ Asset bundle build failed, certificates will load images from disk"
+if [ -f certificate_new/cer.flat.html ]; then
+    python3 certificate_new/precompile_template.py --template certificate_new/cer.flat.html || echo "⚠️ Template precompilation failed, certificates will use cer.flat.html"
+else
+    python3 certificate_new/precompile_template.py || echo "⚠️ Template precompilation failed, certificates will use cer.html"
+fi
+
 # Optimize for production
 echo "⚡ Optimizing for production..."
 php artisan config:cache
@@ -0,0 +1,5 @@
+"""
+Helpers for building and maintaining the Agrar Portal Postman collections.
+
+Used by update_postman_collection.py and the collection tooling scripts.
+"""
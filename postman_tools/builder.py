@@ -0,0 +1,271 @@
+"""
+Indexed, incremental Postman collection builder.
+
+CollectionBuilder keeps the top-level sections in a linked list with a
+section-name index, so "insert after X" / "append to X" are O(1) instead
+of a linear scan per operation.
+
+dump_collection writes the collection exactly like
+json.dump(collection, f, indent=2, ensure_ascii=False), but serializes
+each section only when its content hash changed since the last run; the
+indented fragments are kept in a small on-disk cache. The cache saves the
+(pure-Python) indent=2 encoding only: every section is still built and
+hashed on each run. Output goes through streaming.CollectionWriter, so a
+compact (minified) mode is available too. dump_collection is the one
+writer for whole collections: dedupe and diff apply use it without a
+cache, so all three tools format their output the same way.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+
+from .streaming import CollectionWriter
+
+DEFAULT_CACHE_DIR = ".collection_cache"
+# Bump when the fragment format changes
+FRAGMENT_VERSION = 1
+
+def normalize_path(raw):
+    """
+    "{{base_url}}/api/v1/faqs/1?x=y" -> "/api/v1/faqs/{}".
+    Numeric ids and {param} / {{variable}} / :param segments become "{}".
+    """
+    path = raw.split("?", 1)[0]
+    if path.startswith("{{"):
+        path = path[path.find("}}") + 2:]
+    return "/" + "/".join("{}" if segment.isdigit() or segment[0] in "{:" else segment
+                          for segment in path.split("/") if segment)
+
+
+def request_url(request):
+    url = request.get("url", "")
+    if isinstance(url, dict):
+        if "raw" in url:
+            return url["raw"]
+        return "/" + "/".join(url.get("path", []))
+    return url
+
+
+def request_key(item):
+    """(METHOD, normalized path) of a request item, or None for folders."""
+    request = item.get("request")
+    if not isinstance(request, dict):
+        return None
+    return request.get("method", "GET").upper(), normalize_path(request_url(request))
+
+
+def iter_requests(items, folder=()):
+    """Yield (folder path tuple, request item) for every request, depth first."""
+    for item in items:
+        if "item" in item:
+            yield from iter_requests(item["item"], folder + (item.get("name", ""),))
+        elif "request" in item:
+            yield folder, item
+
+
+class _Node:
+    __slots__ = ("prev", "next", "section")
+
+    def __init__(self, section):
+        self.prev = None
+        self.next = None
+        self.section = section
+
+
+class CollectionBuilder:
+    """
+    Ordered top-level sections with a name index.
+
+    Operations that name a missing section are no-ops that return False,
+    like the original scan loops that simply found nothing.
+    """
+
+    def __init__(self, info, variable=None, event=None, extra=None):
+        self.info = info
+        self.variable = variable or []
+        self.event = event or []
+        # Other top-level members (e.g. collection auth written by dedupe), kept as they are
+        self.extra = dict(extra or {})
+        self._head = None
+        self._tail = None
+        self._by_name = {}
+
+    def __len__(self):
+        return len(self._by_name)
+
+    def __contains__(self, name):
+        return name in self._by_name
+
+    def __iter__(self):
+        node = self._head
+        while node is not None:
+            yield node.section
+            node = node.next
+
+    def section(self, name):
+        node = self._by_name.get(name)
+        return node.section if node else None
+
+    def _link(self, node, prev, nxt):
+        node.prev, node.next = prev, nxt
+        if prev is None:
+            self._head = node
+        else:
+            prev.next = node
+        if nxt is None:
+            self._tail = node
+        else:
+            nxt.prev = node
+
+    def _add(self, section, prev, nxt):
+        name = section.get("name")
+        if name in self._by_name:
+            raise ValueError(f"Duplicate section name: {name!r}")
+        node = _Node(section)
+        self._link(node, prev, nxt)
+        self._by_name[name] = node
+        return node
+
+    def append(self, section):
+        self._add(section, self._tail, None)
+
+    def insert_after(self, anchor, section):
+        node = self._by_name.get(anchor)
+        if node is None:
+            return False
+        self._add(section, node, node.next)
+        return True
+
+    def insert_before(self, anchor, section):
+        node = self._by_name.get(anchor)
+        if node is None:
+            return False
+        self._add(section, node.prev, node)
+        return True
+
+    def extend(self, name, items):
+        """Append request items to an existing section."""
+        node = self._by_name.get(name)
+        if node is None:
+            return False
+        node.section.setdefault("item", []).extend(items)
+        return True
+
+    def replace(self, name, section):
+        """Swap the content of section `name` in place (the new section may be renamed)."""
+        node = self._by_name.get(name)
+        if node is None:
+            return False
+        new_name = section.get("name")
+        if new_name != name and new_name in self._by_name:
+            raise ValueError(f"Duplicate section name: {new_name!r}")
+        del self._by_name[name]
+        node.section = section
+        self._by_name[new_name] = node
+        return True
+
+    def remove(self, name):
+        node = self._by_name.pop(name, None)
+        if node is None:
+            return False
+        if node.prev is None:
+            self._head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            self._tail = node.prev
+        else:
+            node.next.prev = node.prev
+        return True
+
+    def build(self):
+        return {
+            "info": self.info,
+            "item": list(self),
+            "variable": self.variable,
+            "event": self.event,
+            **self.extra,
+        }
+
+
+def section_hash(section):
+    """Content hash of a section (compact dump uses the C encoder, unlike indent=2)."""
+    payload = json.dumps(section, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(f"{FRAGMENT_VERSION}\0{payload}".encode("utf-8")).hexdigest()
+
+
+class FragmentCache:
+    """Indented JSON fragments keyed by section hash: <dir>/<hash>.json"""
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR):
+        self.directory = directory
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key):
+        try:
+            with open(self._path(key), encoding="utf-8") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key, text):
+        os.makedirs(self.directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(text)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+    def prune(self, keep):
+        """Delete fragments whose hash is not in `keep`; returns the number removed."""
+        if not os.path.isdir(self.directory):
+            return 0
+        removed = 0
+        for name in os.listdir(self.directory):
+            stem, ext = os.path.splitext(name)
+            if ext == ".json" and stem not in keep:
+                os.unlink(os.path.join(self.directory, name))
+                removed += 1
+        return removed
+
+
+def dump_collection(collection, path, cache=None, compact=False):
+    """
+    Write `collection` to `path` section by section, byte-identical to
+    json.dump(indent=2, ensure_ascii=False) (or minified with compact=True).
+    With a cache, indented sections are serialized only when their hash is
+    not cached yet. Returns (sections, serialized) counts.
+    """
+    keys = set()
+    serialized = 0
+    with open(path, "w", encoding="utf-8") as f, CollectionWriter(f, compact) as writer:
+        for name, value in collection.items():
+            if name != "item":
+                writer.member(name, value)
+                continue
+            writer.begin_array(name)
+            for section in value:
+                text = None
+                # Compact output uses the C encoder, caching would not pay off
+                if cache is not None and not compact:
+                    key = section_hash(section)
+                    keys.add(key)
+                    text = cache.get(key)
+                if text is None:
+                    text = writer.dumps(section)
+                    serialized += 1
+                    if cache is not None and not compact:
+                        cache.put(key, text)
+                writer.element(text=text)
+            writer.end_array()
+
+    if cache is not None and not compact:
+        cache.prune(keys)
+    return len(collection["item"]), serialized
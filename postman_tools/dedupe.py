@@ -0,0 +1,218 @@
+"""
+Deduplicate a Postman collection without changing what it sends.
+
+  * "Authorization: Bearer ..." headers become Postman bearer auth, and
+    the most common auth of every folder is hoisted to the folder (or the
+    collection); requests inherit it, and those that differ keep their
+    own auth (explicit "noauth" for public endpoints).
+  * "Content-Type: application/json" on raw bodies is replaced by the
+    body's json language option, from which Postman and Newman set the
+    header themselves.
+  * url objects whose host/path are derivable from url.raw are written as
+    the raw string, and empty header lists, descriptions, responses and
+    script stubs are left out.
+
+Postman has no folder-level headers, so headers other than these two are
+kept on the requests. The tools in this package (builder, diff, routes,
+loadtest) read both the full and the deduplicated form.
+
+Usage:
+    python -m postman_tools.dedupe Agrar_Portal_API.postman_collection.json -o slim.json
+    python -m postman_tools.dedupe input.json -o slim.json --compact
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import Counter
+
+from .builder import dump_collection
+from .streaming import load_collection
+
+NOAUTH = {"type": "noauth"}
+
+
+def _canonical(auth):
+    return json.dumps(auth or NOAUTH, sort_keys=True, separators=(",", ":"))
+
+
+def bearer(token):
+    return {"type": "bearer", "bearer": [{"key": "token", "value": token, "type": "string"}]}
+
+
+def _header(request, name):
+    for header in request.get("header", []):
+        if header.get("key", "").lower() == name and not header.get("disabled"):
+            return header
+    return None
+
+
+def _without(request, header):
+    request["header"] = [entry for entry in request["header"] if entry is not header]
+
+
+def _requests(items):
+    for item in items:
+        if "item" in item:
+            yield from _requests(item["item"])
+        elif isinstance(item.get("request"), dict):
+            yield item["request"]
+
+
+def _materialize_auth(items, inherited, stats):
+    """Give every request its effective auth explicitly; folder auth is removed."""
+    for item in items:
+        if "item" in item:
+            _materialize_auth(item["item"], item.pop("auth", inherited), stats)
+            continue
+        request = item.get("request")
+        if not isinstance(request, dict):
+            continue
+        auth = request.get("auth", inherited) or NOAUTH
+        header = _header(request, "authorization")
+        # A literal header overrides the auth helper in Postman, so it decides
+        if header is not None and str(header.get("value", "")).startswith("Bearer "):
+            auth = bearer(header["value"][len("Bearer "):])
+            _without(request, header)
+            stats["auth headers"] += 1
+        request["auth"] = auth
+
+
+def _hoist_auth(items, holder, inherited, stats):
+    """Put the most common auth below `holder` on it; requests that match inherit it."""
+    counts = Counter(_canonical(request["auth"]) for request in _requests(items))
+    current = inherited
+    if counts:
+        common = counts.most_common(1)[0][0]
+        if common != inherited:
+            holder["auth"] = json.loads(common)
+            current = common
+            stats["auth blocks"] += 1
+    for item in items:
+        if "item" in item:
+            _hoist_auth(item["item"], item, current, stats)
+        elif isinstance(item.get("request"), dict):
+            request = item["request"]
+            if _canonical(request["auth"]) == current:
+                del request["auth"]
+            else:
+                stats["auth overrides"] += 1
+
+
+def _raw_json(request, stats):
+    body = request.get("body")
+    header = _header(request, "content-type")
+    if not body or body.get("mode") != "raw" or header is None:
+        return
+    if str(header.get("value", "")).split(";")[0].strip().lower() != "application/json":
+        return
+    raw_options = body.setdefault("options", {}).setdefault("raw", {})
+    if raw_options.get("language", "json") != "json":
+        return
+    raw_options["language"] = "json"
+    _without(request, header)
+    stats["content-type headers"] += 1
+
+
+def _url_parts(raw):
+    path = raw.split("?", 1)[0].split("#", 1)[0]
+    if not path.startswith("{{") or "}}" not in path:
+        return None
+    end = path.find("}}") + 2
+    return [path[:end]], [segment for segment in path[end:].split("/") if segment]
+
+
+def _collapse_url(request, stats):
+    url = request.get("url")
+    if isinstance(url, dict) and url.get("query") == []:
+        del url["query"]
+    if not isinstance(url, dict) or "raw" not in url or set(url) - {"raw", "host", "path"}:
+        return
+    parts = _url_parts(url["raw"])
+    if parts is None or url.get("host", parts[0]) != parts[0] or url.get("path", parts[1]) != parts[1]:
+        return
+    request["url"] = url["raw"]
+    stats["urls collapsed"] += 1
+
+
+def _empty_script(event):
+    script = event.get("script") or {}
+    exec_lines = script.get("exec", [])
+    if isinstance(exec_lines, str):
+        exec_lines = [exec_lines]
+    return not "".join(exec_lines).strip() and not script.get("src")
+
+
+def _drop_empty(holder, stats):
+    for key in ("header", "description", "response"):
+        if key in holder and holder[key] in ([], "", None):
+            del holder[key]
+            stats["empty fields"] += 1
+    if "event" in holder and all(_empty_script(event) for event in holder["event"]):
+        del holder["event"]
+        stats["empty fields"] += 1
+
+
+def _tidy(items, stats):
+    for item in items:
+        _drop_empty(item, stats)
+        if "item" in item:
+            _tidy(item["item"], stats)
+            continue
+        request = item.get("request")
+        if isinstance(request, dict):
+            _raw_json(request, stats)
+            _collapse_url(request, stats)
+            _drop_empty(request, stats)
+
+
+def dedupe_collection(collection):
+    """Deduplicate `collection` in place; returns a Counter of what was removed or hoisted."""
+    stats = Counter()
+    items = collection.setdefault("item", [])
+    _materialize_auth(items, collection.pop("auth", None), stats)
+    _hoist_auth(items, collection, _canonical(NOAUTH), stats)
+    _tidy(items, stats)
+    _drop_empty(collection, stats)
+    return stats
+
+
+def _size(collection, compact):
+    if compact:
+        return len(json.dumps(collection, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    return len(json.dumps(collection, indent=2, ensure_ascii=False).encode("utf-8"))
+
+
+def size_report(before, after):
+    """Lines comparing indented and minified sizes of two collections."""
+    lines = [f"  {'format':<10} {'before':>10} {'after':>10} {'saved':>7}"]
+    for label, compact in (("indent=2", False), ("minified", True)):
+        old, new = _size(before, compact), _size(after, compact)
+        lines.append(f"  {label:<10} {old / 1024:>8.1f}KB {new / 1024:>8.1f}KB {(1 - new / old) * 100:>6.1f}%")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Deduplicate auth, headers and URL fields of a Postman collection.")
+    parser.add_argument("source")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--compact", action="store_true", help="also minify the JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    collection = load_collection(args.source)
+    before = json.loads(json.dumps(collection))
+    stats = dedupe_collection(collection)
+    dump_collection(collection, args.output, compact=args.compact)
+    elapsed = time.perf_counter() - started
+
+    print(", ".join(f"{count} {name}" for name, count in sorted(stats.items())) or "nothing to deduplicate")
+    print("\n".join(size_report(before, collection)))
+    print(f"✓ {args.source} ({os.path.getsize(args.source) / 1024:.1f} KB) -> "
+          f"{args.output} ({os.path.getsize(args.output) / 1024:.1f} KB) in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,345 @@
+"""
+Structural diff and merge between Postman collection variants.
+
+Every request is keyed by (METHOD, normalized path) and hashed over its
+canonical JSON. Both collections are indexed once, so a diff is linear in
+the number of requests. Within one (method, path) group, requests are
+paired by identical hash in the same folder first, then by hash, then by
+name, then in document order.
+
+The diff is written as a patch file that `apply` can merge into the
+base collection or into another variant; entries are located by hash
+and folder, and an addition records how many copies of the request the
+folder holds, so the same request in several folders round-trips,
+re-applying a patch is a no-op, and edits made in the target since the
+diff are reported as conflicts instead of being overwritten.
+
+Usage:
+    python -m postman_tools.diff diff old.json new.json -o changes.patch.json
+    python -m postman_tools.diff apply target.json changes.patch.json -o merged.json
+"""
+
+import argparse
+import hashlib
+import json
+import time
+from collections import Counter, defaultdict
+
+from .builder import dump_collection, iter_requests, request_key
+from .streaming import iter_members, load_collection
+
+PATCH_FORMAT = "postman-collection-patch"
+PATCH_VERSION = 2
+COMPARED_FIELDS = ("name", "url", "header", "body", "auth", "description", "response", "event")
+
+
+def item_hash(item):
+    payload = json.dumps(item, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _fields(item):
+    request = item.get("request") or {}
+    return {
+        "name": item.get("name"),
+        "url": request.get("url"),
+        "header": request.get("header"),
+        "body": request.get("body"),
+        "auth": request.get("auth"),
+        "description": item.get("description", request.get("description")),
+        "response": item.get("response"),
+        "event": item.get("event"),
+    }
+
+
+def changed_fields(old, new):
+    old_fields, new_fields = _fields(old), _fields(new)
+    return [name for name in COMPARED_FIELDS if old_fields[name] != new_fields[name]]
+
+
+class _Entry:
+    __slots__ = ("folder", "item", "hash", "container", "position")
+
+    def __init__(self, folder, item, container=None, position=None):
+        self.folder = folder
+        self.item = item
+        self.hash = item_hash(item)
+        self.container = container
+        self.position = position
+
+
+def index_sections(sections):
+    """(method, path) -> [_Entry] in document order."""
+    index = defaultdict(list)
+    for folder, item in iter_requests(sections):
+        index[request_key(item)].append(_Entry(list(folder), item))
+    return index
+
+
+def index_file(path):
+    return index_sections(section for name, section in iter_members(path) if name == "item")
+
+
+_MATCHES = (
+    lambda entry: (entry.hash, tuple(entry.folder)),
+    lambda entry: entry.hash,
+    lambda entry: entry.item.get("name"),
+)
+
+
+def _pair(old_entries, new_entries):
+    """Yield (old, new) pairs; either side may be None."""
+    new_left = list(new_entries)
+    still_unmatched = list(old_entries)
+    for match in _MATCHES:
+        by_match = defaultdict(list)
+        for position, entry in enumerate(new_left):
+            if entry is not None:
+                by_match[match(entry)].append(position)
+        unmatched = []
+        for entry in still_unmatched:
+            positions = by_match.get(match(entry))
+            if positions:
+                position = positions.pop(0)
+                yield entry, new_left[position]
+                new_left[position] = None
+            else:
+                unmatched.append(entry)
+        still_unmatched = unmatched
+
+    remaining = [entry for entry in new_left if entry is not None]
+    for old, new in zip(still_unmatched, remaining):
+        yield old, new
+    for old in still_unmatched[len(remaining):]:
+        yield old, None
+    for new in remaining[len(still_unmatched):]:
+        yield None, new
+
+
+def diff(old_index, new_index):
+    """Patch dict with added / removed / changed / moved endpoints."""
+    added, removed, changed, moved = [], [], [], []
+    for key in list(old_index) + [key for key in new_index if key not in old_index]:
+        method, path = key
+        # Hashes that survive under this key; apply() never reports them as conflicts
+        keep = sorted({entry.hash for entry in new_index.get(key, ())})
+        copies = Counter((entry.hash, tuple(entry.folder)) for entry in new_index.get(key, ()))
+        for old, new in _pair(old_index.get(key, ()), new_index.get(key, ())):
+            if old is None:
+                added.append({"method": method, "path": path, "folder": new.folder,
+                              "hash": new.hash, "copies": copies[new.hash, tuple(new.folder)],
+                              "item": new.item})
+            elif new is None:
+                removed.append({"method": method, "path": path, "folder": old.folder,
+                                "name": old.item.get("name"), "hash": old.hash, "keep": keep})
+            elif old.hash != new.hash:
+                changed.append({"method": method, "path": path, "folder": new.folder,
+                                "from_folder": old.folder, "name": old.item.get("name"),
+                                "from": old.hash, "to": new.hash, "keep": keep,
+                                "fields": changed_fields(old.item, new.item), "item": new.item})
+            elif old.folder != new.folder:
+                moved.append({"method": method, "path": path, "folder": new.folder,
+                              "from_folder": old.folder, "name": old.item.get("name"), "hash": old.hash})
+    return {
+        "format": PATCH_FORMAT,
+        "version": PATCH_VERSION,
+        "added": added,
+        "removed": removed,
+        "changed": changed,
+        "moved": moved,
+    }
+
+
+class _Target:
+    """Mutable view of a collection for apply(): folder and request indexes."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.folders = {(): collection["item"]}
+        self.index = defaultdict(list)
+        self.deleted = set()
+        self._walk(collection["item"], ())
+
+    def _walk(self, items, folder):
+        for position, item in enumerate(items):
+            if "item" in item:
+                path = folder + (item.get("name", ""),)
+                self.folders.setdefault(path, item["item"])
+                self._walk(item["item"], path)
+            elif "request" in item:
+                self.index[request_key(item)].append(_Entry(list(folder), item, items, position))
+
+    def folder(self, path):
+        """Item list of a folder, created (with its parents) when missing."""
+        path = tuple(path)
+        if path not in self.folders:
+            parent = self.folder(path[:-1])
+            section = {"name": path[-1], "item": []}
+            parent.append(section)
+            self.folders[path] = section["item"]
+        return self.folders[path]
+
+    def _live(self, key, folder=None):
+        for entry in self.index.get(key, ()):
+            if id(entry.item) not in self.deleted and (folder is None or entry.folder == list(folder)):
+                yield entry
+
+    def find(self, key, hash_value=None, name=None, exclude=(), folder=None):
+        for entry in self._live(key, folder):
+            if entry.hash in exclude:
+                continue
+            if hash_value is not None and entry.hash == hash_value:
+                return entry
+            if name is not None and entry.item.get("name") == name:
+                return entry
+        return None
+
+    def count(self, key, hash_value, folder):
+        """Copies of a request (by hash) in one folder."""
+        return sum(entry.hash == hash_value for entry in self._live(key, folder))
+
+    def add(self, key, folder, item):
+        container = self.folder(folder)
+        container.append(item)
+        self.index[key].append(_Entry(list(folder), item, container, len(container) - 1))
+
+    def delete(self, entry):
+        self.deleted.add(id(entry.item))
+
+    def finish(self):
+        if not self.deleted:
+            return
+        for path, items in self.folders.items():
+            items[:] = [item for item in items if id(item) not in self.deleted]
+
+
+def apply(collection, patch, force=False):
+    """
+    Merge `patch` into `collection` in place.
+    Returns {"applied": n, "skipped": n, "conflicts": [...]}. With force=True
+    conflicting entries are applied anyway (the patch wins).
+    """
+    if patch.get("format") != PATCH_FORMAT:
+        raise ValueError("Not a collection patch file")
+    target = _Target(collection)
+    result = {"applied": 0, "skipped": 0, "conflicts": []}
+
+    def conflict(kind, entry, reason):
+        result["conflicts"].append({"kind": kind, "method": entry["method"], "path": entry["path"],
+                                    "name": entry.get("name") or entry.get("item", {}).get("name"),
+                                    "reason": reason})
+
+    for entry in patch["removed"]:
+        key = (entry["method"], entry["path"])
+        found = (target.find(key, hash_value=entry["hash"], folder=entry["folder"])
+                 or target.find(key, hash_value=entry["hash"]))
+        if found is None:
+            found = target.find(key, name=entry["name"], exclude=entry["keep"])
+            if found is None:
+                result["skipped"] += 1
+                continue
+            if not force:
+                conflict("removed", entry, "modified in target")
+                continue
+        target.delete(found)
+        result["applied"] += 1
+
+    for entry in patch["changed"]:
+        key = (entry["method"], entry["path"])
+        found = (target.find(key, hash_value=entry["from"], folder=entry["from_folder"])
+                 or target.find(key, hash_value=entry["from"]))
+        if found is None:
+            if target.find(key, hash_value=entry["to"], folder=entry["folder"]) is not None:
+                result["skipped"] += 1
+                continue
+            found = target.find(key, name=entry["name"], exclude=entry["keep"])
+            if not force:
+                conflict("changed", entry, "modified in target" if found else "missing in target")
+                continue
+        if found is not None and found.folder == entry["folder"]:
+            found.container[found.position] = entry["item"]
+            found.item, found.hash = entry["item"], entry["to"]
+        else:
+            if found is not None:
+                target.delete(found)
+            target.add(key, entry["folder"], entry["item"])
+        result["applied"] += 1
+
+    for entry in patch["moved"]:
+        key = (entry["method"], entry["path"])
+        found = target.find(key, hash_value=entry["hash"], folder=entry["from_folder"])
+        if found is None:
+            result["skipped"] += 1
+            continue
+        target.delete(found)
+        # Deletion is tracked by object identity, so re-add a copy
+        target.add(key, entry["folder"], dict(found.item))
+        result["applied"] += 1
+
+    for entry in patch["added"]:
+        key = (entry["method"], entry["path"])
+        # Version 1 patches carry no copy count: one copy per folder
+        if target.count(key, entry["hash"], entry["folder"]) >= entry.get("copies", 1):
+            result["skipped"] += 1
+            continue
+        target.add(key, entry["folder"], entry["item"])
+        result["applied"] += 1
+
+    target.finish()
+    return result
+
+
+def format_summary(patch):
+    lines = []
+    for kind, marker in (("added", "+"), ("removed", "-"), ("changed", "~"), ("moved", ">")):
+        for entry in patch[kind]:
+            detail = f"  [{', '.join(entry['fields'])}]" if kind == "changed" else ""
+            folder = " / ".join(entry["folder"])
+            lines.append(f"  {marker} {entry['method']:<7} {entry['path']:<55} {folder}{detail}")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Diff and merge Postman collection variants.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    diff_parser = commands.add_parser("diff", help="compute a patch from OLD to NEW")
+    diff_parser.add_argument("old")
+    diff_parser.add_argument("new")
+    diff_parser.add_argument("-o", "--output", help="write the patch file here")
+    diff_parser.add_argument("-q", "--quiet", action="store_true", help="print only the counts")
+    apply_parser = commands.add_parser("apply", help="merge a patch into a collection")
+    apply_parser.add_argument("target")
+    apply_parser.add_argument("patch")
+    apply_parser.add_argument("-o", "--output", required=True)
+    apply_parser.add_argument("--force", action="store_true", help="apply conflicting entries anyway")
+    apply_parser.add_argument("--compact", action="store_true", help="write minified JSON")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    if args.command == "diff":
+        patch = diff(index_file(args.old), index_file(args.new))
+        elapsed = time.perf_counter() - started
+        if not args.quiet:
+            print("\n".join(format_summary(patch)))
+        print(f"✓ {len(patch['added'])} added, {len(patch['removed'])} removed, "
+              f"{len(patch['changed'])} changed, {len(patch['moved'])} moved ({elapsed * 1000:.1f} ms)")
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(patch, f, indent=2, ensure_ascii=False)
+            print(f"✓ Patch saved to {args.output}")
+        return 0
+
+    collection = load_collection(args.target)
+    with open(args.patch, encoding="utf-8") as f:
+        patch = json.load(f)
+    result = apply(collection, patch, force=args.force)
+    dump_collection(collection, args.output, compact=args.compact)
+    print(f"✓ {result['applied']} applied, {result['skipped']} already present "
+          f"({(time.perf_counter() - started) * 1000:.1f} ms)")
+    for item in result["conflicts"]:
+        print(f"✗ {item['kind']:<8} {item['method']:<7} {item['path']}  {item['name']}: {item['reason']}")
+    return 1 if result["conflicts"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,680 @@
+"""
+Chunked, pooled bulk importer for exams and their questions.
+
+Exams (the format in ADMIN_EXAM_JSON_GUIDE.md) are created by
+POST /api/v1/exams, one exam with all of its questions per request in one
+database transaction; PUT /api/v1/exams/{id} ignores "questions", so the
+questions of one exam cannot be spread over several requests. The importer
+streams the source file, validates every exam locally with the rules of
+ExamController::store, and sends the valid ones in chunks over one pooled
+aiohttp client with --concurrency requests in flight (the next chunk is
+read while the previous one finishes).
+
+Creating an exam is not idempotent, so only failures that are known not
+to have been processed are retried, with exponential backoff (Retry-After
+is honoured): connection errors before the request was sent, 429, and
+503 with Retry-After (maintenance mode). A timeout, a dropped connection
+or another 5xx answer may come after the server committed the exam; such
+exams are never resent and are reported as "outcome unknown", check them
+on the server. Other 4xx answers are reported as failures.
+
+With --checkpoint, every imported exam is appended to a JSON Lines file
+(keyed by a hash of the exam), so an interrupted run resumes where it
+stopped and a re-run never creates an exam twice. Exams with an unknown
+outcome are recorded too and skipped on resume; delete their line from
+the checkpoint to send them again.
+
+Sources:
+  * JSON: one exam object, an array of exams, or {"exams": [...]}
+  * JSON Lines (.jsonl / .ndjson): one exam per line
+  * CSV: one row per question, rows of one exam next to each other and
+    grouped by the "exam" column (the title unless a "title" column is
+    given). Exam columns (passing_score, duration_minutes, category, ...)
+    are read from the first row of an exam; "choices" is "A|*B|C" where
+    "*" marks the correct choices; "<field>_en" / "<field>_ru" columns
+    add translations. Shared exam fields can come from --defaults.
+
+Usage:
+    python -m postman_tools.exam_import question_bank.csv --defaults exam_defaults.json \\
+        --base-url https://staging.example.com --token "$TOKEN" -c 8 --checkpoint question_bank.ckpt
+    python -m postman_tools.exam_import question_bank.json --dry-run
+    python -m postman_tools.exam_import question_bank.json --stand-in
+"""
+
+import argparse
+import asyncio
+import csv
+import datetime
+import hashlib
+import json
+import os
+import random
+import time
+
+import aiohttp
+
+from .loadtest import DEFAULT_TIMEOUT, RateLimiter, StandIn, client_session, percentile, stand_in_options
+from .streaming import iter_elements, iter_members
+
+EXAMS_PATH = "/api/v1/exams"
+DEFAULT_CHUNK_SIZE = 50
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+# Answers that mean the exam was not processed: throttled, or 503 with Retry-After (maintenance mode)
+RETRY_STATUSES = frozenset((429, 503))
+BACKOFF_BASE = 0.5
+BACKOFF_MAX = 30.0
+
+QUESTION_TYPES = ("single_choice", "multiple_choice", "true_false", "text")
+CHOICE_TYPES = ("single_choice", "multiple_choice", "true_false")
+DIFFICULTIES = ("easy", "medium", "hard")
+MEDIA_TYPES = ("image", "video", "audio", "document")
+LANGUAGES = ("az", "en", "ru")
+_TRUE = ("1", "true", "yes", "on", "bəli")
+_FALSE = ("", "0", "false", "no", "off", "xeyr")
+
+
+# --- Sources ---
+
+def read_exams(path, defaults=None):
+    """Yield exam dicts from a JSON, JSON Lines or CSV file, one at a time."""
+    extension = os.path.splitext(path)[1].lower()
+    if extension == ".csv":
+        exams = _csv_exams(path)
+    elif extension in (".jsonl", ".ndjson"):
+        exams = _json_lines(path)
+    else:
+        exams = _json_exams(path)
+    for exam in exams:
+        yield {**defaults, **exam} if defaults else exam
+
+
+def _json_lines(path):
+    with open(path, encoding="utf-8-sig") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def _json_exams(path):
+    with open(path, encoding="utf-8-sig") as f:
+        first = f.read(1024).lstrip()[:1]
+    if first == "[":
+        yield from iter_elements(path)
+        return
+    single = {}
+    streamed = False
+    for name, value in iter_members(path, streamed=("exams",)):
+        if name == "exams":
+            streamed = True
+            yield value
+        else:
+            single[name] = value
+    if not streamed:
+        yield single
+
+
+def _text(row, field):
+    """Plain value, or {"az", "en", "ru"} when translation columns are filled."""
+    value = row.get(field) or None
+    translations = {language: row[f"{field}_{language}"] for language in LANGUAGES if row.get(f"{field}_{language}")}
+    if not translations:
+        return value
+    if value:
+        translations.setdefault("az", value)
+    return translations
+
+
+def _number(value):
+    """CSV cell -> int where possible; anything else is kept for validation to report."""
+    try:
+        return int(value)
+    except ValueError:
+        return value
+
+
+def _flag(value):
+    lowered = value.lower()
+    if lowered in _TRUE:
+        return True
+    if lowered in _FALSE:
+        return False
+    return value
+
+
+_EXAM_TEXT = ("title", "description")
+_EXAM_STRINGS = ("category", "start_date", "end_date", "rules", "instructions")
+_EXAM_NUMBERS = ("training_id", "passing_score", "duration_minutes", "max_attempts", "exam_question_count",
+                 "time_warning_minutes")
+_EXAM_FLAGS = ("shuffle_questions", "shuffle_choices", "show_result_immediately", "show_correct_answers",
+               "show_explanations", "auto_submit")
+
+
+def _csv_exam(row, key):
+    exam = {}
+    for field in _EXAM_TEXT:
+        if _text(row, field):
+            exam[field] = _text(row, field)
+    exam.setdefault("title", key)
+    exam.update({field: row[field] for field in _EXAM_STRINGS if row.get(field)})
+    exam.update({field: _number(row[field]) for field in _EXAM_NUMBERS if row.get(field)})
+    exam.update({field: _flag(row[field]) for field in _EXAM_FLAGS if row.get(field)})
+    exam["questions"] = []
+    return exam
+
+
+def _csv_question(row):
+    question = {"question_text": _text(row, "question_text"), "question_type": row.get("question_type") or None}
+    if _text(row, "explanation"):
+        question["explanation"] = _text(row, "explanation")
+    if row.get("difficulty"):
+        question["difficulty"] = row["difficulty"]
+    for field in ("points", "sequence"):
+        if row.get(field):
+            question[field] = _number(row[field])
+    if row.get("is_required"):
+        question["is_required"] = _flag(row["is_required"])
+    if row.get("choices"):
+        question["choices"] = [{"choice_text": text[1:].strip() if text.startswith("*") else text,
+                                "is_correct": text.startswith("*")}
+                               for text in (part.strip() for part in row["choices"].split("|")) if text]
+    return question
+
+
+def _csv_exams(path):
+    done = set()
+    key = exam = None
+    with open(path, encoding="utf-8-sig", newline="") as f:
+        for line, row in enumerate(csv.DictReader(f), start=2):
+            row = {name.strip(): (value or "").strip() for name, value in row.items() if isinstance(name, str)}
+            row_key = row.get("exam") or row.get("title")
+            if not row_key:
+                raise ValueError(f"{path}:{line}: no exam / title column value")
+            if row_key != key:
+                if exam is not None:
+                    yield exam
+                    done.add(key)
+                if row_key in done:
+                    raise ValueError(f"{path}:{line}: rows of exam {row_key!r} are not next to each other")
+                key, exam = row_key, _csv_exam(row, row_key)
+            exam["questions"].append(_csv_question(row))
+    if exam is not None:
+        yield exam
+
+
+# --- Validation (ExamController::store) ---
+
+def _integer(value):
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().lstrip("-").isdigit():
+        return int(value)
+    return None
+
+
+def _date(value):
+    try:
+        return datetime.date.fromisoformat(str(value)[:10])
+    except ValueError:
+        return None
+
+
+def _is_correct(value):
+    """The controller's normalization: "" and "0" are false, other values are cast to bool."""
+    if isinstance(value, str):
+        return value not in ("", "0")
+    return bool(value)
+
+
+def validate_exam(exam, today=None):
+    """Errors keyed like Laravel's ({"questions.0.choices": [...]}); empty when the exam is valid."""
+    today = today or datetime.date.today()
+    errors = {}
+
+    def add(field, message):
+        errors.setdefault(field, []).append(message)
+
+    def integer(field, value, low, high=None, required=False):
+        if value is None:
+            if required:
+                add(field, "The field is required.")
+            return
+        number = _integer(value)
+        if number is None:
+            add(field, "The field must be an integer.")
+        elif number < low or (high is not None and number > high):
+            add(field, f"The field must be between {low} and {high}." if high is not None
+                else f"The field must be at least {low}.")
+
+    if not isinstance(exam, dict):
+        return {"exam": ["An exam must be a JSON object."]}
+    if not exam.get("title"):
+        add("title", "The title field is required.")
+    if exam.get("training_id") is None and not exam.get("category"):
+        add("category", "The category field is required when training_id is not present.")
+    integer("passing_score", exam.get("passing_score"), 0, 100, required=True)
+    integer("duration_minutes", exam.get("duration_minutes"), 1, 480, required=True)
+    integer("max_attempts", exam.get("max_attempts"), 1, 10)
+    integer("time_warning_minutes", exam.get("time_warning_minutes"), 1, 60)
+    start, end = exam.get("start_date"), exam.get("end_date")
+    if start is not None:
+        if _date(start) is None:
+            add("start_date", "The start date is not a valid date.")
+        elif _date(start) < today:
+            add("start_date", "The start date must be a date after or equal to today.")
+    if end is not None:
+        if _date(end) is None:
+            add("end_date", "The end date is not a valid date.")
+        elif start is not None and _date(start) and _date(end) < _date(start):
+            add("end_date", "The end date must be a date after or equal to start date.")
+
+    questions = exam.get("questions")
+    if not isinstance(questions, list) or not questions:
+        add("questions", "At least one question is required.")
+        questions = []
+    integer("exam_question_count", exam.get("exam_question_count"), 1)
+    count = _integer(exam.get("exam_question_count"))
+    if count is not None and questions and count > len(questions):
+        add("exam_question_count", f"The exam question count may not be greater than {len(questions)}.")
+
+    for index, question in enumerate(questions):
+        prefix = f"questions.{index}"
+        if not isinstance(question, dict):
+            add(prefix, "A question must be a JSON object.")
+            continue
+        if not question.get("question_text"):
+            add(f"{prefix}.question_text", "The question text field is required.")
+        question_type = question.get("question_type")
+        if question_type not in QUESTION_TYPES:
+            add(f"{prefix}.question_type", f"The question type must be one of: {', '.join(QUESTION_TYPES)}.")
+        if question.get("difficulty") is not None and question["difficulty"] not in DIFFICULTIES:
+            add(f"{prefix}.difficulty", f"The difficulty must be one of: {', '.join(DIFFICULTIES)}.")
+        integer(f"{prefix}.points", question.get("points"), 1)
+        integer(f"{prefix}.sequence", question.get("sequence"), 1)
+        for position, media in enumerate(question.get("question_media") or []):
+            if media.get("type") not in MEDIA_TYPES or not media.get("url"):
+                add(f"{prefix}.question_media.{position}", "Media needs a type (image, video, audio, document) "
+                                                            "and a url.")
+        if question_type in CHOICE_TYPES:
+            choices = question.get("choices")
+            if not isinstance(choices, list) or not choices:
+                add(f"{prefix}.choices", "Choice questions must have at least one choice")
+                continue
+            for position, choice in enumerate(choices):
+                if not choice.get("choice_text"):
+                    add(f"{prefix}.choices.{position}.choice_text", "The choice text field is required.")
+                if "is_correct" not in choice:
+                    add(f"{prefix}.choices.{position}.is_correct", "The is correct field is required.")
+            if not any(_is_correct(choice.get("is_correct")) for choice in choices):
+                add(f"{prefix}.choices", "At least one choice must be marked as correct")
+    return errors
+
+
+def exam_key(exam):
+    """Stable identity of an exam for checkpoints: hash of its canonical JSON."""
+    canonical = json.dumps(exam, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:24]
+
+
+def exam_label(exam):
+    title = exam.get("title") if isinstance(exam, dict) else None
+    if isinstance(title, dict):
+        title = title.get("az") or next(iter(title.values()), None)
+    return str(title or "(untitled)")
+
+
+# --- Checkpoint ---
+
+class Checkpoint:
+    """
+    Append-only JSON Lines file, one {"key", "id", "questions", "title"}
+    line per imported exam, with "state": "unknown" for exams whose request
+    may or may not have been committed. Without a path nothing is written.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.done = {}
+        self.unknown = {}
+        self._f = None
+        if not path:
+            return
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        # Last line torn by an interrupted run
+                        continue
+                    if entry.get("state") == "unknown":
+                        self.unknown[entry["key"]] = entry.get("title")
+                    else:
+                        self.done[entry["key"]] = entry.get("id")
+        self._f = open(path, "a", encoding="utf-8")
+
+    def __contains__(self, key):
+        return key in self.done
+
+    def record(self, key, exam_id, questions, title):
+        self.done[key] = exam_id
+        self._write({"key": key, "id": exam_id, "questions": questions, "title": title})
+
+    def record_unknown(self, key, questions, title):
+        self.unknown[key] = title
+        self._write({"key": key, "id": None, "questions": questions, "title": title, "state": "unknown"})
+
+    def _write(self, entry):
+        if self._f is not None:
+            self._f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            self._f.flush()
+
+    def sync(self):
+        if self._f is not None:
+            self._f.flush()
+            os.fsync(self._f.fileno())
+
+    def close(self):
+        if self._f is not None:
+            self.sync()
+            self._f.close()
+            self._f = None
+
+
+# --- Sending ---
+
+def _backoff(attempt, retry_after=None):
+    if retry_after and retry_after.isdigit():
+        return min(BACKOFF_MAX, float(retry_after))
+    return min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+
+
+def _not_processed(status, retry_after):
+    """True when the answer says the request was rejected before the exam was created."""
+    return status in RETRY_STATUSES and (status == 429 or retry_after is not None)
+
+
+async def post_exam(session, url, headers, body, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT, limiter=None):
+    """
+    POST one exam, retrying only failures that were not processed by the
+    server. Returns (status or None, response text or error name, attempts,
+    seconds of the last attempt, unknown); unknown is True when the last
+    attempt may have created the exam (timeout, dropped connection, 5xx).
+    """
+    attempt = 0
+    while True:
+        attempt += 1
+        if limiter is not None:
+            await limiter.wait()
+        started = time.perf_counter()
+        retry_after = None
+        try:
+            async with session.post(url, data=body, headers=headers,
+                                    timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+                status, text = response.status, await response.text()
+                retry_after = response.headers.get("Retry-After")
+            retryable = _not_processed(status, retry_after)
+            unknown = status >= 500 and not retryable
+        except aiohttp.ClientConnectorError as exc:
+            # The connection was never established, nothing was sent
+            status, text, retryable, unknown = None, type(exc).__name__, True, False
+        except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+            status, text, retryable, unknown = None, type(exc).__name__, False, True
+        seconds = time.perf_counter() - started
+        if not retryable or attempt > retries:
+            return status, text, attempt, seconds, unknown
+        await asyncio.sleep(_backoff(attempt, retry_after))
+
+
+def _created_id(text):
+    """Exam id from the store response ({"exam": {"id": ...}}); None if absent."""
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    exam = payload.get("exam")
+    return exam.get("id") if isinstance(exam, dict) else payload.get("id")
+
+
+def _error_message(status, text):
+    if status is None:
+        return text
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return f"HTTP {status}"
+    message = f"HTTP {status}"
+    if isinstance(payload, dict):
+        if payload.get("message"):
+            message += f": {payload['message']}"
+        errors = payload.get("errors")
+        if isinstance(errors, dict) and errors:
+            field, messages = next(iter(errors.items()))
+            message += f" ({field}: {messages[0] if isinstance(messages, list) and messages else messages})"
+    return message
+
+
+class ImportStats:
+    def __init__(self):
+        self.imported = 0
+        self.questions = 0
+        self.skipped = 0
+        self.requests = 0
+        self.latencies = []
+        self.failures = []
+        self.unknown = []
+        self.invalid = []
+        self.chunks = 0
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        return {
+            "elapsed_s": elapsed,
+            "chunks": self.chunks,
+            "imported": self.imported,
+            "questions": self.questions,
+            "skipped": self.skipped,
+            "failed": len(self.failures),
+            "unknown": len(self.unknown),
+            "invalid": len(self.invalid),
+            "requests": self.requests,
+            "retries": self.requests - self.imported - len(self.failures) - len(self.unknown),
+            "exams_per_s": self.imported / elapsed if elapsed else 0.0,
+            "questions_per_s": self.questions / elapsed if elapsed else 0.0,
+            "p50_ms": percentile(latencies, 50) * 1000 if latencies else None,
+            "p95_ms": percentile(latencies, 95) * 1000 if latencies else None,
+            "failures": [{"index": index, "title": title, "error": error} for index, title, error in self.failures],
+            "unknown_exams": [{"index": index, "title": title, "error": error}
+                              for index, title, error in self.unknown],
+            "invalid_exams": [{"index": index, "title": title, "errors": errors}
+                              for index, title, errors in self.invalid],
+        }
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for element in iterable:
+        chunk.append(element)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+async def run_import(exams, base_url=None, token=None, concurrency=DEFAULT_CONCURRENCY, rate=None,
+                     chunk_size=DEFAULT_CHUNK_SIZE, retries=DEFAULT_RETRIES, timeout=DEFAULT_TIMEOUT,
+                     checkpoint=None, dry_run=False, progress=print):
+    """
+    Validate `exams` (any iterable) and POST the valid ones that are not in
+    `checkpoint`. With dry_run nothing is sent. Returns the summary dict.
+    """
+    checkpoint = checkpoint if checkpoint is not None else Checkpoint()
+    stats = ImportStats()
+    started = time.perf_counter()
+
+    def prepared():
+        for index, exam in enumerate(exams):
+            errors = validate_exam(exam)
+            if errors:
+                stats.invalid.append((index, exam_label(exam), errors))
+                continue
+            key = exam_key(exam)
+            if key in checkpoint:
+                stats.skipped += 1
+                continue
+            if key in checkpoint.unknown:
+                stats.unknown.append((index, exam_label(exam), "outcome unknown in an earlier run (checkpoint)"))
+                continue
+            yield index, exam, key, json.dumps(exam, ensure_ascii=False).encode("utf-8")
+
+    if dry_run:
+        for _index, exam, _key, _body in prepared():
+            stats.imported += 1
+            stats.questions += len(exam["questions"])
+        return dict(stats.summary(time.perf_counter() - started), dry_run=True)
+
+    url = base_url.rstrip("/") + EXAMS_PATH
+    headers = {"Accept": "application/json", "Content-Type": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    limiter = RateLimiter(rate)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def send(session, index, exam, key, body):
+        async with slots:
+            status, text, attempts, seconds, unknown = await post_exam(session, url, headers, body, retries,
+                                                                       timeout, limiter)
+        stats.requests += attempts
+        stats.latencies.append(seconds)
+        if status is not None and 200 <= status < 300:
+            stats.imported += 1
+            stats.questions += len(exam["questions"])
+            checkpoint.record(key, _created_id(text), len(exam["questions"]), exam_label(exam))
+        elif unknown:
+            stats.unknown.append((index, exam_label(exam), _error_message(status, text)))
+            checkpoint.record_unknown(key, len(exam["questions"]), exam_label(exam))
+        else:
+            stats.failures.append((index, exam_label(exam), _error_message(status, text)))
+
+    def finished(number):
+        checkpoint.sync()
+        elapsed = time.perf_counter() - started
+        progress(f"• chunk {number}: {stats.imported} exams / {stats.questions} questions imported, "
+                 f"{len(stats.failures)} failed, {len(stats.unknown)} unknown ({stats.imported / elapsed if elapsed else 0:.1f} exams/s)")
+
+    async with client_session(concurrency) as session:
+        # The next chunk is read and queued while the previous one is in flight
+        previous = None
+        for number, chunk in enumerate(_chunks(prepared(), chunk_size), start=1):
+            tasks = asyncio.gather(*(send(session, *entry) for entry in chunk))
+            if previous is not None:
+                await previous
+                finished(number - 1)
+            previous = tasks
+            stats.chunks = number
+        if previous is not None:
+            await previous
+            finished(stats.chunks)
+    return stats.summary(time.perf_counter() - started)
+
+
+def format_report(summary, limit=10):
+    def ms(value):
+        return f"{value:.1f} ms" if value is not None else "-"
+
+    if summary.get("dry_run"):
+        lines = [f"✓ {summary['imported']} valid exams / {summary['questions']} questions read in "
+                 f"{summary['elapsed_s']:.1f} s (dry run, nothing sent)"]
+    else:
+        lines = [f"✓ {summary['imported']} exams / {summary['questions']} questions in {summary['elapsed_s']:.1f} s "
+                 f"({summary['exams_per_s']:.1f} exams/s, {summary['questions_per_s']:.1f} questions/s)",
+                 f"  {summary['chunks']} chunk(s), {summary['requests']} request(s), {summary['retries']} retried, "
+                 f"latency p50 {ms(summary['p50_ms'])}, p95 {ms(summary['p95_ms'])}"]
+    if summary["skipped"]:
+        lines.append(f"• {summary['skipped']} exam(s) already imported (checkpoint), skipped")
+    if summary["invalid"]:
+        lines.append(f"⚠ {summary['invalid']} invalid exam(s), not sent:")
+        for entry in summary["invalid_exams"][:limit]:
+            field, messages = next(iter(entry["errors"].items()))
+            more = len(entry["errors"]) - 1
+            lines.append(f"  #{entry['index']} {entry['title']}: {field}: {messages[0]}"
+                         + (f" (+{more} more)" if more else ""))
+    if summary["failed"]:
+        lines.append(f"✗ {summary['failed']} exam(s) failed:")
+        for entry in summary["failures"][:limit]:
+            lines.append(f"  #{entry['index']} {entry['title']}: {entry['error']}")
+    if summary["unknown"]:
+        lines.append(f"✗ {summary['unknown']} exam(s) with unknown outcome, not resent (check them on the server):")
+        for entry in summary["unknown_exams"][:limit]:
+            lines.append(f"  #{entry['index']} {entry['title']}: {entry['error']}")
+    return lines
+
+
+# --- CLI ---
+
+def _load_defaults(path):
+    if not path:
+        return None
+    with open(path, encoding="utf-8") as f:
+        defaults = json.load(f)
+    if not isinstance(defaults, dict):
+        raise argparse.ArgumentTypeError(f"{path}: expected a JSON object of exam fields")
+    return defaults
+
+
+async def _run(args):
+    exams = read_exams(args.source, _load_defaults(args.defaults))
+    checkpoint = Checkpoint(args.checkpoint)
+    if checkpoint.done or checkpoint.unknown:
+        print(f"• Resuming: {len(checkpoint.done)} exam(s) in {args.checkpoint}"
+              + (f", {len(checkpoint.unknown)} with unknown outcome" if checkpoint.unknown else ""))
+    options = dict(token=args.token, concurrency=args.concurrency, rate=args.rate, chunk_size=args.chunk_size,
+                   retries=args.retries, timeout=args.timeout, checkpoint=checkpoint, dry_run=args.dry_run)
+    try:
+        if args.stand_in:
+            async with StandIn(**stand_in_options(args)) as base_url:
+                return await run_import(exams, base_url, **options)
+        return await run_import(exams, args.base_url, **options)
+    finally:
+        checkpoint.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import exams and questions in bulk through the API.")
+    parser.add_argument("source", help="exams as JSON, JSON Lines or CSV (one row per question)")
+    parser.add_argument("--defaults", metavar="PATH", help="JSON object of exam fields applied to every exam")
+    parser.add_argument("--base-url", help="API base URL, e.g. https://staging.example.com")
+    parser.add_argument("--token", help="bearer token of an admin or trainer")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="exams read and checkpointed "
+                        "per chunk (default: %(default)s)")
+    parser.add_argument("--rate", type=float, default=None, help="max requests per second (default: unlimited)")
+    parser.add_argument("--retries", type=int, default=DEFAULT_RETRIES, help="retries per exam when it was not processed (connection refused, 429, 503 with "
+                        "Retry-After)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="per-request timeout in seconds")
+    parser.add_argument("--checkpoint", metavar="PATH", help="resume file of imported exams (JSON Lines)")
+    parser.add_argument("--dry-run", action="store_true", help="only read and validate, send nothing")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--stand-in", action="store_true", help="send to a local stand-in server")
+    parser.add_argument("--stand-in-latency", type=float, default=0.005, help="stand-in base latency in seconds")
+    parser.add_argument("--stand-in-error-rate", type=float, default=0.0, help="share of stand-in 500 responses")
+    args = parser.parse_args(argv)
+    if not (args.base_url or args.stand_in or args.dry_run):
+        parser.error("--base-url is required (or use --stand-in / --dry-run)")
+
+    summary = asyncio.run(_run(args))
+    print("\n".join(format_report(summary)))
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        print(f"✓ Report saved to {args.json}")
+    return 1 if summary["failed"] or summary["unknown"] or summary["invalid"] else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,430 @@
+"""
+Collection-driven load test harness.
+
+Reads a Postman collection, resolves {{variables}} (base_url, auth_token,
+...), and replays the selected requests concurrently with asyncio and a
+pooled aiohttp client. Concurrency, request rate and duration are
+configurable; the report has p50/p95/p99 latency, throughput and error
+rates per endpoint, as a table and optionally as JSON.
+
+Only GET requests are replayed unless --methods says otherwise, so a
+load test never creates or deletes data by accident.
+
+--stand-in starts a local aiohttp server and points base_url at it, so
+the harness itself can be exercised offline.
+
+Usage:
+    python -m postman_tools.loadtest Agrar_Portal_API.postman_collection.json \\
+        --base-url https://staging.example.com --token "$TOKEN" \\
+        --folder "Training - Public & Enhanced Endpoints" -c 50 --rate 200 --duration 60
+    python -m postman_tools.loadtest Agrar_Portal_API.postman_collection.json --stand-in --duration 5
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import math
+import random
+import re
+import socket
+import time
+from collections import Counter, defaultdict
+
+import aiohttp
+from aiohttp import web
+
+from .builder import normalize_path, request_url
+from .streaming import load_collection
+
+DEFAULT_CONCURRENCY = 20
+DEFAULT_TIMEOUT = 10.0
+PERCENTILES = (50, 95, 99)
+_VARIABLE = re.compile(r"\{\{\s*([\w.-]+)\s*\}\}")
+
+
+# --- Collection -> endpoints ---
+
+def collection_variables(collection, overrides=None):
+    """Collection variables ({"key", "value"} list) merged with overrides."""
+    variables = {entry["key"]: str(entry.get("value", "")) for entry in collection.get("variable", [])
+                 if "key" in entry}
+    variables.update(overrides or {})
+    return variables
+
+
+def resolve(text, variables):
+    """Replace {{name}} with its value; unknown variables are left as they are."""
+    return _VARIABLE.sub(lambda m: variables.get(m.group(1), m.group(0)), text)
+
+
+def _auth_headers(auth, variables):
+    """Authorization header for Postman "bearer" / "basic" auth objects."""
+    if not auth or auth.get("type") == "noauth":
+        return {}
+    values = {entry["key"]: entry.get("value", "") for entry in auth.get(auth.get("type"), [])}
+    if auth["type"] == "bearer":
+        return {"Authorization": f"Bearer {resolve(str(values.get('token', '')), variables)}"}
+    if auth["type"] == "basic":
+        credentials = aiohttp.BasicAuth(resolve(str(values.get("username", "")), variables),
+                                        resolve(str(values.get("password", "")), variables))
+        return {"Authorization": credentials.encode()}
+    return {}
+
+
+class Endpoint:
+    """One replayable request with variables already resolved."""
+
+    __slots__ = ("name", "folder", "method", "url", "headers", "body", "key")
+
+    def __init__(self, name, folder, method, url, headers, body, key):
+        self.name = name
+        self.folder = folder
+        self.method = method
+        self.url = url
+        self.headers = headers
+        self.body = body
+        self.key = key
+
+    @property
+    def label(self):
+        return f"{self.method} {self.key[1]}"
+
+
+def _request_body(body, variables):
+    if not body:
+        return None
+    mode = body.get("mode")
+    if mode == "raw":
+        return resolve(body.get("raw", ""), variables).encode("utf-8")
+    if mode in ("urlencoded", "formdata"):
+        # File fields cannot be replayed, only text fields are sent
+        return {entry["key"]: resolve(str(entry.get("value", "")), variables)
+                for entry in body.get(mode, []) if entry.get("type", "text") == "text" and not entry.get("disabled")}
+    return None
+
+
+def _json_body(body):
+    """Raw body marked as JSON; Postman derives the Content-Type header from it."""
+    return bool(body) and body.get("mode") == "raw" and \
+        body.get("options", {}).get("raw", {}).get("language") == "json"
+
+
+def collect_endpoints(collection, variables, folders=None, methods=("GET",), auth_default=True):
+    """
+    Endpoints of the requests in `collection`, depth first. `folders` limits
+    the result to the named top-level folders. Auth is inherited from the
+    collection and folders unless a request sets its own.
+    """
+    wanted = set(folders) if folders else None
+    methods = {method.upper() for method in methods} if methods else None
+    endpoints = []
+
+    def walk(items, folder, auth):
+        for item in items:
+            if "item" in item:
+                if not folder and wanted is not None and item.get("name") not in wanted:
+                    continue
+                walk(item["item"], folder + (item.get("name", ""),), item.get("auth", auth))
+                continue
+            request = item.get("request")
+            if not isinstance(request, dict):
+                continue
+            method = request.get("method", "GET").upper()
+            if methods is not None and method not in methods:
+                continue
+            raw_url = request_url(request)
+            headers = _auth_headers(request.get("auth", auth), variables) if auth_default else {}
+            for header in request.get("header", []):
+                if not header.get("disabled"):
+                    headers[header["key"]] = resolve(str(header.get("value", "")), variables)
+            if _json_body(request.get("body")) and not any(key.lower() == "content-type" for key in headers):
+                headers["Content-Type"] = "application/json"
+            endpoints.append(Endpoint(item.get("name", ""), folder, method, resolve(raw_url, variables),
+                                      headers, _request_body(request.get("body"), variables),
+                                      (method, normalize_path(raw_url))))
+
+    walk(collection.get("item", []), (), collection.get("auth"))
+    return endpoints
+
+
+# --- Measurement ---
+
+def percentile(sorted_values, q):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+class LatencyStats:
+    """Per-endpoint latencies, status codes and errors."""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.statuses = defaultdict(Counter)
+        self.errors = defaultdict(Counter)
+
+    def record(self, label, seconds, status=None, error=None):
+        self.latencies[label].append(seconds)
+        if error is not None:
+            self.errors[label][error] += 1
+        else:
+            self.statuses[label][status] += 1
+
+    def summary(self, elapsed):
+        """{"endpoints": {label: {...}}, "total": {...}}; latencies in milliseconds."""
+        def describe(latencies, statuses, errors):
+            values = sorted(latencies)
+            count = len(values)
+            failed = sum(errors.values()) + sum(n for code, n in statuses.items() if code >= 500)
+            result = {
+                "requests": count,
+                "throughput_rps": count / elapsed if elapsed else 0.0,
+                "mean_ms": sum(values) / count * 1000 if count else None,
+                "max_ms": values[-1] * 1000 if count else None,
+                "error_rate": failed / count if count else 0.0,
+                "client_errors": sum(n for code, n in statuses.items() if 400 <= code < 500),
+                "statuses": {str(code): n for code, n in sorted(statuses.items())},
+                "errors": dict(errors),
+            }
+            for q in PERCENTILES:
+                value = percentile(values, q)
+                result[f"p{q}_ms"] = value * 1000 if value is not None else None
+            return result
+
+        endpoints = {label: describe(self.latencies[label], self.statuses[label], self.errors[label])
+                     for label in sorted(self.latencies)}
+        all_statuses, all_errors = Counter(), Counter()
+        for counter in self.statuses.values():
+            all_statuses.update(counter)
+        for counter in self.errors.values():
+            all_errors.update(counter)
+        total = describe(list(itertools.chain.from_iterable(self.latencies.values())), all_statuses, all_errors)
+        return {"elapsed_s": elapsed, "endpoints": endpoints, "total": total}
+
+
+class RateLimiter:
+    """Spaces request starts evenly at `rate` per second (None = unlimited)."""
+
+    def __init__(self, rate=None):
+        self.interval = 1 / rate if rate else 0.0
+        self._next = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.perf_counter()
+        slot = max(now, self._next)
+        self._next = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def fetch(session, endpoint, timeout=DEFAULT_TIMEOUT):
+    """Send one request and read the body. Returns (status, seconds, error name)."""
+    started = time.perf_counter()
+    try:
+        async with session.request(endpoint.method, endpoint.url, headers=endpoint.headers, data=endpoint.body,
+                                   timeout=aiohttp.ClientTimeout(total=timeout)) as response:
+            await response.read()
+            return response.status, time.perf_counter() - started, None
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as exc:
+        return None, time.perf_counter() - started, type(exc).__name__
+
+
+def client_session(concurrency):
+    """Pooled client: at most `concurrency` connections, DNS cached."""
+    connector = aiohttp.TCPConnector(limit=concurrency, limit_per_host=concurrency, ttl_dns_cache=300)
+    return aiohttp.ClientSession(connector=connector)
+
+
+async def run_load(endpoints, concurrency=DEFAULT_CONCURRENCY, rate=None, duration=None,
+                   total_requests=None, timeout=DEFAULT_TIMEOUT):
+    """
+    Replay `endpoints` round-robin from `concurrency` workers until
+    `duration` seconds pass or `total_requests` are sent (one pass over
+    the endpoints when neither is given). Returns the summary dict.
+    """
+    if not endpoints:
+        raise ValueError("No endpoints selected")
+    if duration is None and total_requests is None:
+        total_requests = len(endpoints)
+    stats = LatencyStats()
+    limiter = RateLimiter(rate)
+    schedule = itertools.cycle(endpoints)
+    sent = 0
+    started = time.perf_counter()
+    deadline = started + duration if duration else None
+
+    async def worker(session):
+        nonlocal sent
+        while True:
+            if total_requests is not None and sent >= total_requests:
+                return
+            if deadline is not None and time.perf_counter() >= deadline:
+                return
+            sent += 1
+            endpoint = next(schedule)
+            await limiter.wait()
+            status, seconds, error = await fetch(session, endpoint, timeout)
+            stats.record(endpoint.label, seconds, status, error)
+
+    async with client_session(concurrency) as session:
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+    return stats.summary(time.perf_counter() - started)
+
+
+def format_table(summary):
+    def ms(value):
+        return f"{value:8.1f}" if value is not None else "       -"
+
+    lines = [f"{'endpoint':<60} {'reqs':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'rps':>7} "
+             f"{'4xx':>5} {'err %':>6}"]
+    rows = list(summary["endpoints"].items()) + [("TOTAL", summary["total"])]
+    for label, row in rows:
+        lines.append(f"{label[:60]:<60} {row['requests']:>6} {ms(row['p50_ms'])} {ms(row['p95_ms'])} "
+                     f"{ms(row['p99_ms'])} {row['throughput_rps']:7.1f} {row['client_errors']:>5} "
+                     f"{row['error_rate'] * 100:6.1f}")
+    return lines
+
+
+# --- Local stand-in server ---
+
+def stand_in_app(latency=0.005, jitter=0.5, error_rate=0.0, slow_paths=None, seed=None, cold_latency=0.0):
+    """
+    aiohttp app answering every path with a small JSON body after
+    `latency` seconds (+/- jitter fraction). `slow_paths` maps a path
+    prefix to extra seconds; `error_rate` is the share of 500 responses.
+    `cold_latency` is added to the first request of each path and query,
+    like a response cache that starts empty.
+    """
+    rng = random.Random(seed)
+    slow_paths = slow_paths or {}
+    seen = set()
+
+    async def handler(request):
+        delay = latency * (1 + rng.uniform(-jitter, jitter))
+        for prefix, extra in slow_paths.items():
+            if request.path.startswith(prefix):
+                delay += extra
+        if cold_latency and request.path_qs not in seen:
+            seen.add(request.path_qs)
+            delay += cold_latency
+        await asyncio.sleep(max(0.0, delay))
+        if error_rate and rng.random() < error_rate:
+            return web.json_response({"message": "Server Error"}, status=500)
+        return web.json_response({"ok": True, "method": request.method, "path": request.path,
+                                  "query": dict(request.query), "data": []})
+
+    app = web.Application()
+    app.router.add_route("*", "/{tail:.*}", handler)
+    return app
+
+
+class StandIn:
+    """
+    Runs stand_in_app on 127.0.0.1 and an ephemeral port:
+
+        async with StandIn(latency=0.01) as base_url:
+            ...
+    """
+
+    def __init__(self, **options):
+        self.options = options
+        self.runner = None
+
+    async def __aenter__(self):
+        self.runner = web.AppRunner(stand_in_app(**self.options), access_log=None)
+        await self.runner.setup()
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.bind(("127.0.0.1", 0))
+        await web.SockSite(self.runner, sock).start()
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.runner.cleanup()
+
+
+# --- CLI ---
+
+def parse_variables(pairs):
+    variables = {}
+    for pair in pairs or []:
+        key, separator, value = pair.partition("=")
+        if not separator:
+            raise argparse.ArgumentTypeError(f"Expected KEY=VALUE, got {pair!r}")
+        variables[key] = value
+    return variables
+
+
+def add_target_arguments(parser):
+    """Collection / variable / stand-in options shared with the cache warmer."""
+    parser.add_argument("collection", help="Postman collection JSON")
+    parser.add_argument("--base-url", help="overrides the {{base_url}} variable")
+    parser.add_argument("--token", help="overrides the {{auth_token}} variable")
+    parser.add_argument("--var", action="append", metavar="KEY=VALUE", help="override any collection variable")
+    parser.add_argument("--folder", action="append", help="only requests in this top-level folder (repeatable)")
+    parser.add_argument("-c", "--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=None, help="max requests per second (default: unlimited)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="per-request timeout in seconds")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--stand-in", action="store_true", help="run against a local stand-in server")
+    parser.add_argument("--stand-in-latency", type=float, default=0.005, help="stand-in base latency in seconds")
+    parser.add_argument("--stand-in-error-rate", type=float, default=0.0, help="share of stand-in 500 responses")
+
+
+def target_variables(args, collection):
+    overrides = parse_variables(args.var)
+    if args.base_url:
+        overrides["base_url"] = args.base_url.rstrip("/")
+    if args.token:
+        overrides["auth_token"] = args.token
+    return collection_variables(collection, overrides)
+
+
+def stand_in_options(args):
+    return {"latency": args.stand_in_latency, "error_rate": args.stand_in_error_rate}
+
+
+async def _run(args):
+    collection = load_collection(args.collection)
+
+    async def go(base_url=None):
+        variables = target_variables(args, collection)
+        if base_url:
+            variables["base_url"] = base_url
+        endpoints = collect_endpoints(collection, variables, args.folder, args.methods.split(","))
+        print(f"✓ {len(endpoints)} endpoint(s) selected, concurrency {args.concurrency}, "
+              f"rate {args.rate or 'unlimited'}, {f'{args.duration:g} s' if args.duration else 'one pass'}")
+        return await run_load(endpoints, args.concurrency, args.rate, args.duration, args.requests, args.timeout)
+
+    if args.stand_in:
+        async with StandIn(**stand_in_options(args)) as base_url:
+            return await go(base_url)
+    return await go()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load test the API with requests from a Postman collection.")
+    add_target_arguments(parser)
+    parser.add_argument("--methods", default="GET", help="comma separated HTTP methods to replay (default: GET)")
+    parser.add_argument("--duration", type=float, default=None, help="run for this many seconds")
+    parser.add_argument("-n", "--requests", type=int, default=None, help="stop after this many requests")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(_run(args))
+    print("\n".join(format_table(summary)))
+    total = summary["total"]
+    print(f"\n✓ {total['requests']} requests in {summary['elapsed_s']:.1f} s "
+          f"({total['throughput_rps']:.1f} req/s), error rate {total['error_rate']:.1%}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Report saved to {args.json}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+"""
+Registry of lazily built collection sections.
+
+Sections are registered by name and only built when a run needs them:
+
+    sections = SectionRegistry()
+    sections.copy(["Authentication", "Forum"])     # taken from the source collection
+
+    @sections.section("FAQ Management", after="Forum")
+    def faq():
+        return {"name": "FAQ Management", "item": [...]}
+
+    @sections.extends("Forum")
+    def forum_votes():
+        return [...]                                # appended to the Forum section
+
+An anchor (after= / before=) is also a dependency: when a section is
+built on its own and its anchor is not in the collection yet, the anchor
+is built first. Extensions are applied whenever their target is built.
+"""
+
+from collections import defaultdict
+
+
+class _Entry:
+    __slots__ = ("name", "build", "after", "before")
+
+    def __init__(self, name, build=None, after=None, before=None):
+        self.name = name
+        self.build = build
+        self.after = after
+        self.before = before
+
+    @property
+    def anchor(self):
+        return self.after or self.before
+
+
+class SectionRegistry:
+    def __init__(self):
+        self._entries = {}
+        self._extensions = defaultdict(list)
+
+    def __contains__(self, name):
+        return name in self._entries
+
+    def __iter__(self):
+        return iter(self._entries)
+
+    def _add(self, entry):
+        if entry.name in self._entries:
+            raise ValueError(f"Section registered twice: {entry.name!r}")
+        self._entries[entry.name] = entry
+
+    def copy(self, names):
+        """Sections copied unchanged from the source collection."""
+        for name in names:
+            self._add(_Entry(name))
+
+    def section(self, name, after=None, before=None):
+        """Decorator: the function returns the section dict."""
+        def register(build):
+            self._add(_Entry(name, build, after, before))
+            return build
+        return register
+
+    def extends(self, target):
+        """Decorator: the function returns request items appended to `target`."""
+        def register(build):
+            self._extensions[target].append(build)
+            return build
+        return register
+
+    def resolve(self, only=None, present=()):
+        """
+        Names to build, in registration order: everything, or the names in
+        `only` plus the anchors they need that are not in `present`.
+        """
+        if only is None:
+            return list(self._entries)
+        wanted = set()
+        pending = list(only)
+        while pending:
+            name = pending.pop()
+            if name not in self._entries:
+                raise KeyError(name)
+            if name in wanted:
+                continue
+            wanted.add(name)
+            anchor = self._entries[name].anchor
+            if anchor in self._entries and anchor not in present:
+                pending.append(anchor)
+        return [name for name in self._entries if name in wanted]
+
+    def apply(self, builder, source_sections, only=None, warn=print):
+        """
+        Build the resolved sections into `builder`; sections that already
+        exist are replaced in place, new ones go next to their anchor.
+        `source_sections` is called (once, only when needed) to iterate the
+        source collection's sections. Returns the names built.
+        """
+        names = self.resolve(only, present=builder)
+        copies = {name for name in names if self._entries[name].build is None}
+        if copies:
+            for section in source_sections():
+                if section.get("name") in copies:
+                    self._place(builder, self._entries[section["name"]], section, warn)
+                    copies.discard(section["name"])
+            for name in sorted(copies):
+                warn(f"⚠ Section not in the source collection, skipped: {name}")
+        for name in names:
+            entry = self._entries[name]
+            if entry.build is not None:
+                self._place(builder, entry, entry.build(), warn)
+        if only is None:
+            # Extensions of sections that are neither copied nor built
+            for target, extensions in self._extensions.items():
+                if target not in self._entries:
+                    for extend in extensions:
+                        items = extend()
+                        if not builder.extend(target, items):
+                            warn(f"⚠ Section not found, skipped {len(items)} request(s): {target}")
+        return names
+
+    def _place(self, builder, entry, section, warn):
+        for extend in self._extensions.get(entry.name, ()):
+            section.setdefault("item", []).extend(extend())
+        if entry.name in builder:
+            builder.replace(entry.name, section)
+            return
+        if entry.after:
+            placed = builder.insert_after(entry.after, section)
+        elif entry.before:
+            placed = builder.insert_before(entry.before, section)
+        else:
+            builder.append(section)
+            placed = True
+        if not placed:
+            warn(f"⚠ Anchor section not found, skipped: {entry.name} (next to {entry.anchor})")
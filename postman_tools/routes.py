@@ -0,0 +1,543 @@
+"""
+Compile routes/api.php into a route trie and validate collections with it.
+
+The parser understands the subset of Laravel's routing DSL used in this
+repo: Route::get/post/put/patch/delete/options/any/match, apiResource /
+resource (with only/except and nested "a.b" names), where* constraints,
+and prefix/middleware groups nested to any depth. Routes from api.php get
+the "api" prefix, as configured in bootstrap/app.php.
+
+Routes are compiled into a trie with literal segments tried before
+{param} segments, so every collection request is matched in a single
+walk of its path. The report lists:
+  * stale     - the path exists but not for this method
+  * unknown   - no route matches the path
+  * uncovered - routes that no request in the collection exercises
+
+Usage:
+    python -m postman_tools.routes Agrar_Portal_API.postman_collection.json
+    python -m postman_tools.routes --routes routes/api.php --json report.json --strict *.postman_collection.json
+"""
+
+import argparse
+import json
+import os
+import re
+import time
+
+from .builder import iter_requests, request_url
+from .streaming import iter_members
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DEFAULT_ROUTES = os.path.join(REPO_ROOT, "routes", "api.php")
+DEFAULT_API_PREFIX = "api"
+
+VERBS = {"get", "post", "put", "patch", "delete", "options"}
+ANY_METHODS = ("GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS")
+# name, method(s), path suffix, needs the resource parameter
+RESOURCE_ACTIONS = (
+    ("index", ("GET",), "", False),
+    ("create", ("GET",), "/create", False),
+    ("store", ("POST",), "", False),
+    ("show", ("GET",), "", True),
+    ("edit", ("GET",), "/edit", True),
+    ("update", ("PUT", "PATCH"), "", True),
+    ("destroy", ("DELETE",), "", True),
+)
+API_RESOURCE_ACTIONS = ("index", "store", "show", "update", "destroy")
+WHERE_SHORTCUTS = {
+    "whereNumber": "[0-9]+",
+    "whereAlpha": "[a-zA-Z]+",
+    "whereAlphaNumeric": "[a-zA-Z0-9]+",
+    "whereUuid": "[\\da-fA-F]{8}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{4}-[\\da-fA-F]{12}",
+    "whereUlid": "[0-7][0-9a-hjkmnp-tv-zA-HJKMNP-TV-Z]{25}",
+}
+
+_TOKEN = re.compile(r"""
+    (?P<skip>\s+|//[^\n]*|\#[^\n]*|/\*.*?\*/)
+  | (?P<string>'(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")
+  | (?P<op>->|::|=>)
+  | (?P<name>\$?[A-Za-z_\\][\w\\]*)
+  | (?P<number>\d+)
+  | (?P<punct>.)
+""", re.S | re.X)
+
+
+class _Symbol(str):
+    """A bare PHP name (class, constant), as opposed to a string literal."""
+
+
+def tokenize(text):
+    """[(kind, value)] without whitespace and comments."""
+    tokens = []
+    for match in _TOKEN.finditer(text):
+        kind = match.lastgroup
+        if kind == "skip":
+            continue
+        value = match.group()
+        if kind == "string":
+            value = re.sub(r"\\(.)", r"\1", value[1:-1])
+        tokens.append((kind, value))
+    return tokens
+
+
+class Route:
+    __slots__ = ("methods", "uri", "middleware", "where", "action", "line")
+
+    def __init__(self, methods, uri, middleware, where, action, line=None):
+        self.methods = methods
+        self.uri = uri
+        self.middleware = middleware
+        self.where = where
+        self.action = action
+        self.line = line
+
+    def __repr__(self):
+        return f"Route({'|'.join(self.methods)} /{self.uri})"
+
+
+def singular(word):
+    """Laravel-style resource parameter name: "internship-programs" -> "internship_program"."""
+    word = word.replace("-", "_")
+    if word.endswith("ies"):
+        return word[:-3] + "y"
+    if word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+class _Parser:
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.i = 0
+        self.stack = []
+        self.routes = []
+
+    def peek(self, offset=0):
+        index = self.i + offset
+        return self.tokens[index][1] if index < len(self.tokens) else None
+
+    def expect(self, value):
+        if self.peek() != value:
+            raise ValueError(f"Expected {value!r} at token {self.i}, found {self.peek()!r}")
+        self.i += 1
+
+    def skip_balanced(self, opener, closer):
+        depth = 0
+        while self.i < len(self.tokens):
+            value = self.peek()
+            self.i += 1
+            if value == opener:
+                depth += 1
+            elif value == closer:
+                depth -= 1
+                if depth == 0:
+                    return
+
+    def skip_closure_head(self):
+        """`function (...) use (...)` / `fn (...)` up to the body."""
+        self.i += 1
+        self.skip_balanced("(", ")")
+        if self.peek() == "use":
+            self.i += 1
+            self.skip_balanced("(", ")")
+        if self.peek() == ":":
+            self.i += 2
+
+    def value(self):
+        """A literal (string, number, array) or None; other expressions are skipped."""
+        kind, value = self.tokens[self.i]
+        if kind == "string":
+            self.i += 1
+            return value
+        if kind == "number":
+            self.i += 1
+            return int(value)
+        if value == "[":
+            return self.array()
+        if value in ("function", "fn"):
+            self.skip_closure_head()
+            if self.peek() == "{":
+                self.skip_balanced("{", "}")
+            else:
+                self.skip_expression()
+            return None
+        if kind == "name":
+            self.i += 1
+            if self.peek() == "::":
+                self.i += 2
+            if self.peek() == "(":
+                self.skip_balanced("(", ")")
+            return _Symbol(value)
+        self.skip_expression()
+        return None
+
+    def skip_expression(self):
+        depth = 0
+        while self.i < len(self.tokens):
+            value = self.peek()
+            if depth == 0 and value in (",", ")", "]", ";"):
+                return
+            if value in ("(", "[", "{"):
+                depth += 1
+            elif value in (")", "]", "}"):
+                depth -= 1
+            self.i += 1
+
+    def array(self):
+        self.expect("[")
+        items, pairs = [], {}
+        while self.peek() != "]":
+            item = self.value()
+            if self.peek() == "=>":
+                self.i += 1
+                pairs[item] = self.value()
+            else:
+                items.append(item)
+            if self.peek() == ",":
+                self.i += 1
+        self.i += 1
+        return pairs if pairs else items
+
+    def arguments(self):
+        self.expect("(")
+        args = []
+        while self.peek() != ")":
+            args.append(self.value())
+            if self.peek() == ",":
+                self.i += 1
+        self.i += 1
+        return args
+
+    def context(self):
+        prefix, middleware = [], []
+        for frame in self.stack:
+            if frame:
+                if frame.get("prefix"):
+                    prefix.append(frame["prefix"].strip("/"))
+                middleware.extend(frame.get("middleware", []))
+        return prefix, middleware
+
+    def chain(self):
+        """Parse `Route::a(...)->b(...)...`; returns the calls, or None when a group body opens."""
+        calls = []
+        while True:
+            name = self.peek()
+            self.i += 1
+            if self.peek() != "(":
+                return calls
+            if name == "group":
+                self.expect("(")
+                if self.peek() in ("function", "fn"):
+                    self.skip_closure_head()
+                    if self.peek() == "{":
+                        self.i += 1
+                        self.stack.append(_group_frame(calls))
+                        return None
+                self.i -= 1
+            line = self.i
+            calls.append((name, self.arguments(), line))
+            if self.peek() != "->":
+                return calls
+            self.i += 1
+
+    def parse(self):
+        while self.i < len(self.tokens):
+            value = self.peek()
+            if value == "Route" and self.peek(1) == "::":
+                self.i += 2
+                calls = self.chain()
+                if calls:
+                    self.register(calls)
+                continue
+            if value == "{":
+                self.stack.append(None)
+            elif value == "}" and self.stack:
+                self.stack.pop()
+            self.i += 1
+        return self.routes
+
+    def register(self, calls):
+        verb, args, line = calls[0]
+        where, middleware, only, except_ = {}, [], None, None
+        for name, call_args, _line in calls[1:]:
+            if name == "where" and call_args:
+                if isinstance(call_args[0], dict):
+                    where.update(call_args[0])
+                elif len(call_args) > 1:
+                    where[call_args[0]] = call_args[1]
+            elif name in WHERE_SHORTCUTS:
+                for param in _flatten_names(call_args):
+                    where[param] = WHERE_SHORTCUTS[name]
+            elif name == "whereIn" and len(call_args) > 1:
+                where[call_args[0]] = "|".join(re.escape(str(item)) for item in call_args[1])
+            elif name == "middleware":
+                middleware.extend(_flatten_names(call_args))
+            elif name == "only":
+                only = set(_flatten_names(call_args))
+            elif name == "except":
+                except_ = set(_flatten_names(call_args))
+
+        prefix, group_middleware = self.context()
+        middleware = tuple(group_middleware + middleware)
+
+        if verb in VERBS or verb in ("any", "match"):
+            if verb == "match":
+                methods = tuple(method.upper() for method in _flatten_names(args[:1]))
+                args = args[1:]
+            elif verb == "any":
+                methods = ANY_METHODS
+            else:
+                methods = (verb.upper(),)
+            if not args or not isinstance(args[0], str):
+                return
+            uri = "/".join(part for part in prefix + [args[0].strip("/")] if part)
+            self.routes.append(Route(methods, uri, middleware, where, _action(args[1:]), line))
+        elif verb in ("apiResource", "resource") and args and isinstance(args[0], str):
+            actions = API_RESOURCE_ACTIONS if verb == "apiResource" else [action[0] for action in RESOURCE_ACTIONS]
+            self.routes.extend(_resource_routes(args[0], args[1] if len(args) > 1 else None, actions,
+                                                only, except_, prefix, middleware, where, line))
+
+
+def _flatten_names(args):
+    names = []
+    for arg in args:
+        if isinstance(arg, list):
+            names.extend(str(item) for item in arg)
+        elif arg is not None:
+            names.append(str(arg))
+    return names
+
+
+def _action(args):
+    """"Controller@method" for [Controller::class, 'method'], else None."""
+    if args and isinstance(args[0], list) and len(args[0]) == 2:
+        controller, method = args[0]
+        return f"{str(controller).rsplit(chr(92), 1)[-1]}@{method}"
+    if args and isinstance(args[0], _Symbol):
+        return str(args[0]).rsplit("\\", 1)[-1]
+    return None
+
+
+def _group_frame(calls):
+    frame = {"middleware": []}
+    for name, args, _line in calls:
+        if name == "prefix" and args and isinstance(args[0], str):
+            frame["prefix"] = args[0]
+        elif name == "middleware":
+            frame["middleware"].extend(_flatten_names(args))
+    return frame
+
+
+def _resource_routes(name, controller, actions, only, except_, prefix, middleware, where, line):
+    parts = name.strip("/").split(".")
+    base = []
+    for part in parts[:-1]:
+        base += [part, "{" + singular(part) + "}"]
+    base.append(parts[-1])
+    param = "{" + singular(parts[-1]) + "}"
+    controller_name = str(controller).rsplit("\\", 1)[-1] if controller else None
+    routes = []
+    for action, methods, suffix, needs_param in RESOURCE_ACTIONS:
+        if action not in actions or (only is not None and action not in only) \
+                or (except_ is not None and action in except_):
+            continue
+        segments = prefix + base + ([param] if needs_param else [])
+        uri = "/".join(segment for segment in segments if segment) + suffix
+        routes.append(Route(methods, uri, middleware, where,
+                            f"{controller_name}@{action}" if controller_name else action, line))
+    return routes
+
+
+def parse_routes(text, api_prefix=DEFAULT_API_PREFIX):
+    """Routes defined in a Laravel routes file, with the api prefix applied."""
+    routes = _Parser(tokenize(text)).parse()
+    if api_prefix:
+        for route in routes:
+            route.uri = f"{api_prefix.strip('/')}/{route.uri}".rstrip("/")
+    return routes
+
+
+def load_routes(path=DEFAULT_ROUTES, api_prefix=DEFAULT_API_PREFIX):
+    with open(path, encoding="utf-8") as f:
+        return parse_routes(f.read(), api_prefix)
+
+
+# --- Trie ---
+
+class _Node:
+    __slots__ = ("literals", "params", "routes")
+
+    def __init__(self):
+        self.literals = {}
+        self.params = {}
+        self.routes = {}
+
+
+_PARAM = re.compile(r"^\{(\w+)(\?)?\}$")
+
+
+class RouteTrie:
+    """
+    Parametric route trie. Literal children are tried before {param}
+    children; params with a where() constraint only match segments that
+    satisfy it (placeholders such as {{id}} or {id} always match).
+    """
+
+    def __init__(self, routes=()):
+        self.root = _Node()
+        self.routes = []
+        for route in routes:
+            self.add(route)
+
+    def add(self, route):
+        self.routes.append(route)
+        nodes = [self.root]
+        for segment in route.uri.split("/") if route.uri else []:
+            param = _PARAM.match(segment)
+            next_nodes = []
+            for node in nodes:
+                if param:
+                    pattern = route.where.get(param.group(1))
+                    key = pattern or ""
+                    if key not in node.params:
+                        node.params[key] = (re.compile(f"(?:{pattern})\\Z") if pattern else None, _Node())
+                    next_nodes.append(node.params[key][1])
+                else:
+                    next_nodes.append(node.literals.setdefault(segment, _Node()))
+            # {param?} may be left out: the route ends at the parent node too
+            nodes = next_nodes + (nodes if param and param.group(2) else [])
+        for node in nodes:
+            for method in route.methods:
+                # As in Laravel, a later definition of the same method + URI wins
+                node.routes[method] = route
+
+    def _walk(self, node, segments, index):
+        if index == len(segments):
+            if node.routes:
+                yield node
+            return
+        segment = segments[index]
+        placeholder = segment[:1] in ("{", ":")
+        child = node.literals.get(segment)
+        if child is not None:
+            yield from self._walk(child, segments, index + 1)
+        for pattern, child in node.params.values():
+            if placeholder or pattern is None or pattern.match(segment):
+                yield from self._walk(child, segments, index + 1)
+
+    def match(self, method, segments):
+        """
+        (route, allowed): the route for `method` (None when no route
+        matches), plus the methods registered for the first matching path.
+        """
+        allowed = None
+        for node in self._walk(self.root, segments, 0):
+            route = node.routes.get(method) or (node.routes.get("GET") if method == "HEAD" else None)
+            if route is not None:
+                return route, set(node.routes)
+            if allowed is None:
+                allowed = set(node.routes)
+        return None, allowed
+
+
+def url_segments(raw):
+    """"{{base_url}}/api/v1/faqs/{{faq_id}}?x=1" -> ["api", "v1", "faqs", "{{faq_id}}"]"""
+    path = raw.split("?", 1)[0].split("#", 1)[0]
+    if path.startswith("{{"):
+        path = path[path.find("}}") + 2:]
+    elif "://" in path:
+        path = path.split("://", 1)[1].partition("/")[2]
+    return [segment for segment in path.split("/") if segment]
+
+
+def validate(trie, requests):
+    """
+    requests: iterable of (source, folder, item). Returns a report dict with
+    matched count and stale / unknown / uncovered lists.
+    """
+    matched, stale, unknown = 0, [], []
+    covered = set()
+    for source, folder, item in requests:
+        request = item["request"]
+        method = request.get("method", "GET").upper()
+        raw = request_url(request)
+        route, allowed = trie.match(method, url_segments(raw))
+        entry = {"source": source, "folder": " / ".join(folder), "name": item.get("name"),
+                 "method": method, "url": raw}
+        if route is not None:
+            matched += 1
+            covered.add(id(route))
+        elif allowed:
+            stale.append(dict(entry, allowed=sorted(allowed)))
+        else:
+            unknown.append(entry)
+    uncovered = [{"methods": list(route.methods), "uri": "/" + route.uri, "action": route.action,
+                  "middleware": list(route.middleware)}
+                 for route in trie.routes if id(route) not in covered]
+    return {"routes": len(trie.routes), "requests": matched + len(stale) + len(unknown), "matched": matched,
+            "stale": stale, "unknown": unknown, "uncovered": uncovered}
+
+
+def collection_requests(path):
+    """(file name, folder, item) for every request in a collection, read section by section."""
+    name = os.path.basename(path)
+    for member, section in iter_members(path):
+        if member == "item":
+            for folder, item in iter_requests([section]):
+                if isinstance(item.get("request"), dict):
+                    yield name, folder, item
+
+
+def format_report(report, limit=None):
+    lines = []
+    sections = (
+        ("stale", "✗ Stale (path exists, method does not)", lambda e: f"{e['method']:<7} {e['url']}  "
+                                                                  f"[{e['folder']}] allowed: {', '.join(e['allowed'])}"),
+        ("unknown", "✗ Unknown (no matching route)", lambda e: f"{e['method']:<7} {e['url']}  [{e['folder']}]"),
+        ("uncovered", "• Uncovered routes (not in the collection)",
+         lambda e: f"{'|'.join(e['methods']):<7} {e['uri']}  {e['action'] or ''}"),
+    )
+    for key, title, describe in sections:
+        entries = report[key]
+        if not entries:
+            continue
+        lines.append(f"{title}: {len(entries)}")
+        for entry in entries[:limit]:
+            lines.append(f"    {describe(entry)}")
+        if limit is not None and len(entries) > limit:
+            lines.append(f"    ... {len(entries) - limit} more")
+    return lines
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Validate Postman collections against routes/api.php.")
+    parser.add_argument("collections", nargs="+")
+    parser.add_argument("--routes", default=DEFAULT_ROUTES, help="Laravel routes file (default: routes/api.php)")
+    parser.add_argument("--api-prefix", default=DEFAULT_API_PREFIX, help="URI prefix of the routes file")
+    parser.add_argument("--limit", type=int, default=None, help="show at most this many entries per list")
+    parser.add_argument("--json", metavar="PATH", help="also write the report as JSON")
+    parser.add_argument("--strict", action="store_true", help="exit with 1 when stale or unknown requests exist")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    trie = RouteTrie(load_routes(args.routes, args.api_prefix))
+    compiled = time.perf_counter()
+    requests = (request for path in args.collections for request in collection_requests(path))
+    report = validate(trie, requests)
+    finished = time.perf_counter()
+
+    print("\n".join(format_report(report, args.limit)))
+    print(f"\n✓ {report['routes']} routes, {report['requests']} requests: {report['matched']} matched, "
+          f"{len(report['stale'])} stale, {len(report['unknown'])} unknown, "
+          f"{len(report['uncovered'])} routes uncovered "
+          f"(compile {(compiled - started) * 1000:.1f} ms, match {(finished - compiled) * 1000:.1f} ms)")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"✓ Report saved to {args.json}")
+    return 1 if args.strict and (report["stale"] or report["unknown"]) else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,255 @@
+"""
+Streaming read/write for large Postman collections.
+
+iter_members parses a collection one top-level member at a time; array
+members such as "item" are yielded element by element, so only one
+section is held in memory at once (plus the read buffer). iter_elements
+does the same for a file whose top level is an array.
+
+CollectionWriter writes a collection incrementally, either byte-identical
+to json.dump(indent=2, ensure_ascii=False) or compact (no whitespace,
+C encoder).
+
+Usage:
+    python -m postman_tools.streaming input.json -o output.json --compact
+"""
+
+import argparse
+import json
+import os
+import time
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+STREAMED_MEMBERS = ("item",)
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+# Yielded by iter_members(mark_empty=True) for an empty streamed array
+EMPTY_ARRAY = object()
+
+
+class _Scanner:
+    """Incremental JSON tokenizer over a text file, built on JSONDecoder.raw_decode."""
+
+    def __init__(self, f, chunk_size=DEFAULT_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self):
+        """Read more text; grows geometrically so re-parsing a large value stays linear."""
+        if self.eof:
+            return False
+        data = self.f.read(max(self.chunk_size, len(self.buf) - self.pos))
+        if not data:
+            self.eof = True
+            return False
+        self.buf = self.buf[self.pos:] + data
+        self.pos = 0
+        return True
+
+    def peek(self):
+        """Next non-whitespace character ("" at end of input), not consumed."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf) or not self._fill():
+                return self.buf[self.pos:self.pos + 1]
+
+    def expect(self, char):
+        found = self.peek()
+        if found != char:
+            raise ValueError(f"Expected {char!r}, found {found or 'end of input'!r}")
+        self.pos += 1
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number cut at the end of the buffer ("2" of "2.5e10") may continue
+            # in the next chunk: accept a value only when a delimiter follows
+            if (end == len(self.buf) or self.buf[end] not in _DELIMITERS) and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_members(path, streamed=STREAMED_MEMBERS, chunk_size=DEFAULT_CHUNK_SIZE, mark_empty=False):
+    """
+    Yield (name, value) for each top-level member of the JSON object in
+    `path`. For members named in `streamed` whose value is an array, one
+    (name, element) pair is yielded per element instead; an empty array
+    yields nothing, or (name, EMPTY_ARRAY) with mark_empty=True.
+    """
+    with open(path, encoding="utf-8-sig") as f:
+        scanner = _Scanner(f, chunk_size)
+        scanner.expect("{")
+        if scanner.peek() == "}":
+            return
+        while True:
+            name = scanner.value()
+            scanner.expect(":")
+            if name in streamed and scanner.peek() == "[":
+                scanner.expect("[")
+                if scanner.peek() == "]":
+                    scanner.pos += 1
+                    if mark_empty:
+                        yield name, EMPTY_ARRAY
+                else:
+                    while True:
+                        yield name, scanner.value()
+                        if scanner.peek() == "]":
+                            scanner.pos += 1
+                            break
+                        scanner.expect(",")
+            else:
+                yield name, scanner.value()
+            if scanner.peek() == "}":
+                return
+            scanner.expect(",")
+
+
+def iter_elements(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Yield the elements of the top-level JSON array in `path` one at a time."""
+    with open(path, encoding="utf-8-sig") as f:
+        scanner = _Scanner(f, chunk_size)
+        scanner.expect("[")
+        if scanner.peek() == "]":
+            return
+        while True:
+            yield scanner.value()
+            if scanner.peek() == "]":
+                return
+            scanner.expect(",")
+
+
+def load_collection(path):
+    """Whole collection as a dict, read section by section."""
+    collection = {}
+    for name, value in iter_members(path, mark_empty=True):
+        if name == "item":
+            items = collection.setdefault("item", [])
+            if value is not EMPTY_ARRAY:
+                items.append(value)
+        else:
+            collection[name] = value
+    collection.setdefault("item", [])
+    return collection
+
+
+def _indent(text, prefix):
+    return text.replace("\n", "\n" + prefix)
+
+
+class CollectionWriter:
+    """
+    Incremental writer for a top-level JSON object:
+
+        with CollectionWriter(f) as writer:
+            writer.member("info", info)
+            writer.begin_array("item")
+            for section in sections:
+                writer.element(section)
+            writer.end_array()
+    """
+
+    def __init__(self, f, compact=False):
+        self.f = f
+        self.compact = compact
+        self._members = 0
+        self._elements = None
+
+    def __enter__(self):
+        self.f.write("{")
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.f.write("}" if self.compact or not self._members else "\n}")
+
+    def dumps(self, value):
+        if self.compact:
+            return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+        return json.dumps(value, indent=2, ensure_ascii=False)
+
+    def _key(self, name):
+        separator = "," if self._members else ""
+        self._members += 1
+        if self.compact:
+            self.f.write(f"{separator}{json.dumps(name, ensure_ascii=False)}:")
+        else:
+            self.f.write(f"{separator}\n  {json.dumps(name, ensure_ascii=False)}: ")
+
+    def member(self, name, value):
+        self._key(name)
+        self.f.write(self.dumps(value) if self.compact else _indent(self.dumps(value), "  "))
+
+    def begin_array(self, name):
+        self._key(name)
+        self.f.write("[")
+        self._elements = 0
+
+    def element(self, value=None, text=None):
+        """Write one array element; `text` is an already serialized value (see dumps)."""
+        text = self.dumps(value) if text is None else text
+        if self.compact:
+            self.f.write(f",{text}" if self._elements else text)
+        else:
+            self.f.write(f"{',' if self._elements else ''}\n    {_indent(text, '    ')}")
+        self._elements += 1
+
+    def end_array(self):
+        self.f.write("]" if self.compact or not self._elements else "\n  ]")
+        self._elements = None
+
+
+def rewrite(source, destination, compact=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Copy a collection section by section (reformatting it); returns the section count."""
+    sections = 0
+    current = None
+    with open(destination, "w", encoding="utf-8") as f, CollectionWriter(f, compact) as writer:
+        for name, value in iter_members(source, chunk_size=chunk_size, mark_empty=True):
+            if name in STREAMED_MEMBERS:
+                if current != name:
+                    if current is not None:
+                        writer.end_array()
+                    writer.begin_array(name)
+                    current = name
+                if value is not EMPTY_ARRAY:
+                    writer.element(value)
+                    sections += 1
+                continue
+            if current is not None:
+                writer.end_array()
+                current = None
+            writer.member(name, value)
+        if current is not None:
+            writer.end_array()
+    return sections
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Rewrite a Postman collection section by section.")
+    parser.add_argument("source")
+    parser.add_argument("-o", "--output", required=True)
+    parser.add_argument("--compact", action="store_true", help="write minified JSON instead of indent=2")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="read buffer in characters")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    sections = rewrite(args.source, args.output, args.compact, args.chunk_size)
+    before, after = os.path.getsize(args.source), os.path.getsize(args.output)
+    print(f"✓ {sections} sections: {before / 1024:.1f} KB -> {after / 1024:.1f} KB "
+          f"({time.perf_counter() - started:.2f} s)")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,315 @@
+"""
+Post-deploy cache warmer for the public GET endpoints of a collection.
+
+Picks every GET request that is sent without authentication (the
+create_request(..., auth=False) requests, or "noauth" after dedupe),
+expands it into concrete URLs and fetches each URL once cold and then
+--warm-rounds more times, with bounded concurrency and an optional rate
+limit. The report has cold and warm latency per endpoint, so a deploy
+shows which responses were expensive to build and whether they are
+cached now.
+
+Expansion comes from a seed file (--seeds) and the command line:
+
+    {
+      "ids": {"trainings": [1, 2, 3], "/certificates/verify/{}": ["3f9c..."]},
+      "pages": 3,
+      "paginated": ["/api/v1/trainings/public"]
+    }
+
+  * An id segment ({{training_id}}, {param}, :param or a number) is
+    replaced by the ids seeded for its normalized path or for the segment
+    before it ("trainings" for /api/v1/trainings/{}/detailed). Without
+    seeds the collection's own value is used; an unresolved placeholder
+    is skipped.
+  * A request with a page / per_page query parameter, or listed under
+    "paginated", is fetched for page=1..pages (when pages > 1). Empty
+    query parameters are dropped.
+
+Usage:
+    python -m postman_tools.warm_cache Agrar_Portal_API_Complete_Updated.postman_collection.json \\
+        --base-url https://api.example.com --seeds warm_seeds.json -c 8 --rate 50
+    python -m postman_tools.warm_cache Agrar_Portal_API_Complete_Updated.postman_collection.json \\
+        --stand-in --ids trainings=1,2,3 --pages 2
+"""
+
+import argparse
+import asyncio
+import itertools
+import json
+import time
+from collections import defaultdict
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+from .builder import iter_requests, request_key
+from .loadtest import (Endpoint, RateLimiter, StandIn, add_target_arguments, client_session, collect_endpoints,
+                       fetch, percentile, stand_in_options, target_variables)
+from .streaming import load_collection
+
+DEFAULT_WARM_ROUNDS = 1
+DEFAULT_MAX_VARIANTS = 50
+PAGINATION_PARAMETERS = ("page", "per_page")
+
+
+# --- Seeds ---
+
+class Seeds:
+    def __init__(self, ids=None, pages=1, paginated=()):
+        self.ids = {key: [str(value) for value in values] for key, values in (ids or {}).items()}
+        self.pages = pages
+        self.paginated = tuple(paginated)
+
+    @classmethod
+    def load(cls, path=None, ids=None, pages=None):
+        """Seed file merged with --ids RESOURCE=1,2 and --pages overrides."""
+        data = {}
+        if path:
+            with open(path, encoding="utf-8") as f:
+                data = json.load(f)
+        seeds = cls(data.get("ids"), data.get("pages", 1), data.get("paginated", ()))
+        for entry in ids or []:
+            resource, separator, values = entry.partition("=")
+            if not separator:
+                raise argparse.ArgumentTypeError(f"Expected RESOURCE=ID,ID..., got {entry!r}")
+            seeds.ids[resource] = [value for value in values.split(",") if value]
+        if pages is not None:
+            seeds.pages = pages
+        return seeds
+
+    def ids_for(self, template, position):
+        """Seeded ids for the {} at segment `position` of a normalized path template."""
+        if template in self.ids:
+            return self.ids[template]
+        segments = template.strip("/").split("/")
+        return self.ids.get(segments[position - 1]) if position else None
+
+
+# --- Expansion ---
+
+def is_public(endpoint):
+    return not any(key.lower() == "authorization" for key in endpoint.headers)
+
+
+def _unresolved(segment):
+    return segment.startswith(("{", ":"))
+
+
+def request_queries(collection):
+    """(method, normalized path) -> [(key, value)] of the enabled, non-empty Postman query parameters."""
+    queries = {}
+    for _folder, item in iter_requests(collection.get("item", [])):
+        url = item["request"].get("url")
+        if isinstance(url, dict) and url.get("query"):
+            queries[request_key(item)] = [(entry["key"], str(entry.get("value", ""))) for entry in url["query"]
+                                          if not entry.get("disabled") and str(entry.get("value", ""))]
+    return queries
+
+
+def expand(endpoint, seeds, query=(), max_variants=DEFAULT_MAX_VARIANTS):
+    """
+    Concrete URLs for `endpoint`: seeded ids for every id segment and
+    page=1..pages for paginated requests. Returns [] when a placeholder
+    has neither a value nor seeds.
+    """
+    split = urlsplit(endpoint.url)
+    template = endpoint.key[1]
+    template_segments = template.strip("/").split("/")
+    resolved = split.path.strip("/").split("/")
+    # Anything in front of the template path belongs to base_url
+    prefix = f"{split.scheme}://{split.netloc}" + "".join(
+        f"/{segment}" for segment in resolved[:len(resolved) - len(template_segments)])
+    resolved = resolved[len(resolved) - len(template_segments):]
+
+    choices = []
+    for position, segment in enumerate(template_segments):
+        if segment != "{}":
+            choices.append([segment])
+            continue
+        seeded = seeds.ids_for(template, position)
+        if seeded:
+            choices.append(seeded)
+        elif not _unresolved(resolved[position]):
+            choices.append([resolved[position]])
+        else:
+            return []
+
+    parameters = [(key, value) for key, value in parse_qsl(split.query) if value] + list(query)
+    paginated = any(key in PAGINATION_PARAMETERS for key, _value in parameters) or \
+        any(template.startswith(path) for path in seeds.paginated)
+    # A single page is warmed with the query as the collection has it
+    pages = range(1, seeds.pages + 1) if paginated and seeds.pages > 1 else (None,)
+
+    urls = []
+    for path in itertools.product(*choices):
+        for page in pages:
+            current = parameters if page is None else \
+                [(key, value) for key, value in parameters if key != "page"] + [("page", str(page))]
+            url = prefix + "/" + "/".join(path)
+            urls.append(f"{url}?{urlencode(current)}" if current else url)
+            if len(urls) >= max_variants:
+                return urls
+    return urls
+
+
+def warm_targets(collection, variables, seeds, folders=None, max_variants=DEFAULT_MAX_VARIANTS):
+    """
+    ([Endpoint per concrete URL], [skipped endpoint labels]) for the public
+    GET requests of `collection`, one Endpoint per URL (duplicates dropped).
+    """
+    queries = request_queries(collection)
+    targets = {}
+    skipped = []
+    for endpoint in collect_endpoints(collection, variables, folders, ("GET",)):
+        if not is_public(endpoint):
+            continue
+        urls = expand(endpoint, seeds, queries.get(endpoint.key, ()), max_variants)
+        if not urls:
+            skipped.append(endpoint.label)
+        for url in urls:
+            targets.setdefault(url, Endpoint(endpoint.name, endpoint.folder, "GET", url, endpoint.headers, None,
+                                             endpoint.key))
+    return list(targets.values()), skipped
+
+
+# --- Warming ---
+
+async def _fetch_all(session, targets, concurrency, limiter, timeout):
+    """[(endpoint, status, seconds, error)] in the order of `targets`."""
+    results = [None] * len(targets)
+    queue = iter(enumerate(targets))
+
+    async def worker():
+        for index, endpoint in queue:
+            await limiter.wait()
+            results[index] = (endpoint, *await fetch(session, endpoint, timeout))
+
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, len(targets)))))
+    return results
+
+
+async def warm(targets, concurrency=8, rate=None, warm_rounds=DEFAULT_WARM_ROUNDS, timeout=10.0):
+    """
+    One cold pass over every URL, then `warm_rounds` warm passes. Returns
+    the summary: per endpoint (method + normalized path) and per URL.
+    """
+    limiter = RateLimiter(rate)
+    started = time.perf_counter()
+    passes = []
+    async with client_session(concurrency) as session:
+        for _round in range(1 + warm_rounds):
+            passes.append(await _fetch_all(session, targets, concurrency, limiter, timeout))
+    elapsed = time.perf_counter() - started
+
+    urls = []
+    grouped = defaultdict(lambda: {"cold": [], "warm": [], "failed": 0, "statuses": defaultdict(int)})
+    for index, endpoint in enumerate(targets):
+        _endpoint, cold_status, cold_seconds, cold_error = passes[0][index]
+        warm_results = [results[index] for results in passes[1:]]
+        group = grouped[endpoint.label]
+        group["cold"].append(cold_seconds)
+        group["warm"].extend(seconds for _endpoint, _status, seconds, _error in warm_results)
+        for _endpoint, status, _seconds, error in [passes[0][index], *warm_results]:
+            if error is not None or status >= 400:
+                group["failed"] += 1
+            group["statuses"][str(status) if error is None else error] += 1
+        warm_values = sorted(seconds for _endpoint, _status, seconds, _error in warm_results)
+        urls.append({"url": endpoint.url, "endpoint": endpoint.label, "cold_status": cold_status or cold_error,
+                     "cold_ms": cold_seconds * 1000,
+                     "warm_ms": percentile(warm_values, 50) * 1000 if warm_values else None})
+
+    def ms(values, q):
+        value = percentile(sorted(values), q)
+        return value * 1000 if value is not None else None
+
+    endpoints = {}
+    for label, group in sorted(grouped.items()):
+        cold, warm_p50 = ms(group["cold"], 50), ms(group["warm"], 50)
+        endpoints[label] = {
+            "urls": len(group["cold"]),
+            "cold_p50_ms": cold,
+            "cold_max_ms": ms(group["cold"], 100),
+            "warm_p50_ms": warm_p50,
+            "warm_p95_ms": ms(group["warm"], 95),
+            "speedup": cold / warm_p50 if cold and warm_p50 else None,
+            "failed": group["failed"],
+            "statuses": dict(group["statuses"]),
+        }
+    requests = sum(len(results) for results in passes)
+    return {"elapsed_s": elapsed, "requests": requests, "throughput_rps": requests / elapsed if elapsed else 0.0,
+            "endpoints": endpoints, "urls": urls}
+
+
+def format_table(summary):
+    def ms(value):
+        return f"{value:8.1f}" if value is not None else "       -"
+
+    lines = [f"{'endpoint':<55} {'urls':>5} {'cold p50':>8} {'cold max':>8} {'warm p50':>8} {'warm p95':>8} "
+             f"{'speedup':>7} {'fail':>5}"]
+    for label, row in summary["endpoints"].items():
+        speedup = f"{row['speedup']:6.1f}x" if row["speedup"] else "      -"
+        lines.append(f"{label[:55]:<55} {row['urls']:>5} {ms(row['cold_p50_ms'])} {ms(row['cold_max_ms'])} "
+                     f"{ms(row['warm_p50_ms'])} {ms(row['warm_p95_ms'])} {speedup} {row['failed']:>5}")
+    return lines
+
+
+# --- CLI ---
+
+async def _run(args):
+    collection = load_collection(args.collection)
+    seeds = Seeds.load(args.seeds, args.ids, args.pages)
+
+    async def go(base_url=None):
+        variables = target_variables(args, collection)
+        if base_url:
+            variables["base_url"] = base_url
+        targets, skipped = warm_targets(collection, variables, seeds, args.folder, args.max_variants)
+        endpoints = len({target.label for target in targets})
+        print(f"✓ {len(targets)} URL(s) from {endpoints} public GET endpoint(s), concurrency {args.concurrency}, "
+              f"rate {args.rate or 'unlimited'}, {args.warm_rounds} warm round(s)")
+        for label in skipped:
+            print(f"⚠ No seed ids for a placeholder, skipped: {label}")
+        if args.list:
+            for target in targets:
+                print(f"  {target.url}")
+            return None
+        if not targets:
+            raise SystemExit("✗ Nothing to warm")
+        return await warm(targets, args.concurrency, args.rate, args.warm_rounds, args.timeout)
+
+    if args.stand_in:
+        async with StandIn(**dict(stand_in_options(args), cold_latency=args.stand_in_cold_latency)) as base_url:
+            return await go(base_url)
+    return await go()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Warm the caches of the public GET endpoints after a deploy.")
+    add_target_arguments(parser)
+    parser.add_argument("--seeds", metavar="PATH", help="JSON seed file: ids, pages, paginated")
+    parser.add_argument("--ids", action="append", metavar="RESOURCE=ID,ID",
+                        help="ids for an id segment, by the segment before it or the normalized path (repeatable)")
+    parser.add_argument("--pages", type=int, default=None, help="pages to warm for paginated endpoints")
+    parser.add_argument("--warm-rounds", type=int, default=DEFAULT_WARM_ROUNDS,
+                        help="passes after the cold one (default: %(default)s)")
+    parser.add_argument("--max-variants", type=int, default=DEFAULT_MAX_VARIANTS, help="URLs per endpoint at most")
+    parser.add_argument("--list", action="store_true", help="only print the URLs that would be warmed")
+    parser.add_argument("--stand-in-cold-latency", type=float, default=0.05,
+                        help="extra stand-in seconds for the first request of a URL")
+    args = parser.parse_args(argv)
+
+    summary = asyncio.run(_run(args))
+    if summary is None:
+        return 0
+    print("\n".join(format_table(summary)))
+    failed = sum(row["failed"] for row in summary["endpoints"].values())
+    print(f"\n✓ {summary['requests']} requests in {summary['elapsed_s']:.1f} s "
+          f"({summary['throughput_rps']:.1f} req/s), {failed} failed")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(summary, f, indent=2)
+        print(f"✓ Report saved to {args.json}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
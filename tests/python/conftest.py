@@ -0,0 +1,15 @@
+"""
+pytest setup for the Python tooling: the repository root (postman_tools,
+update_postman_collection.py, tooling_trace.py) and certificate_new/ (flat
+script imports) go on sys.path, the same way the scripts are run.
+"""
+
+import os
+import sys
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+CERTIFICATE_DIR = os.path.join(REPO_ROOT, "certificate_new")
+
+for path in (REPO_ROOT, CERTIFICATE_DIR):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,36 @@
+from PIL import Image
+
+import build_asset_bundle
+
+
+def write_images(directory, names):
+    for name in names:
+        Image.new("RGB", (8, 8), (200, 10, 10)).save(directory / name)
+
+
+def test_referenced_images_reads_src_and_css_urls(tmp_path):
+    template = tmp_path / "cer.html"
+    template.write_text(
+        '<style>.a { background: url("/bg.png") } .b { background: url(logo.jpg) }</style>'
+        '<img src="/bg.png"><img src="data:image/png;base64,AAAA"><img src="https://x/y.png">'
+        '<img data-generate="Dinamik" src="/qr.png"><script src="/app.js"></script>',
+        encoding="utf-8")
+    assert build_asset_bundle.referenced_images(str(template)) == ["bg.png", "logo.jpg", "qr.png"]
+
+
+def test_bundle_contains_only_referenced_images(tmp_path):
+    write_images(tmp_path, ["background.png", "layer1.png", "layer2.png", "qr.png"])
+    (tmp_path / "cer.html").write_text('<img src="/layer1.png"><img src="/layer2.png">', encoding="utf-8")
+    (tmp_path / "cer.flat.html").write_text('<img src="/background.png"><img src="/qr.png"><img src="/gone.png">',
+                                            encoding="utf-8")
+
+    template = build_asset_bundle.default_template(str(tmp_path))
+    assert template == str(tmp_path / "cer.flat.html")
+    bundle, stats, missing = build_asset_bundle.build_bundle(
+        str(tmp_path), names=build_asset_bundle.referenced_images(template))
+    assert sorted(bundle["assets"]) == ["background.png", "qr.png"]
+    assert [name for name, _, _ in stats] == ["background.png", "qr.png"]
+    assert missing == ["gone.png"]
+
+    (tmp_path / "cer.flat.html").unlink()
+    assert build_asset_bundle.default_template(str(tmp_path)) == str(tmp_path / "cer.html")
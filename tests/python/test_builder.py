@@ -0,0 +1,86 @@
+import json
+
+import pytest
+
+from postman_tools import dedupe, diff
+from postman_tools.builder import CollectionBuilder, FragmentCache, dump_collection
+
+
+def section(name, *requests):
+    return {"name": name, "item": [{"name": request, "request": {"method": "GET", "url": "/" + request}}
+                                   for request in requests]}
+
+
+def names(builder):
+    return [entry["name"] for entry in builder]
+
+
+def test_linked_operations():
+    builder = CollectionBuilder(info={"name": "x"})
+    builder.append(section("A"))
+    builder.append(section("C"))
+    assert builder.insert_after("A", section("B"))
+    assert builder.insert_before("A", section("Start"))
+    assert not builder.insert_after("Missing", section("D"))
+    assert names(builder) == ["Start", "A", "B", "C"]
+
+    assert builder.extend("B", [{"name": "b2", "request": {"method": "GET", "url": "/b2"}}])
+    assert not builder.extend("Missing", [])
+    assert len(builder.section("B")["item"]) == 1
+
+    assert builder.replace("C", section("C renamed"))
+    assert builder.remove("Start") and builder.remove("C renamed")
+    assert not builder.remove("Start")
+    assert names(builder) == ["A", "B"]
+    builder.append(section("End"))
+    assert names(builder) == ["A", "B", "End"]
+
+
+def test_duplicate_names_are_rejected_without_changing_the_builder():
+    builder = CollectionBuilder(info={})
+    builder.append(section("A"))
+    builder.append(section("B"))
+    with pytest.raises(ValueError):
+        builder.append(section("A"))
+    with pytest.raises(ValueError):
+        builder.replace("A", section("B"))
+    assert names(builder) == ["A", "B"] and "A" in builder
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_dump_matches_json_dump(tmp_path, compact):
+    builder = CollectionBuilder(info={"name": "Ünvan"}, variable=[{"key": "base_url", "value": "x"}],
+                                extra={"auth": {"type": "noauth"}})
+    for name in ("A", "B", "C"):
+        builder.append(section(name, f"{name.lower()}1", f"{name.lower()}2"))
+    collection = builder.build()
+    expected = (json.dumps(collection, ensure_ascii=False, separators=(",", ":")) if compact
+                else json.dumps(collection, indent=2, ensure_ascii=False))
+
+    cache = FragmentCache(str(tmp_path / "cache"))
+    path = tmp_path / "out.json"
+    assert dump_collection(collection, str(path), cache, compact) == (3, 3)
+    assert path.read_text(encoding="utf-8") == expected
+    # Second run: indented sections come from the cache
+    assert dump_collection(collection, str(path), cache, compact) == (3, 3 if compact else 0)
+    assert path.read_text(encoding="utf-8") == expected
+
+
+@pytest.mark.parametrize("compact", [False, True])
+def test_tools_write_collections_the_same_way(tmp_path, capsys, compact):
+    collection = CollectionBuilder(info={"name": "Ünvan"}, extra={"auth": {"type": "noauth"}})
+    for name in ("A", "B"):
+        collection.append(section(name, f"{name.lower()}1"))
+    source = tmp_path / "source.json"
+    dump_collection(collection.build(), str(source))
+    flag = ["--compact"] if compact else []
+
+    assert dedupe.main([str(source), "-o", str(tmp_path / "deduped.json")] + flag) == 0
+    assert diff.main(["diff", str(source), str(source), "-o", str(tmp_path / "patch.json")]) == 0
+    assert diff.main(["apply", str(source), str(tmp_path / "patch.json"), "-o", str(tmp_path / "applied.json")]
+                     + flag) == 0
+    for name in ("deduped.json", "applied.json"):
+        text = (tmp_path / name).read_text(encoding="utf-8")
+        loaded = json.loads(text)
+        assert text == (json.dumps(loaded, ensure_ascii=False, separators=(",", ":")) if compact
+                        else json.dumps(loaded, indent=2, ensure_ascii=False))
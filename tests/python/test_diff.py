@@ -0,0 +1,112 @@
+import copy
+import json
+import os
+import shutil
+
+import pytest
+
+import update_postman_collection as generator
+
+from conftest import REPO_ROOT
+from postman_tools.diff import apply, diff, index_sections
+from postman_tools.streaming import load_collection
+
+
+def request(name, method, path, **extra):
+    return {"name": name, "request": {"method": method, "url": "{{base_url}}" + path, **extra}}
+
+
+def folder(name, *items):
+    return {"name": name, "item": list(items)}
+
+
+def patch(old, new):
+    return diff(index_sections(old["item"]), index_sections(new["item"]))
+
+
+def is_empty(result):
+    return not any(result[kind] for kind in ("added", "removed", "changed", "moved"))
+
+
+def round_trip(old, new):
+    merged = copy.deepcopy(old)
+    changes = patch(old, new)
+    result = apply(merged, changes)
+    assert result["conflicts"] == []
+    assert is_empty(patch(merged, new))
+    # Re-applying the same patch is a no-op
+    again = copy.deepcopy(merged)
+    assert apply(again, changes)["applied"] == 0
+    assert again == merged
+    return merged
+
+
+LIST = request("List FAQs", "GET", "/api/v1/faqs")
+SHOW = request("Get FAQ", "GET", "/api/v1/faqs/1")
+CREATE = request("Create FAQ", "POST", "/api/v1/faqs", body={"mode": "raw", "raw": "{}"})
+
+
+def test_same_request_added_to_a_second_folder():
+    old = {"item": [folder("FAQ", LIST, SHOW)]}
+    new = {"item": [folder("FAQ", LIST, SHOW), folder("Public", copy.deepcopy(LIST))]}
+    merged = round_trip(old, new)
+    assert [item["name"] for item in merged["item"][1]["item"]] == ["List FAQs"]
+
+
+def test_same_request_moved_and_copied():
+    old = {"item": [folder("Old", LIST)]}
+    new = {"item": [folder("A", copy.deepcopy(LIST)), folder("B", copy.deepcopy(LIST))]}
+    round_trip(old, new)
+
+
+def test_duplicate_copies_in_one_folder():
+    old = {"item": [folder("FAQ", LIST)]}
+    new = {"item": [folder("FAQ", LIST, copy.deepcopy(LIST), copy.deepcopy(LIST))]}
+    merged = round_trip(old, new)
+    assert len(merged["item"][0]["item"]) == 3
+
+
+def test_changed_removed_and_added():
+    edited = request("List FAQs", "GET", "/api/v1/faqs?page=1")
+    old = {"item": [folder("FAQ", LIST, SHOW)]}
+    new = {"item": [folder("FAQ", edited, CREATE)]}
+    changes = patch(old, new)
+    assert [len(changes[kind]) for kind in ("added", "removed", "changed", "moved")] == [1, 1, 1, 0]
+    round_trip(old, new)
+
+
+def test_edit_in_target_is_a_conflict():
+    old = {"item": [folder("FAQ", LIST)]}
+    new = {"item": [folder("FAQ", request("List FAQs", "GET", "/api/v1/faqs", description="new"))]}
+    target = {"item": [folder("FAQ", request("List FAQs", "GET", "/api/v1/faqs", description="local"))]}
+    result = apply(target, patch(old, new))
+    assert [conflict["kind"] for conflict in result["conflicts"]] == ["changed"]
+    assert target["item"][0]["item"][0]["request"]["description"] == "local"
+
+
+@pytest.mark.parametrize("new_name", ["Agrar_Portal_API_Complete_Updated.postman_collection.json",
+                                      "Agrar_Portal_API_Updated.postman_collection.json"])
+def test_repository_collections_round_trip(new_name):
+    old = load_collection(os.path.join(REPO_ROOT, "Agrar_Portal_API.postman_collection.json"))
+    new = load_collection(os.path.join(REPO_ROOT, new_name))
+    round_trip(old, new)
+
+
+def test_generated_collection_round_trips(tmp_path, monkeypatch, capsys):
+    # The generated collection has the same request in several folders
+    source = os.path.join(REPO_ROOT, generator.SOURCE_PATH)
+    shutil.copy(source, tmp_path)
+    monkeypatch.chdir(tmp_path)
+    assert generator.main([]) == 0
+    round_trip(load_collection(source), load_collection(generator.OUTPUT_PATH))
+
+
+def test_version_1_patch_adds_one_copy_per_folder():
+    old = {"item": [folder("FAQ", LIST)]}
+    new = {"item": [folder("FAQ", LIST), folder("Public", copy.deepcopy(LIST))]}
+    changes = json.loads(json.dumps(patch(old, new)))
+    for entry in changes["added"]:
+        del entry["copies"]
+    round_trip_target = copy.deepcopy(old)
+    apply(round_trip_target, changes)
+    assert is_empty(patch(round_trip_target, new))
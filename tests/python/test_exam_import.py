@@ -0,0 +1,106 @@
+import asyncio
+import json
+import socket
+
+from aiohttp import web
+
+from postman_tools import exam_import
+from postman_tools.exam_import import Checkpoint, run_import
+
+
+def exam(title):
+    return {
+        "title": title, "category": "Test", "passing_score": 50, "duration_minutes": 30,
+        "questions": [{"question_text": "2 + 2?", "question_type": "single_choice",
+                       "choices": [{"choice_text": "3", "is_correct": False},
+                                   {"choice_text": "4", "is_correct": True}]}],
+    }
+
+
+class Scripted:
+    """Server answering each exam title from its list of (status, headers, delay); the last answer repeats."""
+
+    def __init__(self, script):
+        self.script = script
+        self.received = []
+
+    async def handle(self, request):
+        title = (await request.json())["title"]
+        self.received.append(title)
+        answers = self.script[title]
+        status, headers, delay = answers[min(self.received.count(title), len(answers)) - 1]
+        await asyncio.sleep(delay)
+        body = {"exam": {"id": len(self.received)}} if status < 300 else {"message": "error"}
+        return web.json_response(body, status=status, headers=headers)
+
+
+async def serve(server, exams, **options):
+    app = web.Application()
+    app.router.add_post(exam_import.EXAMS_PATH, server.handle)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.bind(("127.0.0.1", 0))
+    await web.SockSite(runner, sock).start()
+    try:
+        return await run_import(exams, f"http://127.0.0.1:{sock.getsockname()[1]}", progress=lambda line: None,
+                                **options)
+    finally:
+        await runner.cleanup()
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_only_unprocessed_answers_are_retried(monkeypatch):
+    monkeypatch.setattr(exam_import, "BACKOFF_BASE", 0.001)
+    server = Scripted({
+        "throttled": [(429, {}, 0), (201, {}, 0)],
+        "maintenance": [(503, {"Retry-After": "0"}, 0), (201, {}, 0)],
+        "unavailable": [(503, {}, 0), (201, {}, 0)],
+        "server error": [(500, {}, 0), (201, {}, 0)],
+        "slow": [(201, {}, 1.0)],
+        "invalid": [(422, {}, 0), (201, {}, 0)],
+    })
+    exams = [exam(title) for title in server.script]
+    summary = asyncio.run(serve(server, exams, timeout=0.3, retries=3))
+
+    assert sorted(server.received) == sorted(["throttled", "throttled", "maintenance", "maintenance",
+                                              "unavailable", "server error", "slow", "invalid"])
+    assert summary["imported"] == 2
+    assert [entry["title"] for entry in summary["failures"]] == ["invalid"]
+    assert sorted(entry["title"] for entry in summary["unknown_exams"]) == ["server error", "slow", "unavailable"]
+
+
+def test_connection_refused_is_retried(monkeypatch):
+    monkeypatch.setattr(exam_import, "BACKOFF_BASE", 0.001)
+    summary = asyncio.run(run_import([exam("a")], f"http://127.0.0.1:{free_port()}", retries=2,
+                                     progress=lambda line: None))
+    assert summary["requests"] == 3
+    assert summary["failed"] == 1 and summary["unknown"] == 0
+
+
+def test_resume_does_not_resend_unknown_outcomes(tmp_path):
+    path = str(tmp_path / "import.ckpt")
+    exams = [exam("ok"), exam("server error")]
+
+    checkpoint = Checkpoint(path)
+    first = Scripted({"ok": [(201, {}, 0)], "server error": [(500, {}, 0)]})
+    asyncio.run(serve(first, exams, checkpoint=checkpoint))
+    checkpoint.close()
+
+    with open(path, encoding="utf-8") as f:
+        states = {entry["title"]: entry.get("state") for entry in map(json.loads, f)}
+    assert states == {"ok": None, "server error": "unknown"}
+
+    checkpoint = Checkpoint(path)
+    second = Scripted({"ok": [(201, {}, 0)], "server error": [(201, {}, 0)]})
+    summary = asyncio.run(serve(second, exams, checkpoint=checkpoint))
+    checkpoint.close()
+
+    assert second.received == []
+    assert summary["skipped"] == 1
+    assert [entry["title"] for entry in summary["unknown_exams"]] == ["server error"]
@@ -0,0 +1,90 @@
+import random
+
+import pytest
+from PIL import Image
+
+import remove_white_background as keying
+
+
+def loop_key(img, threshold):
+    """The original per-pixel loop of remove_white_background.py."""
+    img = img.convert("RGBA")
+    thresholds = threshold if isinstance(threshold, tuple) else (threshold,) * 3
+    raw = img.tobytes()
+    data = bytearray()
+    for offset in range(0, len(raw), 4):
+        item = raw[offset:offset + 4]
+        data += bytes((255, 255, 255, 0)) if all(item[band] > thresholds[band] for band in range(3)) else item
+    return Image.frombytes("RGBA", img.size, bytes(data))
+
+
+def noisy_image(mode, size=(97, 61), seed=0):
+    rng = random.Random(seed)
+    img = Image.new("RGBA", size)
+    # Mostly near-white pixels with dark strokes, so both branches of the threshold are hit
+    img.putdata([tuple(rng.randint(200, 255) if rng.random() < 0.7 else rng.randint(0, 255) for _ in range(3))
+                 + (rng.randint(0, 255),) for _ in range(size[0] * size[1])])
+    return img.convert(mode)
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "L", "P"])
+@pytest.mark.parametrize("threshold", [0, 240, 254, (250, 235, 220)])
+def test_key_image_matches_the_pixel_loop(mode, threshold):
+    img = noisy_image(mode)
+    assert keying.key_image(img, threshold).tobytes() == loop_key(img, threshold).tobytes()
+
+
+@pytest.mark.parametrize("mode", ["RGBA", "RGB", "P"])
+@pytest.mark.parametrize("memory_limit, threads", [(1, 1), (5000, 3), (10 ** 9, None)])
+def test_tiled_matches_key_image(mode, memory_limit, threads):
+    img = noisy_image(mode, seed=1)
+    expected = keying.key_image(img, (245, 240, 235)).tobytes()
+    tiled = keying.key_image_tiled(img, (245, 240, 235), memory_limit=memory_limit, threads=threads)
+    assert tiled.tobytes() == expected
+
+
+@pytest.mark.parametrize("tiled", [False, True])
+def test_source_image_is_not_modified(tiled):
+    img = noisy_image("RGBA", seed=2)
+    before = img.tobytes()
+    if tiled:
+        keying.key_image_tiled(img, 240, memory_limit=5000, threads=2)
+    else:
+        keying.key_image(img, 240)
+    assert img.tobytes() == before
+
+
+def test_luminance_mode_thresholds_the_l_channel():
+    img = noisy_image("RGB", seed=3)
+    keyed = keying.key_image(img, 230, mode="luminance")
+    luminance = img.convert("L").tobytes()
+    alphas = keyed.getchannel("A").tobytes()
+    for value, alpha in zip(luminance, alphas):
+        assert alpha == (0 if value > 230 else 255)
+
+
+def test_luminance_mode_rejects_channel_thresholds():
+    with pytest.raises(ValueError):
+        keying.white_mask(noisy_image("RGB"), (240, 240, 240), mode="luminance")
+
+
+def test_pool_workers_split_the_thread_budget(tmp_path, monkeypatch):
+    paths = []
+    for index in range(4):
+        path = tmp_path / f"image{index}.png"
+        noisy_image("RGB", size=(16, 16), seed=index).save(path)
+        paths.append(str(path))
+    seen = []
+    process_job = keying._process_job
+
+    def recording_job(job):
+        seen.append(job[2]["threads"])
+        return process_job(job)
+
+    # A thread pool stands in for the process pool, so the jobs can be observed
+    monkeypatch.setattr(keying, "ProcessPoolExecutor", keying.ThreadPoolExecutor)
+    monkeypatch.setattr(keying, "_process_job", recording_job)
+    results = list(keying.process_batch(paths, str(tmp_path / "out"), workers=2, tiled=True, threads=8,
+                                        memory_limit=4096))
+    assert len(results) == 4
+    assert seen == [4] * 4
@@ -0,0 +1,108 @@
+import os
+
+import pytest
+from PIL import Image
+
+import remove_white_background as keying
+from keying_cache import KeyingCache
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return KeyingCache(str(tmp_path / "cache"))
+
+
+def write_file(path, data):
+    path.write_bytes(data)
+    return str(path)
+
+
+def test_get_and_put_round_trip(tmp_path, cache):
+    source = write_file(tmp_path / "logo.png", b"source")
+    key = cache.key_for(source, {"threshold": 240})
+    outputs = [str(tmp_path / "logo1.png"), str(tmp_path / "logo1.crop.json")]
+    assert not cache.get(key, outputs)
+
+    write_file(tmp_path / "logo1.png", b"keyed")
+    write_file(tmp_path / "logo1.crop.json", b"{}")
+    cache.put(key, outputs)
+    for path in outputs:
+        os.unlink(path)
+    assert cache.get(key, outputs)
+    assert [open(path, "rb").read() for path in outputs] == [b"keyed", b"{}"]
+
+
+def test_key_depends_on_content_and_params(tmp_path, cache):
+    source = write_file(tmp_path / "logo.png", b"source")
+    key = cache.key_for(source, {"threshold": 240, "mode": "rgb"})
+    assert cache.key_for(source, {"mode": "rgb", "threshold": 240}) == key
+    assert cache.key_for(source, {"threshold": 241, "mode": "rgb"}) != key
+    write_file(tmp_path / "logo.png", b"changed")
+    assert cache.key_for(source, {"threshold": 240, "mode": "rgb"}) != key
+
+
+def test_partial_entry_is_a_miss(tmp_path, cache):
+    output = write_file(tmp_path / "out.png", b"keyed")
+    sidecar = write_file(tmp_path / "out.crop.json", b"{}")
+    key = cache.key_for_params({"name": "x"})
+    cache.put(key, [output])
+    # The entry has no second file (e.g. it was written without trim or evicted)
+    os.unlink(output)
+    assert not cache.get(key, [output, sidecar])
+    assert not os.path.exists(output)
+    assert cache.get(key, [output])
+
+
+def test_read_and_write(cache):
+    key = cache.key_for_params({"data": "qr"}, version="qr-1")
+    assert key != cache.key_for_params({"data": "qr"})
+    assert cache.read(key) is None
+    cache.write(key, b"<svg/>")
+    assert cache.read(key) == b"<svg/>"
+
+
+def test_evict_by_age_then_by_size(tmp_path):
+    cache = KeyingCache(str(tmp_path / "cache"), max_bytes=10, max_age=3600)
+    for name in ("old", "used", "recent", "newest"):
+        key = cache.key_for_params({"name": name})
+        cache.write(key, b"12345")
+        age = {"old": 7200, "used": 1800, "recent": 900, "newest": 0}[name]
+        path = cache._entry_path(key)
+        os.utime(path, (os.path.getmtime(path) - age,) * 2)
+    # Reading refreshes the entry, so it outlives a newer but unused one
+    assert cache.read(cache.key_for_params({"name": "used"})) == b"12345"
+
+    assert cache.evict() == 2
+    assert cache.read(cache.key_for_params({"name": "old"})) is None
+    assert cache.read(cache.key_for_params({"name": "recent"})) is None
+    assert cache.read(cache.key_for_params({"name": "used"})) == b"12345"
+    assert cache.read(cache.key_for_params({"name": "newest"})) == b"12345"
+
+
+def test_process_batch_skips_cached_files(tmp_path, cache, monkeypatch):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"image{index}.png"
+        Image.new("RGB", (8, 8), (255, 255, 255) if index else (10, 10, 10)).save(path)
+        paths.append(str(path))
+    output_dir = str(tmp_path / "out")
+
+    first = list(keying.process_batch(paths, output_dir, workers=1, cache=cache, threshold=240))
+    assert [cached for *_, cached in first] == [False, False]
+    expected = {output: open(output, "rb").read() for _, output, _, _ in first}
+
+    def fail(job):
+        raise AssertionError(f"{job[0]} was processed again")
+
+    monkeypatch.setattr(keying, "_process_job", fail)
+    for output in expected:
+        os.unlink(output)
+    second = list(keying.process_batch(paths, output_dir, workers=1, cache=cache, threshold=240,
+                                       tiled=True, threads=3))
+    assert [cached for *_, cached in second] == [True, True]
+    assert {output: open(output, "rb").read() for output in expected} == expected
+
+    # A parameter that changes the result is a miss
+    monkeypatch.undo()
+    third = list(keying.process_batch(paths, output_dir, workers=1, cache=cache, threshold=200))
+    assert [cached for *_, cached in third] == [False, False]
@@ -0,0 +1,100 @@
+import os
+
+import pytest
+
+from conftest import REPO_ROOT
+from postman_tools.routes import RouteTrie, collection_requests, load_routes, parse_routes, url_segments, validate
+
+ROUTES = r"""<?php
+use App\Http\Controllers\FaqController;
+
+Route::prefix('v1')->group(function () {
+    Route::get('faqs/export', [FaqController::class, 'export']);
+    Route::apiResource('faqs', FaqController::class)->only(['index', 'show']);
+    Route::get('users/{id}', [UserController::class, 'show'])->whereNumber('id');
+    Route::get('users/{slug}', [UserController::class, 'bySlug']);
+    Route::get('reports/{year?}', [ReportController::class, 'index']);
+    Route::get('files/latest/meta', [FileController::class, 'latest']);
+    Route::get('files/{file}/download', [FileController::class, 'download']);
+    Route::middleware(['auth:sanctum'])->group(function () {
+        Route::apiResource('courses.lessons', LessonController::class);
+        Route::match(['get', 'post'], 'search', [SearchController::class, 'run']);
+        Route::post('faqs/{faq}', [FaqController::class, 'old']);
+        Route::post('faqs/{faq}', [FaqController::class, 'new']);
+    });
+});
+"""
+
+
+@pytest.fixture(scope="module")
+def trie():
+    return RouteTrie(parse_routes(ROUTES))
+
+
+def match(trie, method, url):
+    route, allowed = trie.match(method, url_segments(url))
+    return (route.action if route else None), allowed
+
+
+def test_parse_groups_resources_and_constraints():
+    routes = {(method, route.uri): route for route in parse_routes(ROUTES) for method in route.methods}
+    assert routes["GET", "api/v1/faqs"].action == "FaqController@index"
+    assert ("DELETE", "api/v1/faqs/{faq}") not in routes
+    assert routes["GET", "api/v1/users/{id}"].where == {"id": "[0-9]+"}
+    lessons = routes["PATCH", "api/v1/courses/{course}/lessons/{lesson}"]
+    assert lessons.action == "LessonController@update" and lessons.middleware == ("auth:sanctum",)
+    assert routes["POST", "api/v1/search"] is routes["GET", "api/v1/search"]
+    assert routes["GET", "api/v1/faqs/export"].middleware == ()
+
+
+@pytest.mark.parametrize("method, url, action", [
+    # Literal segments win over parameters
+    ("GET", "{{base_url}}/api/v1/faqs/export", "FaqController@export"),
+    ("GET", "{{base_url}}/api/v1/faqs/5?lang=az", "FaqController@show"),
+    # where() constraints, and placeholders that always satisfy them
+    ("GET", "/api/v1/users/5", "UserController@show"),
+    ("GET", "/api/v1/users/abc", "UserController@bySlug"),
+    ("GET", "/api/v1/users/{{user_id}}", "UserController@show"),
+    ("GET", "/api/v1/users/:id", "UserController@show"),
+    # Optional parameter
+    ("GET", "/api/v1/reports", "ReportController@index"),
+    ("GET", "/api/v1/reports/2024", "ReportController@index"),
+    # A dead-end literal branch falls back to the parameter
+    ("GET", "/api/v1/files/latest/download", "FileController@download"),
+    ("GET", "/api/v1/files/latest/meta", "FileController@latest"),
+    ("PUT", "http://localhost:8000/api/v1/courses/1/lessons/2", "LessonController@update"),
+    ("HEAD", "/api/v1/faqs", "FaqController@index"),
+    # The later definition of the same method and URI wins
+    ("POST", "/api/v1/faqs/3", "FaqController@new"),
+])
+def test_match(trie, method, url, action):
+    assert match(trie, method, url)[0] == action
+
+
+def test_stale_and_unknown(trie):
+    assert match(trie, "DELETE", "/api/v1/faqs/1") == (None, {"GET", "POST"})
+    assert match(trie, "GET", "/api/v2/faqs") == (None, None)
+    assert match(trie, "GET", "/api/v1/users/5/extra") == (None, None)
+
+
+def test_validate_report(trie):
+    requests = [("c.json", ("FAQ",), {"name": name, "request": {"method": method, "url": url}})
+                for name, method, url in (("list", "GET", "{{base_url}}/api/v1/faqs"),
+                                          ("delete", "DELETE", "{{base_url}}/api/v1/faqs/1"),
+                                          ("old", "GET", "{{base_url}}/api/v0/faqs"))]
+    report = validate(trie, requests)
+    assert (report["requests"], report["matched"]) == (3, 1)
+    assert [entry["name"] for entry in report["stale"]] == ["delete"]
+    assert report["stale"][0]["allowed"] == ["GET", "POST"]
+    assert [entry["name"] for entry in report["unknown"]] == ["old"]
+    assert {"methods": ["GET"], "uri": "/api/v1/faqs/export", "action": "FaqController@export",
+            "middleware": []} in report["uncovered"]
+    assert len(report["uncovered"]) == report["routes"] - 1
+
+
+def test_repository_collection_against_api_routes():
+    routes = load_routes()
+    assert routes
+    report = validate(RouteTrie(routes), collection_requests(
+        os.path.join(REPO_ROOT, "Agrar_Portal_API.postman_collection.json")))
+    assert report["requests"] and report["matched"] > report["requests"] // 2
@@ -0,0 +1,92 @@
+import json
+
+import pytest
+
+from postman_tools.streaming import iter_elements, iter_members, load_collection, rewrite
+
+COLLECTION = {
+    "info": {"name": "Aqrar Portal – API", "schema": "https://schema.getpostman.com/json/collection/v2.1.0/"},
+    "item": [
+        {"name": "Şəhadətnamələr", "item": [
+            {"name": "List", "request": {"method": "GET", "url": "{{base_url}}/api/v1/certificates?page=2"}},
+            {"name": "Escapes", "request": {"method": "POST", "body": {"raw": "{\"a\": \"b\\\\n\"}\n\t"}}},
+        ]},
+        {"name": "Numbers", "values": [0, -0.25, 1.5e10, 12345678901234567890, 3.141592653589793, True, None]},
+        {"name": "Empty", "item": []},
+    ],
+    "variable": [{"key": "base_url", "value": "http://localhost:8000"}],
+    "event": [],
+}
+
+
+def write_json(tmp_path, value, name="collection.json", **options):
+    path = tmp_path / name
+    path.write_text(json.dumps(value, ensure_ascii=False, **options), encoding="utf-8")
+    return str(path)
+
+
+def reassemble(members):
+    collection = {}
+    for name, value in members:
+        if name == "item":
+            collection.setdefault("item", []).append(value)
+        else:
+            collection[name] = value
+    return collection
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 7, 64 * 1024])
+@pytest.mark.parametrize("indent", [None, 2])
+def test_iter_members_across_chunk_boundaries(tmp_path, chunk_size, indent):
+    # Small chunks cut strings, escapes and numbers ("1.5e10" -> "1." + "5e10") in the middle
+    path = write_json(tmp_path, COLLECTION, indent=indent)
+    members = list(iter_members(path, chunk_size=chunk_size))
+    assert [name for name, _ in members] == ["info"] + ["item"] * 3 + ["variable", "event"]
+    assert reassemble(members) == COLLECTION
+
+
+def test_top_level_number_split_at_the_end_of_a_chunk(tmp_path):
+    path = tmp_path / "numbers.json"
+    path.write_text('{"a": 12345, "b": [1.25e-3]}', encoding="utf-8")
+    assert list(iter_members(str(path), chunk_size=8)) == [("a", 12345), ("b", [1.25e-3])]
+
+
+def test_iter_elements(tmp_path):
+    exams = [{"id": index, "title": f"İmtahan {index}", "score": index / 4} for index in range(20)]
+    assert list(iter_elements(write_json(tmp_path, exams), chunk_size=5)) == exams
+    assert list(iter_elements(write_json(tmp_path, [], "empty.json"))) == []
+
+
+def test_byte_order_mark_is_skipped(tmp_path):
+    path = tmp_path / "bom.json"
+    path.write_bytes(b"\xef\xbb\xbf" + json.dumps(COLLECTION).encode("utf-8"))
+    assert load_collection(str(path)) == COLLECTION
+
+
+def test_empty_streamed_array_keeps_its_place(tmp_path):
+    value = {"info": {}, "item": [], "variable": []}
+    path = write_json(tmp_path, value)
+    assert list(iter_members(path)) == [("info", {}), ("variable", [])]
+    assert list(load_collection(path)) == ["info", "item", "variable"]
+    rewrite(path, str(tmp_path / "out.json"))
+    assert (tmp_path / "out.json").read_text(encoding="utf-8") == json.dumps(value, indent=2)
+
+
+@pytest.mark.parametrize("source_indent", [None, 2, 4])
+@pytest.mark.parametrize("compact", [False, True])
+def test_rewrite_matches_json_dump(tmp_path, source_indent, compact):
+    source = write_json(tmp_path, COLLECTION, indent=source_indent)
+    output = tmp_path / "out.json"
+    assert rewrite(source, str(output), compact=compact, chunk_size=16) == 3
+    expected = (json.dumps(COLLECTION, ensure_ascii=False, separators=(",", ":")) if compact
+                else json.dumps(COLLECTION, indent=2, ensure_ascii=False))
+    assert output.read_text(encoding="utf-8") == expected
+    assert load_collection(str(output)) == COLLECTION
+
+
+@pytest.mark.parametrize("text", ['{"info": {}, "item": [{"a": 1}', '{"info": {} "item": []}', '[]'])
+def test_malformed_input_raises(tmp_path, text):
+    path = tmp_path / "broken.json"
+    path.write_text(text, encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(iter_members(str(path), chunk_size=4))
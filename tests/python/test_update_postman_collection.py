@@ -0,0 +1,52 @@
+import json
+import os
+import shutil
+from collections import Counter
+
+import pytest
+
+import update_postman_collection as generator
+from conftest import REPO_ROOT
+from postman_tools.builder import iter_requests
+from postman_tools.dedupe import _canonical, _materialize_auth
+
+
+def effective_auth(path):
+    """[(folder path, request name, auth)] with inherited and header auth resolved."""
+    with open(path, encoding="utf-8") as f:
+        collection = json.load(f)
+    _materialize_auth(collection["item"], collection.pop("auth", None), Counter())
+    return [(folder, item["name"], _canonical(item["request"]["auth"]))
+            for folder, item in iter_requests(collection["item"])]
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    shutil.copy(os.path.join(REPO_ROOT, generator.SOURCE_PATH), tmp_path)
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.parametrize("dedupe_again", [False, True])
+@pytest.mark.parametrize("only", [["FAQ Management"], ["Public Certificate Verification", "Authentication"]])
+def test_only_on_deduped_output_keeps_effective_auth(workdir, capsys, only, dedupe_again):
+    assert generator.main([]) == 0
+    expected = effective_auth(generator.OUTPUT_PATH)
+
+    assert generator.main(["--dedupe"]) == 0
+    with open(generator.OUTPUT_PATH, encoding="utf-8") as f:
+        assert "auth" in json.load(f)
+
+    argv = [arg for name in only for arg in ("--only", name)]
+    assert generator.main(argv + (["--dedupe"] if dedupe_again else [])) == 0
+    assert effective_auth(generator.OUTPUT_PATH) == expected
+
+
+def test_load_output_keeps_unknown_members(tmp_path):
+    path = tmp_path / "output.json"
+    path.write_text(json.dumps({"info": {"name": "x"}, "item": [{"name": "A", "item": []}],
+                                "auth": {"type": "noauth"}, "protocolProfileBehavior": {}}))
+    built = generator.load_output(str(path)).build()
+    assert built["auth"] == {"type": "noauth"}
+    assert built["protocolProfileBehavior"] == {}
+    assert [section["name"] for section in built["item"]] == ["A"]
@@ -0,0 +1,144 @@
+import csv
+import datetime
+import hashlib
+import json
+import random
+
+import pytest
+
+import verification_index as vi
+
+TODAY = datetime.date(2026, 5, 1)
+
+
+def signature(number):
+    return hashlib.sha256(f"sig:{number}".encode()).hexdigest()
+
+
+@pytest.fixture(scope="module")
+def rows():
+    rng = random.Random(0)
+    rows = []
+    for index in range(2000):
+        number = f"CERT-2026-{index:05d}" if index % 7 else f"AQR/{index}/ə"
+        expiry = "" if index % 5 == 0 else (TODAY + datetime.timedelta(days=rng.randint(-400, 400))).isoformat()
+        rows.append({"certificate_number": number, "digital_signature": signature(number) if index % 3 else "NULL",
+                     "status": ("active", "active", "revoked", "expired")[index % 4], "expiry_date": expiry})
+    return rows
+
+
+@pytest.fixture(scope="module")
+def index_path(rows, tmp_path_factory):
+    path = str(tmp_path_factory.mktemp("index") / "certificates.vidx")
+    assert vi.build_index(rows, path) == (len(rows), 0)
+    return path
+
+
+def expected_record(row):
+    expiry = datetime.date.fromisoformat(row["expiry_date"]) if row["expiry_date"] else None
+    return row["certificate_number"], row["status"], expiry
+
+
+def test_every_number_and_signature_is_found(rows, index_path):
+    with vi.VerificationIndex(index_path) as index:
+        for row in rows:
+            assert index.find_number(row["certificate_number"]) == expected_record(row)
+            if row["digital_signature"] != "NULL":
+                assert index.find_signature(row["digital_signature"]) == expected_record(row)
+
+
+def test_missing_keys(rows, index_path):
+    with vi.VerificationIndex(index_path) as index:
+        # Neighbours of stored numbers in sort order, prefixes and longer-than-any numbers
+        for number in ("CERT-2026-00000", "CERT-2026-0000", "CERT-2026-000010", "CERT-2026-99999", "", "A",
+                       "ZZZ", "CERT-2026-00001" + "x" * 40):
+            assert index.find_number(number) is None
+        assert index.find_signature(signature("CERT-2026-99999")) is None
+        # Certificates without a signature are not in the signature table
+        unsigned = next(row for row in rows if row["digital_signature"] == "NULL")
+        assert index.find_signature(signature(unsigned["certificate_number"])) is None
+        # Bloom false positives are resolved by the lookup
+        misses = [f"MISSING-{index}" for index in range(5000)]
+        assert sum(index.might_contain(vi._number_key(number)) for number in misses) < 150
+        assert all(index.find_number(number) is None for number in misses)
+
+
+def test_empty_index(tmp_path):
+    path = str(tmp_path / "empty.vidx")
+    assert vi.build_index([], path) == (0, 0)
+    with vi.VerificationIndex(path) as index:
+        assert index.find_number("CERT-1") is None
+        assert index.find_signature(signature("CERT-1")) is None
+
+
+def test_duplicates_keep_the_last_row(tmp_path):
+    path = str(tmp_path / "dup.vidx")
+    rows = [{"certificate_number": "C-1", "status": "active", "expiry_date": ""},
+            {"certificate_number": "C-1", "status": "revoked", "expiry_date": "01.05.2027"}]
+    assert vi.build_index(rows, path) == (1, 1)
+    with vi.VerificationIndex(path) as index:
+        assert index.find_number("C-1") == ("C-1", "revoked", datetime.date(2027, 5, 1))
+
+
+def test_unknown_status_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        vi.build_index([{"certificate_number": "C-1", "status": "pending"}], str(tmp_path / "bad.vidx"))
+
+
+@pytest.mark.parametrize("days, expected", [(-1, vi.EXPIRED), (0, vi.EXPIRED), (1, vi.VALID)])
+def test_expiry_boundary(days, expected):
+    # Certificate::isExpired(): now() > expiry_date (midnight), so the expiry day itself is expired
+    assert vi.classify(("C-1", "active", TODAY + datetime.timedelta(days=days)), TODAY) == expected
+
+
+@pytest.mark.parametrize("record, expected", [
+    (None, vi.NOT_FOUND),
+    (("C-1", "active", None), vi.VALID),
+    (("C-1", "revoked", None), vi.REVOKED),
+    (("C-1", "revoked", datetime.date(2000, 1, 1)), vi.REVOKED),
+    (("C-1", "expired", datetime.date(2100, 1, 1)), vi.EXPIRED),
+])
+def test_classify_status(record, expected):
+    assert vi.classify(record, TODAY) == expected
+
+
+def test_export_formats(rows, tmp_path):
+    sample = rows[:50]
+    tsv = tmp_path / "export.tsv"
+    with open(tsv, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=list(sample[0]), delimiter="\t")
+        writer.writeheader()
+        writer.writerows(sample)
+    (tmp_path / "export.json").write_text(json.dumps(sample, ensure_ascii=False), encoding="utf-8")
+    (tmp_path / "export.jsonl").write_text("".join(json.dumps(row, ensure_ascii=False) + "\n" for row in sample),
+                                           encoding="utf-8")
+    for name in ("export.tsv", "export.json", "export.jsonl"):
+        assert list(vi.read_export(str(tmp_path / name))) == sample
+
+
+def test_verify_csv(rows, index_path, tmp_path):
+    by_number = {row["certificate_number"]: row for row in rows}
+    active = next(row for row in rows if row["status"] == "active" and row["expiry_date"] == ""
+                  and row["digital_signature"] != "NULL")
+    expiring = next(row for row in rows if row["status"] == "active" and row["expiry_date"]
+                    and row["digital_signature"] != "NULL")
+    as_of = datetime.date.fromisoformat(expiring["expiry_date"])
+    revoked = next(row for row in rows if row["status"] == "revoked")
+    source = tmp_path / "partner.csv"
+    source.write_text("name;number\n"
+                      f"A;{active['certificate_number']}\n"
+                      f"B;{expiring['digital_signature']}\n"
+                      f"C;{revoked['certificate_number']}\n"
+                      "D;NOPE-1\n"
+                      "E;\n", encoding="utf-8")
+    destination = tmp_path / "partner.verified.csv"
+    with vi.VerificationIndex(index_path) as index:
+        counts = vi.verify_csv(index, str(source), str(destination), column="number", today=as_of)
+    assert counts == {vi.VALID: 1, vi.EXPIRED: 1, vi.REVOKED: 1, vi.NOT_FOUND: 2}
+    with open(destination, encoding="utf-8", newline="") as f:
+        output = list(csv.reader(f, delimiter=";"))
+    assert output[0] == ["name", "number", "verification_status", "certificate_number", "expiry_date"]
+    assert output[2] == ["B", expiring["digital_signature"], vi.EXPIRED, expiring["certificate_number"],
+                         expiring["expiry_date"]]
+    assert [line[2] for line in output[1:]] == [vi.VALID, vi.EXPIRED, vi.REVOKED, vi.NOT_FOUND, vi.NOT_FOUND]
+    assert by_number[output[1][3]] is active
@@ -0,0 +1,160 @@
+"""
+Stage-level tracing for the Python tooling scripts.
+
+    from tooling_trace import tracer
+
+    with tracer.span("decode", file=name):
+        ...
+
+Tracing is off by default; span() then returns a shared no-op context
+manager, so an instrumented stage costs one method call. It is turned on
+by a script's --trace PATH flag (tracer.enable() + tracer.finish(path))
+or for any script by the TOOLING_TRACE=PATH environment variable.
+
+finish() writes the spans in Chrome trace-event format (open in
+chrome://tracing or https://ui.perfetto.dev) and prints a summary table
+with total and self time (time not spent in nested spans) per stage.
+
+Spans recorded in worker processes are sent back with the results:
+the worker returns tracer.drain(), the parent calls tracer.merge().
+"""
+
+import atexit
+import json
+import os
+import sys
+import threading
+import time
+from collections import defaultdict
+
+ENV_VARIABLE = "TOOLING_TRACE"
+
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    __slots__ = ("tracer", "name", "args", "start", "children")
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.tracer._stack().append(self)
+        self.children = 0
+        self.start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter_ns()
+        stack = self.tracer._stack()
+        stack.pop()
+        duration = end - self.start
+        if stack:
+            stack[-1].children += duration
+        # list.append is atomic, spans may finish on several threads at once
+        self.tracer.events.append((self.name, self.start, duration, duration - self.children,
+                                   os.getpid(), threading.get_ident(), self.args))
+        return False
+
+
+class Tracer:
+    def __init__(self):
+        self.enabled = False
+        self.finished = False
+        self.events = []
+        self._local = threading.local()
+
+    def _stack(self):
+        try:
+            return self._local.stack
+        except AttributeError:
+            self._local.stack = []
+            return self._local.stack
+
+    def enable(self):
+        self.enabled = True
+
+    def span(self, name, **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def drain(self):
+        """Spans recorded by this process so far (removed from the tracer)."""
+        pid = os.getpid()
+        # A forked worker starts with a copy of the parent's spans, drop those
+        events = [event for event in self.events if event[4] == pid]
+        self.events = []
+        return events
+
+    def merge(self, events):
+        if events:
+            self.events.extend(events)
+
+    def summary(self):
+        """[(name, count, total_ns, self_ns, max_ns)] sorted by self time."""
+        stats = defaultdict(lambda: [0, 0, 0, 0])
+        for name, _start, duration, self_time, _pid, _tid, _args in self.events:
+            entry = stats[name]
+            entry[0] += 1
+            entry[1] += duration
+            entry[2] += self_time
+            entry[3] = max(entry[3], duration)
+        rows = [(name, *values) for name, values in stats.items()]
+        return sorted(rows, key=lambda row: row[3], reverse=True)
+
+    def format_summary(self):
+        rows = self.summary()
+        if not rows:
+            return ["(no spans recorded)"]
+        all_self = sum(row[3] for row in rows) or 1
+        width = max(20, max(len(row[0]) for row in rows))
+        lines = [f"{'stage':<{width}} {'calls':>7} {'total ms':>10} {'self ms':>10} {'self %':>7} {'max ms':>9}"]
+        for name, count, total, self_time, longest in rows:
+            lines.append(f"{name:<{width}} {count:>7} {total / 1e6:>10.2f} {self_time / 1e6:>10.2f} "
+                         f"{self_time / all_self * 100:>6.1f}% {longest / 1e6:>9.2f}")
+        return lines
+
+    def chrome_trace(self):
+        """Trace-event JSON object: one complete ("X") event per span, times in µs."""
+        events = [{"name": name, "cat": "tooling", "ph": "X", "ts": start / 1000, "dur": duration / 1000,
+                   "pid": pid, "tid": tid, "args": args}
+                  for name, start, duration, _self, pid, tid, args in self.events]
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_chrome_trace(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.chrome_trace(), f, default=str)
+
+    def finish(self, path, out=sys.stderr):
+        """Write the Chrome trace to `path` and print the summary table."""
+        self.write_chrome_trace(path)
+        self.finished = True
+        print("\n".join(self.format_summary()), file=out)
+        print(f"✓ {len(self.events)} spans written to {path}", file=out)
+
+
+tracer = Tracer()
+
+if os.environ.get(ENV_VARIABLE):
+    tracer.enable()
+
+    def _finish_from_environment(path=os.environ[ENV_VARIABLE], pid=os.getpid()):
+        # Only the process that enabled tracing writes; workers hand their spans back
+        if os.getpid() == pid and tracer.events and not tracer.finished:
+            tracer.finish(path)
+
+    atexit.register(_finish_from_environment)
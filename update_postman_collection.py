@@ -4,7 +4,17 @@ Script to update Postman collection with all missing endpoints
 and remove endpoints that don't exist in the codebase.
 """
 
+import argparse
 import json
+import os
+import sys
+
+from postman_tools.builder import CollectionBuilder, FragmentCache, dump_collection, iter_requests
+from postman_tools.dedupe import NOAUTH, dedupe_collection, size_report
+from postman_tools.registry import SectionRegistry
+from postman_tools.routes import RouteTrie, format_report, load_routes, validate
+from postman_tools.streaming import iter_members
+from tooling_trace import tracer
 
 def create_request(name, method, path, auth=True, body=None, description="", query_params=None):
     """Helper function to create a request object"""
@@ -45,26 +55,25 @@ def create_request(name, method, path, auth=True, body=None, description="", que
     
     return request
 
-# Read original collection
-with open('Agrar_Portal_API.postman_collection.json', 'r', encoding='utf-8-sig') as f:
-    original = json.load(f)
-
-# Start building updated collection
-updated = {
-    "info": {
-        "_postman_id": "agrar-portal-api-collection-updated",
-        "name": "Agrar Portal API - Complete & Updated",
-        "description": "Complete and up-to-date API collection for Agrar Portal - All endpoints verified against codebase. Includes FAQ, Educational Content, Internship Programs, and all latest features. Last updated: January 2025.",
-        "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
-        "_exporter_id": "agrar-portal"
-    },
-    "item": [],
-    "variable": original.get("variable", []),
-    "event": original.get("event", [])
+SOURCE_PATH = 'Agrar_Portal_API.postman_collection.json'
+OUTPUT_PATH = 'Agrar_Portal_API_Complete_Updated.postman_collection.json'
+
+INFO = {
+    "_postman_id": "agrar-portal-api-collection-updated",
+    "name": "Agrar Portal API - Complete & Updated",
+    "description": "Complete and up-to-date API collection for Agrar Portal - All endpoints verified against codebase. Includes FAQ, Educational Content, Internship Programs, and all latest features. Last updated: January 2025.",
+    "schema": "https://schema.getpostman.com/json/collection/v2.1.0/collection.json",
+    "_exporter_id": "agrar-portal"
 }
 
+# Not in actual routes
+REMOVED_SECTIONS = ["Notifications", "Payments"]
+
+# Sections are only built when a run needs them (all, or the ones named with --only)
+sections = SectionRegistry()
+
 # Keep valid existing sections
-sections_to_keep = [
+sections.copy([
     "Authentication",
     "Development/Testing Authentication", 
     "2FA Management",
@@ -88,352 +97,338 @@ sections_to_keep = [
     "Meeting Registration",
     "Training Media Management",
     "Registration Management"
-]
-
-# Copy existing valid sections
-for item in original.get("item", []):
-    if item.get("name") in sections_to_keep:
-        updated["item"].append(item)
-
-print(f"✓ Copied {len(updated['item'])} existing sections")
+])
 
 # ADD NEW SECTIONS
 
 # 1. Dashboard & Statistics
-dashboard_section = {
-    "name": "Dashboard & Statistics",
-    "item": [
-        create_request("Get Dashboard", "GET", "/api/v1/dashboard", 
-                      description="Get main dashboard data for authenticated user"),
-        create_request("Get Training Statistics", "GET", "/api/v1/training-stats",
-                      description="Get training statistics and analytics"),
-        create_request("Get Webinar Statistics", "GET", "/api/v1/webinar-stats",
-                      description="Get webinar statistics"),
-        create_request("Get Webinar Analytics", "GET", "/api/v1/webinar-analytics",
-                      description="Get detailed webinar analytics")
-    ]
-}
-updated["item"].insert(3, dashboard_section)  # Insert after 2FA Management
+@sections.section("Dashboard & Statistics", after="2FA Management")
+def dashboard_section():
+    return {
+        "name": "Dashboard & Statistics",
+        "item": [
+            create_request("Get Dashboard", "GET", "/api/v1/dashboard", 
+                          description="Get main dashboard data for authenticated user"),
+            create_request("Get Training Statistics", "GET", "/api/v1/training-stats",
+                          description="Get training statistics and analytics"),
+            create_request("Get Webinar Statistics", "GET", "/api/v1/webinar-stats",
+                          description="Get webinar statistics"),
+            create_request("Get Webinar Analytics", "GET", "/api/v1/webinar-analytics",
+                          description="Get detailed webinar analytics")
+        ]
+    }
 
 # 2. FAQ Management
-faq_section = {
-    "name": "FAQ Management",
-    "item": [
-        create_request("List FAQs", "GET", "/api/v1/faqs",
-                      query_params=[
-                          {"key": "category", "value": "", "description": "Filter by category"},
-                          {"key": "search", "value": "", "description": "Search in question/answer"},
-                          {"key": "per_page", "value": "20"}
-                      ]),
-        create_request("Get FAQ Categories", "GET", "/api/v1/faqs/categories"),
-        create_request("Get FAQ Statistics", "GET", "/api/v1/faqs/stats",
-                      description="Admin only - Get FAQ statistics"),
-        create_request("Create FAQ", "POST", "/api/v1/faqs",
-                      body={
-                          "question": "How to register for a training?",
-                          "answer": "Navigate to trainings page and click register button",
-                          "category": "Registration",
-                          "is_active": True,
-                          "sort_order": 1
-                      },
-                      description="Admin only - Create new FAQ"),
-        create_request("Get FAQ Details", "GET", "/api/v1/faqs/1"),
-        create_request("Update FAQ", "PUT", "/api/v1/faqs/1",
-                      body={
-                          "question": "Updated question",
-                          "answer": "Updated answer",
-                          "is_active": True
-                      },
-                      description="Admin only - Update FAQ"),
-        create_request("Delete FAQ", "DELETE", "/api/v1/faqs/1",
-                      description="Admin only - Delete FAQ"),
-        create_request("Mark FAQ as Helpful", "POST", "/api/v1/faqs/1/helpful",
-                      description="Mark an FAQ as helpful")
-    ]
-}
-updated["item"].append(faq_section)
+@sections.section("FAQ Management")
+def faq_section():
+    return {
+        "name": "FAQ Management",
+        "item": [
+            create_request("List FAQs", "GET", "/api/v1/faqs",
+                          query_params=[
+                              {"key": "category", "value": "", "description": "Filter by category"},
+                              {"key": "search", "value": "", "description": "Search in question/answer"},
+                              {"key": "per_page", "value": "20"}
+                          ]),
+            create_request("Get FAQ Categories", "GET", "/api/v1/faqs/categories"),
+            create_request("Get FAQ Statistics", "GET", "/api/v1/faqs/stats",
+                          description="Admin only - Get FAQ statistics"),
+            create_request("Create FAQ", "POST", "/api/v1/faqs",
+                          body={
+                              "question": "How to register for a training?",
+                              "answer": "Navigate to trainings page and click register button",
+                              "category": "Registration",
+                              "is_active": True,
+                              "sort_order": 1
+                          },
+                          description="Admin only - Create new FAQ"),
+            create_request("Get FAQ Details", "GET", "/api/v1/faqs/1"),
+            create_request("Update FAQ", "PUT", "/api/v1/faqs/1",
+                          body={
+                              "question": "Updated question",
+                              "answer": "Updated answer",
+                              "is_active": True
+                          },
+                          description="Admin only - Update FAQ"),
+            create_request("Delete FAQ", "DELETE", "/api/v1/faqs/1",
+                          description="Admin only - Delete FAQ"),
+            create_request("Mark FAQ as Helpful", "POST", "/api/v1/faqs/1/helpful",
+                          description="Mark an FAQ as helpful")
+        ]
+    }
 
 # 3. Educational Content
-education_section = {
-    "name": "Educational Content (Maarifləndirmə)",
-    "item": [
-        create_request("Get Education Statistics", "GET", "/api/v1/education/stats",
-                      description="Get educational content statistics"),
-        create_request("List Articles", "GET", "/api/v1/education/articles",
-                      description="List all articles"),
-        create_request("List Telimats", "GET", "/api/v1/education/telimats",
-                      description="List all educational materials (telimats)"),
-        create_request("List Educational Content", "GET", "/api/v1/education",
-                      query_params=[
-                          {"key": "type", "value": "", "description": "Filter by type: article, telimat"},
-                          {"key": "search", "value": "", "description": "Search in title/content"},
-                          {"key": "category", "value": "", "description": "Filter by category"},
-                          {"key": "per_page", "value": "20"}
-                      ]),
-        create_request("Create Educational Content", "POST", "/api/v1/education",
-                      body={
-                          "title": "Modern Farming Techniques",
-                          "content": "Detailed content about modern farming...",
-                          "type": "article",
-                          "category": "Agriculture",
-                          "is_published": True,
-                          "author_id": 1
-                      },
-                      description="Admin/Trainer only - Create educational content"),
-        create_request("Get Content Details", "GET", "/api/v1/education/1"),
-        create_request("Update Educational Content", "PUT", "/api/v1/education/1",
-                      body={
-                          "title": "Updated title",
-                          "content": "Updated content",
-                          "is_published": True
-                      },
-                      description="Admin/Trainer only - Update content"),
-        create_request("Delete Educational Content", "DELETE", "/api/v1/education/1",
-                      description="Admin/Trainer only - Delete content")
-    ]
-}
-updated["item"].append(education_section)
+@sections.section("Educational Content (Maarifləndirmə)")
+def education_section():
+    return {
+        "name": "Educational Content (Maarifləndirmə)",
+        "item": [
+            create_request("Get Education Statistics", "GET", "/api/v1/education/stats",
+                          description="Get educational content statistics"),
+            create_request("List Articles", "GET", "/api/v1/education/articles",
+                          description="List all articles"),
+            create_request("List Telimats", "GET", "/api/v1/education/telimats",
+                          description="List all educational materials (telimats)"),
+            create_request("List Educational Content", "GET", "/api/v1/education",
+                          query_params=[
+                              {"key": "type", "value": "", "description": "Filter by type: article, telimat"},
+                              {"key": "search", "value": "", "description": "Search in title/content"},
+                              {"key": "category", "value": "", "description": "Filter by category"},
+                              {"key": "per_page", "value": "20"}
+                          ]),
+            create_request("Create Educational Content", "POST", "/api/v1/education",
+                          body={
+                              "title": "Modern Farming Techniques",
+                              "content": "Detailed content about modern farming...",
+                              "type": "article",
+                              "category": "Agriculture",
+                              "is_published": True,
+                              "author_id": 1
+                          },
+                          description="Admin/Trainer only - Create educational content"),
+            create_request("Get Content Details", "GET", "/api/v1/education/1"),
+            create_request("Update Educational Content", "PUT", "/api/v1/education/1",
+                          body={
+                              "title": "Updated title",
+                              "content": "Updated content",
+                              "is_published": True
+                          },
+                          description="Admin/Trainer only - Update content"),
+            create_request("Delete Educational Content", "DELETE", "/api/v1/education/1",
+                          description="Admin/Trainer only - Delete content")
+        ]
+    }
 
 # 4. Internship Programs
-internship_section = {
-    "name": "Internship Programs (Staj Proqramları)",
-    "item": [
-        create_request("List Internship Programs", "GET", "/api/v1/internship-programs",
-                      auth=False,
-                      query_params=[
-                          {"key": "category", "value": "", "description": "Filter by category"},
-                          {"key": "status", "value": "active", "description": "Filter by status"},
-                          {"key": "search", "value": "", "description": "Search in title/description"},
-                          {"key": "per_page", "value": "20"}
-                      ],
-                      description="Public endpoint - optional authentication"),
-        create_request("Get Featured Programs", "GET", "/api/v1/internship-programs/featured",
-                      auth=False,
-                      description="Get featured internship programs"),
-        create_request("Get Program Categories", "GET", "/api/v1/internship-programs/categories",
-                      auth=False,
-                      description="Get available program categories"),
-        create_request("Get Program Trainers", "GET", "/api/v1/internship-programs/trainers",
-                      auth=False,
-                      description="Get trainers for programs"),
-        create_request("Get Program Details", "GET", "/api/v1/internship-programs/1",
-                      auth=False,
-                      description="Get detailed program information"),
-        create_request("Create Internship Program", "POST", "/api/v1/internship-programs",
-                      body={
-                          "title": "Summer Agricultural Internship",
-                          "description": "Hands-on farming experience",
-                          "category": "Practical Training",
-                          "trainer_id": 2,
-                          "start_date": "2025-06-01",
-                          "end_date": "2025-08-31",
-                          "location": "Agricultural Farm, Region A",
-                          "max_participants": 20,
-                          "requirements": "Basic agricultural knowledge required",
-                          "is_active": True
-                      },
-                      description="Admin/Trainer only - Create program"),
-        create_request("Update Internship Program", "PUT", "/api/v1/internship-programs/1",
-                      body={
-                          "title": "Updated program title",
-                          "max_participants": 25
-                      },
-                      description="Admin/Trainer only - Update program"),
-        create_request("Delete Internship Program", "DELETE", "/api/v1/internship-programs/1",
-                      description="Admin/Trainer only - Delete program"),
-        create_request("Apply for Internship", "POST", "/api/v1/internship-programs/1/apply",
-                      body={
-                          "motivation_letter": "I am very interested in this program...",
-                          "cv_file": "base64_encoded_cv_or_file_upload",
-                          "additional_info": "Previous farming experience"
-                      },
-                      description="Apply for an internship program"),
-        create_request("Get My Applications", "GET", "/api/v1/my-internship-applications",
-                      description="Get user's internship applications"),
-        create_request("Get Application Details", "GET", "/api/v1/internship-applications/1",
-                      description="Get specific application details"),
-        create_request("Cancel Application", "DELETE", "/api/v1/internship-applications/1",
-                      description="Cancel/delete an application"),
-        create_request("Download Application CV", "GET", "/api/v1/internship-applications/1/download-cv",
-                      description="Download CV from application"),
-        create_request("Get Program Applications (Admin)", "GET", "/api/v1/internship-programs/1/applications",
-                      description="Admin only - Get all applications for a program"),
-        create_request("Get Enrolled Users (Admin)", "GET", "/api/v1/internship-programs/1/enrolled-users",
-                      description="Admin only - Get enrolled users"),
-        create_request("Get Program Statistics (Admin)", "GET", "/api/v1/internship-programs/1/stats",
-                      description="Admin only - Get program statistics"),
-        create_request("List All Applications (Admin)", "GET", "/api/v1/admin/internship-applications",
-                      query_params=[
-                          {"key": "status", "value": "", "description": "Filter by status"},
-                          {"key": "program_id", "value": "", "description": "Filter by program"},
-                          {"key": "per_page", "value": "20"}
-                      ],
-                      description="Admin only - List all applications"),
-        create_request("Update Application Status (Admin)", "PUT", "/api/v1/admin/internship-applications/1/status",
-                      body={
-                          "status": "approved",
-                          "admin_notes": "Candidate meets all requirements"
-                      },
-                      description="Admin only - Update application status")
-    ]
-}
-updated["item"].append(internship_section)
+@sections.section("Internship Programs (Staj Proqramları)")
+def internship_section():
+    return {
+        "name": "Internship Programs (Staj Proqramları)",
+        "item": [
+            create_request("List Internship Programs", "GET", "/api/v1/internship-programs",
+                          auth=False,
+                          query_params=[
+                              {"key": "category", "value": "", "description": "Filter by category"},
+                              {"key": "status", "value": "active", "description": "Filter by status"},
+                              {"key": "search", "value": "", "description": "Search in title/description"},
+                              {"key": "per_page", "value": "20"}
+                          ],
+                          description="Public endpoint - optional authentication"),
+            create_request("Get Featured Programs", "GET", "/api/v1/internship-programs/featured",
+                          auth=False,
+                          description="Get featured internship programs"),
+            create_request("Get Program Categories", "GET", "/api/v1/internship-programs/categories",
+                          auth=False,
+                          description="Get available program categories"),
+            create_request("Get Program Trainers", "GET", "/api/v1/internship-programs/trainers",
+                          auth=False,
+                          description="Get trainers for programs"),
+            create_request("Get Program Details", "GET", "/api/v1/internship-programs/1",
+                          auth=False,
+                          description="Get detailed program information"),
+            create_request("Create Internship Program", "POST", "/api/v1/internship-programs",
+                          body={
+                              "title": "Summer Agricultural Internship",
+                              "description": "Hands-on farming experience",
+                              "category": "Practical Training",
+                              "trainer_id": 2,
+                              "start_date": "2025-06-01",
+                              "end_date": "2025-08-31",
+                              "location": "Agricultural Farm, Region A",
+                              "max_participants": 20,
+                              "requirements": "Basic agricultural knowledge required",
+                              "is_active": True
+                          },
+                          description="Admin/Trainer only - Create program"),
+            create_request("Update Internship Program", "PUT", "/api/v1/internship-programs/1",
+                          body={
+                              "title": "Updated program title",
+                              "max_participants": 25
+                          },
+                          description="Admin/Trainer only - Update program"),
+            create_request("Delete Internship Program", "DELETE", "/api/v1/internship-programs/1",
+                          description="Admin/Trainer only - Delete program"),
+            create_request("Apply for Internship", "POST", "/api/v1/internship-programs/1/apply",
+                          body={
+                              "motivation_letter": "I am very interested in this program...",
+                              "cv_file": "base64_encoded_cv_or_file_upload",
+                              "additional_info": "Previous farming experience"
+                          },
+                          description="Apply for an internship program"),
+            create_request("Get My Applications", "GET", "/api/v1/my-internship-applications",
+                          description="Get user's internship applications"),
+            create_request("Get Application Details", "GET", "/api/v1/internship-applications/1",
+                          description="Get specific application details"),
+            create_request("Cancel Application", "DELETE", "/api/v1/internship-applications/1",
+                          description="Cancel/delete an application"),
+            create_request("Download Application CV", "GET", "/api/v1/internship-applications/1/download-cv",
+                          description="Download CV from application"),
+            create_request("Get Program Applications (Admin)", "GET", "/api/v1/internship-programs/1/applications",
+                          description="Admin only - Get all applications for a program"),
+            create_request("Get Enrolled Users (Admin)", "GET", "/api/v1/internship-programs/1/enrolled-users",
+                          description="Admin only - Get enrolled users"),
+            create_request("Get Program Statistics (Admin)", "GET", "/api/v1/internship-programs/1/stats",
+                          description="Admin only - Get program statistics"),
+            create_request("List All Applications (Admin)", "GET", "/api/v1/admin/internship-applications",
+                          query_params=[
+                              {"key": "status", "value": "", "description": "Filter by status"},
+                              {"key": "program_id", "value": "", "description": "Filter by program"},
+                              {"key": "per_page", "value": "20"}
+                          ],
+                          description="Admin only - List all applications"),
+            create_request("Update Application Status (Admin)", "PUT", "/api/v1/admin/internship-applications/1/status",
+                          body={
+                              "status": "approved",
+                              "admin_notes": "Candidate meets all requirements"
+                          },
+                          description="Admin only - Update application status")
+        ]
+    }
 
 # 5. Additional Training Endpoints (add to existing or new section)
-training_enhancements = {
-    "name": "Training - Public & Enhanced Endpoints",
-    "item": [
-        create_request("List Public Trainings", "GET", "/api/v1/trainings/public",
-                      auth=False,
-                      query_params=[
-                          {"key": "page", "value": "1"},
-                          {"key": "per_page", "value": "20"},
-                          {"key": "category", "value": ""},
-                          {"key": "search", "value": ""}
-                      ],
-                      description="Public endpoint - list all trainings. Optional auth for user-specific data."),
-        create_request("List Online Trainings", "GET", "/api/v1/trainings/online",
-                      auth=False,
-                      description="Public endpoint - list online trainings"),
-        create_request("List Offline Trainings", "GET", "/api/v1/trainings/offline",
-                      auth=False,
-                      description="Public endpoint - list offline trainings"),
-        create_request("Get Offline Training Detail", "GET", "/api/v1/trainings/offline/1",
-                      auth=False,
-                      description="Get detailed offline training information"),
-        create_request("Get Training Detailed View", "GET", "/api/v1/trainings/1/detailed",
-                      auth=False,
-                      description="Get comprehensive training details. Optional auth."),
-        create_request("Get Trainings Dropdown", "GET", "/api/v1/trainings/dropdown",
-                      description="Admin/Trainer - Get trainings for dropdown selection"),
-        create_request("List Future Trainings", "GET", "/api/v1/trainings/future",
-                      description="List upcoming future trainings"),
-        create_request("List Ongoing Trainings", "GET", "/api/v1/trainings/ongoing",
-                      description="List currently ongoing trainings"),
-        create_request("Get All Trainings (No Pagination)", "GET", "/api/v1/trainings/all",
-                      description="Get all trainings without pagination"),
-        create_request("Mark Training Completed", "POST", "/api/v1/trainings/1/complete",
-                      description="Mark training as completed for authenticated user"),
-        create_request("Get Training Completion Status", "GET", "/api/v1/trainings/1/completion-status",
-                      description="Get user's completion status for a training")
-    ]
-}
-# Find and insert after Training Management
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Training Management":
-        updated["item"].insert(i + 1, training_enhancements)
-        break
+@sections.section("Training - Public & Enhanced Endpoints", after="Training Management")
+def training_enhancements():
+    return {
+        "name": "Training - Public & Enhanced Endpoints",
+        "item": [
+            create_request("List Public Trainings", "GET", "/api/v1/trainings/public",
+                          auth=False,
+                          query_params=[
+                              {"key": "page", "value": "1"},
+                              {"key": "per_page", "value": "20"},
+                              {"key": "category", "value": ""},
+                              {"key": "search", "value": ""}
+                          ],
+                          description="Public endpoint - list all trainings. Optional auth for user-specific data."),
+            create_request("List Online Trainings", "GET", "/api/v1/trainings/online",
+                          auth=False,
+                          description="Public endpoint - list online trainings"),
+            create_request("List Offline Trainings", "GET", "/api/v1/trainings/offline",
+                          auth=False,
+                          description="Public endpoint - list offline trainings"),
+            create_request("Get Offline Training Detail", "GET", "/api/v1/trainings/offline/1",
+                          auth=False,
+                          description="Get detailed offline training information"),
+            create_request("Get Training Detailed View", "GET", "/api/v1/trainings/1/detailed",
+                          auth=False,
+                          description="Get comprehensive training details. Optional auth."),
+            create_request("Get Trainings Dropdown", "GET", "/api/v1/trainings/dropdown",
+                          description="Admin/Trainer - Get trainings for dropdown selection"),
+            create_request("List Future Trainings", "GET", "/api/v1/trainings/future",
+                          description="List upcoming future trainings"),
+            create_request("List Ongoing Trainings", "GET", "/api/v1/trainings/ongoing",
+                          description="List currently ongoing trainings"),
+            create_request("Get All Trainings (No Pagination)", "GET", "/api/v1/trainings/all",
+                          description="Get all trainings without pagination"),
+            create_request("Mark Training Completed", "POST", "/api/v1/trainings/1/complete",
+                          description="Mark training as completed for authenticated user"),
+            create_request("Get Training Completion Status", "GET", "/api/v1/trainings/1/completion-status",
+                          description="Get user's completion status for a training")
+        ]
+    }
 
 # 6. Lesson Notes Section
-lesson_notes = {
-    "name": "Lesson Notes",
-    "item": [
-        create_request("Add Lesson Notes", "POST", "/api/v1/lessons/1/notes",
-                      body={"notes": "Important points to remember..."},
-                      description="Add personal notes for a lesson"),
-        create_request("Get Lesson Notes", "GET", "/api/v1/lessons/1/notes",
-                      description="Get personal notes for a lesson"),
-        create_request("Update Lesson Notes", "PUT", "/api/v1/lessons/1/notes",
-                      body={"notes": "Updated notes..."},
-                      description="Update personal notes"),
-        create_request("Delete Lesson Notes", "DELETE", "/api/v1/lessons/1/notes",
-                      description="Delete personal notes")
-    ]
-}
-# Insert after Lesson Progress Tracking
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Lesson Progress Tracking":
-        updated["item"].insert(i + 1, lesson_notes)
-        break
+@sections.section("Lesson Notes", after="Lesson Progress Tracking")
+def lesson_notes():
+    return {
+        "name": "Lesson Notes",
+        "item": [
+            create_request("Add Lesson Notes", "POST", "/api/v1/lessons/1/notes",
+                          body={"notes": "Important points to remember..."},
+                          description="Add personal notes for a lesson"),
+            create_request("Get Lesson Notes", "GET", "/api/v1/lessons/1/notes",
+                          description="Get personal notes for a lesson"),
+            create_request("Update Lesson Notes", "PUT", "/api/v1/lessons/1/notes",
+                          body={"notes": "Updated notes..."},
+                          description="Update personal notes"),
+            create_request("Delete Lesson Notes", "DELETE", "/api/v1/lessons/1/notes",
+                          description="Delete personal notes")
+        ]
+    }
 
 # 7. Temporary Lesson Media
-temp_lesson_media = {
-    "name": "Temporary Lesson Media",
-    "item": [
-        {
-            "name": "Upload Temporary Media",
-            "request": {
-                "method": "POST",
-                "header": [
-                    {"key": "Authorization", "value": "Bearer {{auth_token}}"}
-                ],
-                "body": {
-                    "mode": "formdata",
-                    "formdata": [
-                        {"key": "file", "type": "file", "src": []},
-                        {"key": "type", "value": "image", "type": "text"}
-                    ]
+@sections.section("Temporary Lesson Media", after="Training Lesson Management")
+def temp_lesson_media():
+    return {
+        "name": "Temporary Lesson Media",
+        "item": [
+            {
+                "name": "Upload Temporary Media",
+                "request": {
+                    "method": "POST",
+                    "header": [
+                        {"key": "Authorization", "value": "Bearer {{auth_token}}"}
+                    ],
+                    "body": {
+                        "mode": "formdata",
+                        "formdata": [
+                            {"key": "file", "type": "file", "src": []},
+                            {"key": "type", "value": "image", "type": "text"}
+                        ]
+                    },
+                    "url": {
+                        "raw": "{{base_url}}/api/v1/lessons/upload-temp-media",
+                        "host": ["{{base_url}}"],
+                        "path": ["api", "v1", "lessons", "upload-temp-media"]
+                    }
                 },
-                "url": {
-                    "raw": "{{base_url}}/api/v1/lessons/upload-temp-media",
-                    "host": ["{{base_url}}"],
-                    "path": ["api", "v1", "lessons", "upload-temp-media"]
-                }
+                "description": "Upload temporary media during lesson creation"
             },
-            "description": "Upload temporary media during lesson creation"
-        },
-        create_request("Delete Temporary Media", "DELETE", "/api/v1/lessons/delete-temp-media",
-                      body={"file_path": "temp/media/abc123.jpg"},
-                      description="Delete temporary media file")
-    ]
-}
-# Insert after Lesson Management
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Training Lesson Management":
-        updated["item"].insert(i + 1, temp_lesson_media)
-        break
+            create_request("Delete Temporary Media", "DELETE", "/api/v1/lessons/delete-temp-media",
+                          body={"file_path": "temp/media/abc123.jpg"},
+                          description="Delete temporary media file")
+        ]
+    }
 
 # 8. Enhanced Exam Endpoints
-exam_enhancements = {
-    "name": "Exam - Additional Endpoints",
-    "item": [
-        create_request("Get Exam Statistics", "GET", "/api/v1/exams/stats",
-                      description="Admin only - Get exam statistics"),
-        create_request("Get Comprehensive Exam Stats", "GET", "/api/v1/exams/comprehensive-stats",
-                      description="Admin only - Get comprehensive exam statistics"),
-        create_request("Get Detailed Exam List", "GET", "/api/v1/exams/detailed-list",
-                      description="Admin only - Get detailed list of all exams"),
-        create_request("Get Exam Form Data", "GET", "/api/v1/exams/form-data",
-                      description="Admin/Trainer - Get form data for creating exams"),
-        create_request("Get Public Exam View", "GET", "/api/v1/exams/1/public",
-                      description="Public view of exam information"),
-        create_request("Get Exam Result", "GET", "/api/v1/exams/1/result",
-                      description="Get user's exam result"),
-        create_request("Update Exam Status", "PUT", "/api/v1/exams/1/status",
-                      body={"status": "active"},
-                      description="Admin/Trainer - Update exam status")
-    ]
-}
-# Insert after Exam Management
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Exam Management (Admin Dashboard)":
-        updated["item"].insert(i + 1, exam_enhancements)
-        break
+@sections.section("Exam - Additional Endpoints", after="Exam Management (Admin Dashboard)")
+def exam_enhancements():
+    return {
+        "name": "Exam - Additional Endpoints",
+        "item": [
+            create_request("Get Exam Statistics", "GET", "/api/v1/exams/stats",
+                          description="Admin only - Get exam statistics"),
+            create_request("Get Comprehensive Exam Stats", "GET", "/api/v1/exams/comprehensive-stats",
+                          description="Admin only - Get comprehensive exam statistics"),
+            create_request("Get Detailed Exam List", "GET", "/api/v1/exams/detailed-list",
+                          description="Admin only - Get detailed list of all exams"),
+            create_request("Get Exam Form Data", "GET", "/api/v1/exams/form-data",
+                          description="Admin/Trainer - Get form data for creating exams"),
+            create_request("Get Public Exam View", "GET", "/api/v1/exams/1/public",
+                          description="Public view of exam information"),
+            create_request("Get Exam Result", "GET", "/api/v1/exams/1/result",
+                          description="Get user's exam result"),
+            create_request("Update Exam Status", "PUT", "/api/v1/exams/1/status",
+                          body={"status": "active"},
+                          description="Admin/Trainer - Update exam status")
+        ]
+    }
 
 # 9. Admin Exam Grading
-admin_exam_grading = {
-    "name": "Admin Exam Grading",
-    "item": [
-        create_request("Get Pending Reviews", "GET", "/api/v1/admin/exams/pending-reviews",
-                      description="Admin only - Get exams pending text question review"),
-        create_request("Get Exam for Grading", "GET", "/api/v1/admin/exams/1/for-grading",
-                      description="Admin only - Get exam submission for grading"),
-        create_request("Grade Text Questions", "POST", "/api/v1/admin/exams/1/grade-text-questions",
-                      body={
-                          "grades": [
-                              {"question_id": 1, "points_awarded": 15, "feedback": "Excellent answer"},
-                              {"question_id": 2, "points_awarded": 12, "feedback": "Good but incomplete"}
-                          ]
-                      },
-                      description="Admin only - Grade text questions")
-    ]
-}
-updated["item"].append(admin_exam_grading)
+@sections.section("Admin Exam Grading")
+def admin_exam_grading():
+    return {
+        "name": "Admin Exam Grading",
+        "item": [
+            create_request("Get Pending Reviews", "GET", "/api/v1/admin/exams/pending-reviews",
+                          description="Admin only - Get exams pending text question review"),
+            create_request("Get Exam for Grading", "GET", "/api/v1/admin/exams/1/for-grading",
+                          description="Admin only - Get exam submission for grading"),
+            create_request("Grade Text Questions", "POST", "/api/v1/admin/exams/1/grade-text-questions",
+                          body={
+                              "grades": [
+                                  {"question_id": 1, "points_awarded": 15, "feedback": "Excellent answer"},
+                                  {"question_id": 2, "points_awarded": 12, "feedback": "Good but incomplete"}
+                              ]
+                          },
+                          description="Admin only - Grade text questions")
+        ]
+    }
 
 # 10. Enhanced Certificate Endpoints
-certificate_enhancements = {
-    "name": "Certificates - Enhanced",
-    "item": [
+@sections.extends("Certificates")
+def certificate_enhancements():
+    return [
         create_request("Get My Certificates", "GET", "/api/v1/my/certificates",
                       description="Get all certificates for authenticated user"),
         {
@@ -470,36 +465,29 @@ certificate_enhancements = {
                       auth=False,
                       description="Public - Verify certificate by number")
     ]
-}
-# Find Certificates section and enhance it
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Certificates":
-        # Add new items to existing Certificates section
-        for new_item in certificate_enhancements["item"]:
-            item["item"].append(new_item)
-        break
 
 # 11. Public Certificate Verification
-public_certificates = {
-    "name": "Public Certificate Verification",
-    "item": [
-        create_request("View Certificate by Signature", "GET", "/certificates/verify/{signature}",
-                      auth=False,
-                      description="Public - View certificate by signature"),
-        create_request("Verify Certificate Page", "GET", "/certificates/verify-page/{signature}",
-                      auth=False,
-                      description="Public - Certificate verification page"),
-        create_request("Download Certificate PDF", "GET", "/certificates/download/{signature}",
-                      auth=False,
-                      description="Public - Download certificate PDF")
-    ]
-}
-updated["item"].append(public_certificates)
+@sections.section("Public Certificate Verification")
+def public_certificates():
+    return {
+        "name": "Public Certificate Verification",
+        "item": [
+            create_request("View Certificate by Signature", "GET", "/certificates/verify/{signature}",
+                          auth=False,
+                          description="Public - View certificate by signature"),
+            create_request("Verify Certificate Page", "GET", "/certificates/verify-page/{signature}",
+                          auth=False,
+                          description="Public - Certificate verification page"),
+            create_request("Download Certificate PDF", "GET", "/certificates/download/{signature}",
+                          auth=False,
+                          description="Public - Download certificate PDF")
+        ]
+    }
 
 # 12. Enhanced User Management
-user_enhancements = {
-    "name": "User Management - Enhanced",
-    "item": [
+@sections.extends("User Management")
+def user_enhancements():
+    return [
         create_request("Get User Statistics", "GET", "/api/v1/users/stats",
                       description="Admin only - Get user statistics"),
         create_request("Get Simple User List", "GET", "/api/v1/users/simple",
@@ -509,70 +497,53 @@ user_enhancements = {
         create_request("Get Categories from Users Endpoint", "GET", "/api/v1/categories",
                       description="Get categories list")
     ]
-}
-# Add to User Management section
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "User Management":
-        for new_item in user_enhancements["item"]:
-            item["item"].append(new_item)
-        break
 
 # 13. Profile Photo Management
-profile_photo = {
-    "name": "Profile Photo Management",
-    "item": [
-        {
-            "name": "Upload Profile Photo",
-            "request": {
-                "method": "POST",
-                "header": [
-                    {"key": "Authorization", "value": "Bearer {{auth_token}}"}
-                ],
-                "body": {
-                    "mode": "formdata",
-                    "formdata": [
-                        {"key": "photo", "type": "file", "src": []}
-                    ]
+@sections.section("Profile Photo Management", after="Profile Management")
+def profile_photo():
+    return {
+        "name": "Profile Photo Management",
+        "item": [
+            {
+                "name": "Upload Profile Photo",
+                "request": {
+                    "method": "POST",
+                    "header": [
+                        {"key": "Authorization", "value": "Bearer {{auth_token}}"}
+                    ],
+                    "body": {
+                        "mode": "formdata",
+                        "formdata": [
+                            {"key": "photo", "type": "file", "src": []}
+                        ]
+                    },
+                    "url": {
+                        "raw": "{{base_url}}/api/v1/profile/upload-photo",
+                        "host": ["{{base_url}}"],
+                        "path": ["api", "v1", "profile", "upload-photo"]
+                    }
                 },
-                "url": {
-                    "raw": "{{base_url}}/api/v1/profile/upload-photo",
-                    "host": ["{{base_url}}"],
-                    "path": ["api", "v1", "profile", "upload-photo"]
-                }
+                "description": "Upload profile photo"
             },
-            "description": "Upload profile photo"
-        },
-        create_request("Delete Profile Photo", "DELETE", "/api/v1/profile/delete-photo",
-                      description="Delete profile photo")
-    ]
-}
-# Insert after Profile Management
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Profile Management":
-        updated["item"].insert(i + 1, profile_photo)
-        break
+            create_request("Delete Profile Photo", "DELETE", "/api/v1/profile/delete-photo",
+                          description="Delete profile photo")
+        ]
+    }
 
 # 14. Enhanced Registration
-registration_enhancements = {
-    "name": "Registration - Enhanced",
-    "item": [
+@sections.extends("Registration Management")
+def registration_enhancements():
+    return [
         create_request("Cancel Training Registration", "DELETE", "/api/v1/trainings/1/cancel-registration",
                       description="Cancel training registration"),
         create_request("Get My Training Registrations", "GET", "/api/v1/my-training-registrations",
                       description="Get user's training registrations")
     ]
-}
-# Add to Registration Management section
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Registration Management":
-        for new_item in registration_enhancements["item"]:
-            item["item"].append(new_item)
-        break
 
 # 15. Forum Enhancements
-forum_enhancements = {
-    "name": "Forum - Stats & Voting",
-    "item": [
+@sections.extends("Forum")
+def forum_enhancements():
+    return [
         create_request("Get Forum Statistics", "GET", "/api/v1/forum/stats",
                       description="Get forum statistics"),
         create_request("Get Forum Cards", "GET", "/api/v1/forum/cards",
@@ -581,69 +552,175 @@ forum_enhancements = {
                       body={"vote_option": "option_1"},
                       description="Vote on a forum poll question")
     ]
-}
-# Add to Forum section
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Forum":
-        for new_item in forum_enhancements["item"]:
-            item["item"].append(new_item)
-        break
 
 # 16. Meeting Cards
-meeting_cards = {
-    "name": "Meeting Cards",
-    "item": [
-        create_request("Get Meeting Cards", "GET", "/api/v1/meetings/cards",
-                      description="Get meeting summary cards")
-    ]
-}
-# Insert before Google Meet Management
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Google Meet Management":
-        updated["item"].insert(i, meeting_cards)
-        break
+@sections.section("Meeting Cards", before="Google Meet Management")
+def meeting_cards():
+    return {
+        "name": "Meeting Cards",
+        "item": [
+            create_request("Get Meeting Cards", "GET", "/api/v1/meetings/cards",
+                          description="Get meeting summary cards")
+        ]
+    }
 
 # 17. Progress Management (enhance existing)
-progress_enhancements = [
-    create_request("Get Progress Details", "GET", "/api/v1/progress/1",
-                  description="Get specific progress details"),
-    create_request("Update Progress", "PUT", "/api/v1/progress/1",
-                  body={"status": "completed", "notes": "Finished module"},
-                  description="Update progress entry"),
-    create_request("Delete Progress", "DELETE", "/api/v1/progress/1",
-                  description="Delete progress entry")
-]
-for i, item in enumerate(updated["item"]):
-    if item.get("name") == "Progress Tracking":
-        for new_item in progress_enhancements:
-            item["item"].append(new_item)
-        break
-
-print(f"\n✓ Added new sections and enhancements")
-print(f"✓ Total sections in updated collection: {len(updated['item'])}")
-
-# Remove Notifications and Payments sections (not in actual routes)
-updated["item"] = [item for item in updated["item"] 
-                   if item.get("name") not in ["Notifications", "Payments"]]
-
-print(f"✓ Removed unused sections (Notifications, Payments)")
-print(f"✓ Final section count: {len(updated['item'])}")
-
-# Save updated collection
-with open('Agrar_Portal_API_Complete_Updated.postman_collection.json', 'w', encoding='utf-8') as f:
-    json.dump(updated, f, indent=2, ensure_ascii=False)
-
-print(f"\n✅ SUCCESS! Updated collection saved to: Agrar_Portal_API_Complete_Updated.postman_collection.json")
-print(f"\nSummary of changes:")
-print(f"  • Added FAQ Management (8 endpoints)")
-print(f"  • Added Educational Content module (8 endpoints)")
-print(f"  • Added Internship Programs module (18 endpoints)")
-print(f"  • Added Dashboard & Statistics (4 endpoints)")
-print(f"  • Added Lesson Notes (4 endpoints)")
-print(f"  • Added Temporary Lesson Media (2 endpoints)")
-print(f"  • Added Admin Exam Grading (3 endpoints)")
-print(f"  • Added Profile Photo Management (2 endpoints)")
-print(f"  • Enhanced existing sections with missing endpoints")
-print(f"  • Removed unused sections (Notifications, Payments)")
-print(f"\n  Total: ~80+ new endpoints added")
+@sections.extends("Progress Tracking")
+def progress_enhancements():
+    return [
+        create_request("Get Progress Details", "GET", "/api/v1/progress/1",
+                      description="Get specific progress details"),
+        create_request("Update Progress", "PUT", "/api/v1/progress/1",
+                      body={"status": "completed", "notes": "Finished module"},
+                      description="Update progress entry"),
+        create_request("Delete Progress", "DELETE", "/api/v1/progress/1",
+                      description="Delete progress entry")
+    ]
+
+
+def parsed_members(path, stage):
+    """iter_members with a trace span around the parsing of each member."""
+    members = iter_members(path)
+    while True:
+        with tracer.span(stage):
+            member = next(members, None)
+        if member is None:
+            return
+        yield member
+
+
+def load_output(path):
+    """
+    CollectionBuilder holding a previously generated collection. Top-level
+    members other than info/item/variable/event (the collection auth of a
+    --dedupe output) are carried over unchanged.
+    """
+    builder = CollectionBuilder(info=INFO)
+    for name, value in parsed_members(path, "parse output"):
+        if name == "item":
+            builder.append(value)
+        elif name == "info":
+            builder.info = value
+        elif name == "variable":
+            builder.variable = value
+        elif name == "event":
+            builder.event = value
+        else:
+            builder.extra[name] = value
+    return builder
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Update the Postman collection with all current endpoints.")
+    parser.add_argument("--only", action="append", metavar="SECTION",
+                        help="rebuild just this section (repeatable) and splice it into the existing output")
+    parser.add_argument("--list", action="store_true", help="list the section names and exit")
+    parser.add_argument("--compact", action="store_true",
+                        help="write minified JSON instead of indent=2 (smaller, faster to load)")
+    parser.add_argument("--dedupe", action="store_true",
+                        help="hoist auth to folders, drop derivable headers and URL fields (see postman_tools.dedupe)")
+    parser.add_argument("--check-routes", action="store_true",
+                        help="validate the generated endpoints against routes/api.php")
+    parser.add_argument("--trace", metavar="PATH",
+                        help="write stage timings as Chrome trace JSON (chrome://tracing, Perfetto)")
+    args = parser.parse_args(argv)
+    if args.trace:
+        tracer.enable()
+
+    if args.list:
+        print("\n".join(sections))
+        return 0
+    only = args.only
+    if only:
+        unknown = [name for name in only if name not in sections]
+        if unknown:
+            parser.error(f"unknown section(s): {', '.join(unknown)} (see --list)")
+        if not os.path.exists(OUTPUT_PATH):
+            print(f"⚠ {OUTPUT_PATH} not found, building all sections")
+            only = None
+
+    if only:
+        with tracer.span("load output"):
+            builder = load_output(OUTPUT_PATH)
+    else:
+        builder = CollectionBuilder(info=INFO)
+
+    # Read original collection one top-level section at a time, so only the
+    # sections that are kept stay in memory
+    original = {}
+
+    def original_sections():
+        for name, value in parsed_members(SOURCE_PATH, "parse source"):
+            if name == "item":
+                yield value
+            else:
+                original[name] = value
+
+    with tracer.span("build sections"):
+        built = sections.apply(builder, original_sections, only=only)
+    if only:
+        if "auth" in builder.extra:
+            # Rebuilt sections are in the full form (auth as headers, none on public
+            # requests); they must not inherit the collection auth of a --dedupe output
+            for name in built:
+                section = builder.section(name)
+                if section is not None:
+                    section.setdefault("auth", NOAUTH)
+        print(f"✓ Rebuilt {len(built)} section(s): {', '.join(built)}")
+    else:
+        builder.variable = original.get("variable", [])
+        builder.event = original.get("event", [])
+        print(f"\n✓ Added new sections and enhancements")
+        print(f"✓ Total sections in updated collection: {len(builder)}")
+
+    for name in REMOVED_SECTIONS:
+        builder.remove(name)
+    if not only:
+        print(f"✓ Removed unused sections ({', '.join(REMOVED_SECTIONS)})")
+        print(f"✓ Final section count: {len(builder)}")
+
+    # Save updated collection (only sections whose content changed are re-serialized)
+    updated = builder.build()
+    if args.dedupe:
+        full = json.loads(json.dumps(updated))
+        with tracer.span("dedupe"):
+            stats = dedupe_collection(updated)
+        print(f"✓ Deduplicated: {', '.join(f'{count} {name}' for name, count in sorted(stats.items()))}")
+        print("\n".join(size_report(full, updated)))
+    with tracer.span("dump", compact=args.compact):
+        count, serialized = dump_collection(updated, OUTPUT_PATH, FragmentCache(), compact=args.compact)
+    print(f"✓ Serialized {serialized} of {count} sections ({count - serialized} unchanged, from cache)")
+
+    if args.check_routes:
+        with tracer.span("compile routes"):
+            trie = RouteTrie(load_routes())
+        with tracer.span("route check"):
+            report = validate(trie, (("generated", folder, item) for folder, item in iter_requests(updated["item"])))
+        print("\n".join(format_report(report, limit=20)))
+        print(f"✓ Route check: {report['matched']} of {report['requests']} requests match routes/api.php "
+              f"({len(report['stale'])} stale, {len(report['unknown'])} unknown)")
+
+    if args.trace:
+        print()
+        tracer.finish(args.trace, out=sys.stdout)
+
+    print(f"\n✅ SUCCESS! Updated collection saved to: {OUTPUT_PATH}")
+    if only:
+        return 0
+    print(f"\nSummary of changes:")
+    print(f"  • Added FAQ Management (8 endpoints)")
+    print(f"  • Added Educational Content module (8 endpoints)")
+    print(f"  • Added Internship Programs module (18 endpoints)")
+    print(f"  • Added Dashboard & Statistics (4 endpoints)")
+    print(f"  • Added Lesson Notes (4 endpoints)")
+    print(f"  • Added Temporary Lesson Media (2 endpoints)")
+    print(f"  • Added Admin Exam Grading (3 endpoints)")
+    print(f"  • Added Profile Photo Management (2 endpoints)")
+    print(f"  • Enhanced existing sections with missing endpoints")
+    print(f"  • Removed unused sections (Notifications, Payments)")
+    print(f"\n  Total: ~80+ new endpoints added")
+    return 0
+
 
+if __name__ == "__main__":
+    raise SystemExit(main())